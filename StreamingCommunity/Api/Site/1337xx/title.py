@@ -17,11 +17,12 @@ from StreamingCommunity.Lib.Downloader import TOR_downloader
 
 
 # Logic class
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 
 
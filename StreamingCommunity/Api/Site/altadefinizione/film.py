@@ -20,7 +20,7 @@ from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance, Teleg
 
 
 # Logic class
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -29,6 +29,7 @@ from StreamingCommunity.Api.Player.supervideo import VideoSource
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 max_timeout = config_manager.get_int("REQUESTS", "timeout")
 
@@ -22,9 +22,10 @@ from StreamingCommunity.Api.Template.Util import (
     map_episode_title,
     validate_selection, 
     validate_episode_selection, 
-    display_episodes_list
+    display_episodes_list,
+    download_batch
 )
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -33,11 +34,30 @@ from StreamingCommunity.Api.Player.supervideo import VideoSource
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 msg = Prompt()
 console = Console()
 
 
-def download_video(index_season_selected: int, index_episode_selected: int, scrape_serie: GetSerieInfo) -> Tuple[str,bool]:
+def get_master_playlist(index_season_selected: int, index_episode_selected: int, scrape_serie: GetSerieInfo) -> str:
+    """
+    Resolves the master playlist of an episode, used by `download_batch` to prepare the next episodes.
+
+    Parameters:
+        - index_season_selected (int): Season number
+        - index_episode_selected (int): Episode index
+        - scrape_serie (GetSerieInfo): Scraper object with series information
+
+    Returns:
+        - str: Master playlist URL
+    """
+    obj_episode = scrape_serie.selectEpisode(index_season_selected, index_episode_selected-1)
+    video_source = VideoSource(obj_episode.url)
+    video_source.make_request(obj_episode.url)
+    return video_source.get_playlist()
+
+
+def download_video(index_season_selected: int, index_episode_selected: int, scrape_serie: GetSerieInfo, master_playlist: str = None) -> Tuple[str,bool]:
     """
     Downloads a specific episode from a specified season.
 
@@ -45,6 +65,7 @@ def download_video(index_season_selected: int, index_episode_selected: int, scra
         - index_season_selected (int): Season number
         - index_episode_selected (int): Episode index
         - scrape_serie (GetSerieInfo): Scraper object with series information
+        - master_playlist (str, optional): Playlist already resolved by `get_master_playlist`
 
     Returns:
         - str: Path to downloaded file
@@ -76,9 +97,10 @@ def download_video(index_season_selected: int, index_episode_selected: int, scra
     mp4_path = os.path.join(site_constant.SERIES_FOLDER, scrape_serie.series_name, f"S{index_season_selected}")
 
     # Retrieve scws and if available master playlist
-    video_source = VideoSource(obj_episode.url)
-    video_source.make_request(obj_episode.url)
-    master_playlist = video_source.get_playlist()
+    if master_playlist is None:
+        video_source = VideoSource(obj_episode.url)
+        video_source.make_request(obj_episode.url)
+        master_playlist = video_source.get_playlist()
 
     # Download the episode
     r_proc = HLS_Downloader(
@@ -107,12 +129,15 @@ def download_episode(index_season_selected: int, scrape_serie: GetSerieInfo, dow
     episodes = scrape_serie.getEpisodeSeasons(index_season_selected)
     episodes_count = len(episodes)
 
-    if download_all:
-        for i_episode in range(1, episodes_count + 1):
-            path, stopped = download_video(index_season_selected, i_episode, scrape_serie)
+    # Resolve the next episodes while one downloads
+    def resolve(i_episode):
+        return get_master_playlist(index_season_selected, i_episode, scrape_serie)
 
-            if stopped:
-                break
+    def download(i_episode, master_playlist):
+        return download_video(index_season_selected, i_episode, scrape_serie, master_playlist)
+
+    if download_all:
+        download_batch(list(range(1, episodes_count + 1)), resolve, download)
 
         console.print(f"\n[red]End downloaded [yellow]season: [red]{index_season_selected}.")
 
@@ -129,11 +154,7 @@ def download_episode(index_season_selected: int, scrape_serie: GetSerieInfo, dow
         list_episode_select = validate_episode_selection(list_episode_select, episodes_count)
 
         # Download selected episodes if not stopped
-        for i_episode in list_episode_select:
-            path, stopped = download_video(index_season_selected, i_episode, scrape_serie)
-
-            if stopped:
-                break
+        download_batch(list_episode_select, resolve, download)
 
 def download_series(select_season: MediaItem, season_selection: str = None, episode_selection: str = None) -> None:
     """
@@ -14,7 +14,13 @@ from StreamingCommunity.Util.config_json import config_manager
 from StreamingCommunity.Api.Player.Helper.Vixcloud.util import SeasonManager
 
 
+# Logic class
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
+from StreamingCommunity.Api.Template.Util import cached_response
+
+
 # Variable
+site_constant = get_site_constant(__name__)
 max_timeout = config_manager.get_int("REQUESTS", "timeout")
 
 
@@ -34,9 +40,31 @@ class GetSerieInfo:
         """
         Retrieve all episodes for all seasons
         """
-        response = httpx.get(self.url, headers=self.headers)
+        data = cached_response(site_constant.SITE_NAME, f"page/{self.url}", self._request_page, self._parse_page)
+        self.series_name = data['series_name']
+
+        for season_data in data['seasons']:
+
+            # Create a new season and get a reference to it
+            current_season = self.seasons_manager.add_season({
+                'number': season_data['number'], 
+                'name': season_data['name']
+            })
+            
+            # Add episodes to the season
+            if current_season:
+                for episode in season_data['episodes']:
+                    current_season.episodes.add(episode)
+
+    def _request_page(self, headers: dict) -> httpx.Response:
+        return httpx.get(self.url, headers={**self.headers, **headers})
+
+    def _parse_page(self, response: httpx.Response) -> dict:
+        """
+        Extract the series name and the episodes of every season from the series page.
+        """
         soup = BeautifulSoup(response.text, "html.parser")
-        self.series_name = soup.find("title").get_text(strip=True).split(" - ")[0]
+        seasons = []
 
         # Process all seasons
         season_items = soup.find_all('div', class_='accordion-item')
@@ -45,14 +73,8 @@ class GetSerieInfo:
             season_header = season_item.find('div', class_='accordion-header')
             if not season_header:
                 continue
-                
-            season_name = season_header.get_text(strip=True)
-            
-            # Create a new season and get a reference to it
-            current_season = self.seasons_manager.add_season({
-                'number': season_idx, 
-                'name': season_name
-            })
+
+            episodes = []
             
             # Find episodes for this season
             episode_divs = season_item.find_all('div', class_='down-episode')
@@ -61,17 +83,23 @@ class GetSerieInfo:
                 if not episode_name_tag:
                     continue
                     
-                episode_name = episode_name_tag.get_text(strip=True)
                 link_tag = ep_div.find('a', string=lambda text: text and "Supervideo" in text)
-                episode_url = link_tag['href'] if link_tag else None
-                
-                # Add episode to the season
-                if current_season:
-                    current_season.episodes.add({
-                        'number': ep_idx,
-                        'name': episode_name,
-                        'url': episode_url
-                    })
+                episodes.append({
+                    'number': ep_idx,
+                    'name': episode_name_tag.get_text(strip=True),
+                    'url': link_tag['href'] if link_tag else None
+                })
+
+            seasons.append({
+                'number': season_idx,
+                'name': season_header.get_text(strip=True),
+                'episodes': episodes
+            })
+
+        return {
+            'series_name': soup.find("title").get_text(strip=True).split(" - ")[0],
+            'seasons': seasons
+        }
 
 
     # ------------- FOR GUI -------------
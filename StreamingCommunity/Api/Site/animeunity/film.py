@@ -7,7 +7,7 @@ from rich.console import Console
 # Logic class
 from .serie import download_episode
 from .util.ScrapeSerie import ScrapeSerieAnime
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -16,6 +16,7 @@ from StreamingCommunity.Api.Player.vixcloud import VideoSourceAnime
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 
 
@@ -18,7 +18,7 @@ from StreamingCommunity.TelegramHelp.telegram_bot import TelegramSession, get_bo
 
 # Logic class
 from .util.ScrapeSerie import ScrapeSerieAnime
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Util import manage_selection, dynamic_format_number
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
@@ -28,6 +28,7 @@ from StreamingCommunity.Api.Player.vixcloud import VideoSourceAnime
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 msg = Prompt()
 KILL_HANDLER = bool(False)
@@ -48,6 +49,10 @@ def download_episode(index_select: int, scrape_serie: ScrapeSerieAnime, video_so
 
     # Get episode information
     obj_episode = scrape_serie.selectEpisode(1, index_select)
+    if obj_episode is None:
+        console.print(f"[red]Episode {index_select + 1} is not available, skipping it")
+        return None, False
+
     console.print(f"[bold yellow]Download:[/bold yellow] [red]{site_constant.SITE_NAME}[/red] ([cyan]E{obj_episode.number}[/cyan]) \n")
 
     if site_constant.TELEGRAM_BOT:
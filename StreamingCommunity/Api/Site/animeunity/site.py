@@ -17,11 +17,13 @@ from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance
 
 
 # Logic class
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaManager
+from StreamingCommunity.Api.Template.Util import cached_title_search
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 media_search_manager = MediaManager()
 table_show_manager = TVShowManager()
@@ -77,6 +79,7 @@ def get_real_title(record):
         return record['title_it']
 
 
+@cached_title_search(media_search_manager, console)
 def title_search(query: str) -> int:
     """
     Function to perform an anime search using both APIs and combine results.
@@ -91,7 +94,6 @@ def title_search(query: str) -> int:
         bot = get_bot_instance()
     
     media_search_manager.clear()
-    table_show_manager.clear()
     seen_titles = set()
     choices = [] if site_constant.TELEGRAM_BOT else None
 
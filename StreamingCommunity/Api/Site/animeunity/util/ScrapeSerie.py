@@ -1,6 +1,9 @@
 # 01.03.24
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Tuple
 
 
 # External libraries
@@ -13,9 +16,17 @@ from StreamingCommunity.Util.config_json import config_manager
 from StreamingCommunity.Api.Player.Helper.Vixcloud.util import EpisodeManager, Episode
 
 
+# Logic class
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
+from StreamingCommunity.Api.Template.Util import get_cached_value, store_value
+
+
 # Variable
+site_constant = get_site_constant(__name__)
 max_timeout = config_manager.get_int("REQUESTS", "timeout")
-
+RANGE_SIZE = 120
+MAX_RANGE_WORKERS = 4
+EPISODE_FIELDS = ('id', 'number', 'name', 'duration', 'url')
 
 
 class ScrapeSerieAnime:
@@ -29,7 +40,9 @@ class ScrapeSerieAnime:
         self.is_series = False
         self.headers = {'user-agent': get_userAgent()}
         self.url = url
-        self.episodes_cache = None
+        self.episodes_count = None
+        self.episode_ranges: Optional[List[Optional[List[Tuple]]]] = None
+        self.range_ready: List[threading.Event] = []
 
     def setup(self, version: str = None, media_id: int = None, series_name: str = None):
         self.version = version
@@ -46,65 +59,117 @@ class ScrapeSerieAnime:
         This includes partial episodes (like episode 6.5).
         
         Returns:
-            int: Total episode count including partial episodes
+            int: Total episode count including partial episodes, as soon as it is known
         """
-        if self.episodes_cache is None:
+        if self.episode_ranges is None:
             self._fetch_all_episodes()
             
-        if self.episodes_cache:
-            return len(self.episodes_cache)
+        if self.episodes_count:
+            return self.episodes_count
         return None
     
     def _fetch_all_episodes(self):
         """
-        Fetch all episodes data at once and cache it
+        Read the episode count, then fetch the ranges of 120 episodes concurrently over one client.
+        The count is available at once, each range as soon as it arrives, a range that fails stays None.
         """
+        records = get_cached_value(site_constant.SITE_NAME, f"episode_records/{self.media_id}")
+        if records is not None:
+            self._set_ranges([[tuple(record) for record in records]])
+            self.range_ready[0].set()
+            self.episodes_count = len(records)
+            return
+
+        client = httpx.Client(
+            headers=self.headers,
+            timeout=max_timeout,
+            limits=httpx.Limits(max_connections=MAX_RANGE_WORKERS, max_keepalive_connections=MAX_RANGE_WORKERS)
+        )
+
         try:
             # Get initial episode count
-            response = httpx.get(
-                url=f"{self.url}/info_api/{self.media_id}/",
-                headers=self.headers,
-                timeout=max_timeout
-            )
+            response = client.get(f"{self.url}/info_api/{self.media_id}/")
             response.raise_for_status()
             initial_count = response.json()["episodes_count"]
-            
-            all_episodes = []
-            start_range = 1
-            
-            # Fetch episodes in chunks
-            while start_range <= initial_count:
-                end_range = min(start_range + 119, initial_count)
-                
-                response = httpx.get(
-                    url=f"{self.url}/info_api/{self.media_id}/1",
+
+        except Exception as e:
+            logging.error(f"Error fetching all episodes: {e}")
+            client.close()
+            self._set_ranges([])
+            return
+
+        ranges = [(start, min(start + RANGE_SIZE - 1, initial_count)) for start in range(1, initial_count + 1, RANGE_SIZE)]
+        self._set_ranges([None] * len(ranges))
+        self.episodes_count = initial_count
+
+        if not ranges:
+            client.close()
+            return
+
+        pending = {'count': len(ranges)}
+        pending_lock = threading.Lock()
+
+        def fetch_range(index: int, start_range: int, end_range: int):
+            try:
+                response = client.get(
+                    f"{self.url}/info_api/{self.media_id}/1",
                     params={
                         "start_range": start_range,
                         "end_range": end_range
-                    },
-                    headers=self.headers,
-                    timeout=max_timeout
+                    }
                 )
                 response.raise_for_status()
-                
-                chunk_episodes = response.json().get("episodes", [])
-                all_episodes.extend(chunk_episodes)
-                start_range = end_range + 1
-            
-            self.episodes_cache = all_episodes
-        except Exception as e:
-            logging.error(f"Error fetching all episodes: {e}")
-            self.episodes_cache = None
+                self.episode_ranges[index] = [
+                    tuple(episode.get(field) for field in EPISODE_FIELDS)
+                    for episode in response.json().get("episodes", [])
+                ]
+
+            except Exception as e:
+                logging.error(f"Error fetching episodes {start_range}-{end_range}: {e}")
+
+            finally:
+                self.range_ready[index].set()
+                with pending_lock:
+                    pending['count'] -= 1
+                    done = pending['count'] == 0
+
+                # The last range closes the client and stores the records received, only when every range arrived
+                if done:
+                    client.close()
+                    if all(records is not None for records in self.episode_ranges):
+                        store_value(site_constant.SITE_NAME, f"episode_records/{self.media_id}", [record for records in self.episode_ranges for record in records])
+
+        executor = ThreadPoolExecutor(max_workers=min(MAX_RANGE_WORKERS, len(ranges)), thread_name_prefix="animeunity-range")
+        for index, (start_range, end_range) in enumerate(ranges):
+            executor.submit(fetch_range, index, start_range, end_range)
+        executor.shutdown(wait=False)
+
+    def _set_ranges(self, ranges: List[Optional[List[Tuple]]]):
+        self.range_ready = [threading.Event() for _ in ranges]
+        self.episode_ranges = ranges
 
     def get_info_episode(self, index_ep: int) -> Episode:
         """
-        Get episode info from cache
+        Get episode info, waiting only for the ranges up to the one that contains it.
+        The position comes from the records received, so a short or long range does not shift the episodes.
         """
-        if self.episodes_cache is None:
+        if self.episode_ranges is None:
             self._fetch_all_episodes()
-            
-        if self.episodes_cache and 0 <= index_ep < len(self.episodes_cache):
-            return Episode(self.episodes_cache[index_ep])
+
+        if index_ep < 0:
+            return None
+
+        offset = 0
+        for index, event in enumerate(self.range_ready):
+            event.wait()
+            records = self.episode_ranges[index]
+            if records is None:
+                return None
+
+            if index_ep < offset + len(records):
+                return Episode({field: value for field, value in zip(EPISODE_FIELDS, records[index_ep - offset]) if value is not None})
+            offset += len(records)
+
         return None
 
 
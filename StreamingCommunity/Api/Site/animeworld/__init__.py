@@ -7,7 +7,7 @@ from rich.prompt import Prompt
 
 # Internal utilities
 from StreamingCommunity.Api.Template import get_select_title
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -18,6 +18,7 @@ from .film import download_film
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 indice = 6
 _useFor = "Anime"
 _priority = 0
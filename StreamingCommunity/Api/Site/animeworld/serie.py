@@ -18,7 +18,7 @@ from StreamingCommunity.Lib.Downloader import MP4_downloader
 
 # Logic class
 from .util.ScrapeSerie import ScrapSerie
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Util import manage_selection, dynamic_format_number
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
@@ -28,6 +28,7 @@ from StreamingCommunity.Api.Player.sweetpixel import VideoSource
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 msg = Prompt()
 KILL_HANDLER = bool(False)
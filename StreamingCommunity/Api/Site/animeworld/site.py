@@ -15,11 +15,13 @@ from StreamingCommunity.Util.table import TVShowManager
 
 
 # Logic class
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaManager
+from StreamingCommunity.Api.Template.Util import cached_title_search
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 media_search_manager = MediaManager()
 table_show_manager = TVShowManager()
@@ -59,6 +61,7 @@ def get_session_and_csrf() -> dict:
     logging.info(f"CSRF Token: {csrf_token}")
     return session_id, csrf_token
 
+@cached_title_search(media_search_manager, console)
 def title_search(query: str) -> int:
     """
     Function to perform an anime search using a provided title.
@@ -69,6 +72,8 @@ def title_search(query: str) -> int:
     Returns:
         - int: A number containing the length of media search manager.
     """
+    media_search_manager.clear()
+
     search_url = f"{site_constant.FULL_URL}/search?keyword={query}"
     console.print(f"[cyan]Search url: [yellow]{search_url}")
 
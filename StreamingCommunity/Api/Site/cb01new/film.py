@@ -14,7 +14,7 @@ from StreamingCommunity.Lib.Downloader import HLS_Downloader
 
 
 # Logic class
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -23,6 +23,7 @@ from StreamingCommunity.Api.Player.maxstream import VideoSource
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 
 
@@ -13,17 +13,20 @@ from StreamingCommunity.Util.table import TVShowManager
 
 
 # Logic class
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaManager
+from StreamingCommunity.Api.Template.Util import cached_title_search
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 media_search_manager = MediaManager()
 table_show_manager = TVShowManager()
 max_timeout = config_manager.get_int("REQUESTS", "timeout")
 
 
+@cached_title_search(media_search_manager, console)
 def title_search(query: str) -> int:
     """
     Search for titles based on a search query.
@@ -35,7 +38,6 @@ def title_search(query: str) -> int:
         - int: The number of titles found.
     """
     media_search_manager.clear()
-    table_show_manager.clear()
 
     search_url = f"{site_constant.FULL_URL}/?s={query}"
     console.print(f"[cyan]Search url: [yellow]{search_url}")
@@ -22,9 +22,10 @@ from StreamingCommunity.Api.Template.Util import (
     dynamic_format_number, 
     validate_selection, 
     validate_episode_selection, 
-    display_episodes_list
+    display_episodes_list,
+    download_batch
 )
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -34,11 +35,29 @@ from StreamingCommunity.Api.Player.supervideo import VideoSource
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 msg = Prompt()
 console = Console()
 
 
-def download_video(index_season_selected: int, index_episode_selected: int, scape_info_serie: GetSerieInfo) -> Tuple[str,bool]:
+def get_master_playlist(index_season_selected: int, index_episode_selected: int, scape_info_serie: GetSerieInfo) -> str:
+    """
+    Resolves the master playlist of an episode, used by `download_batch` to prepare the next episodes.
+
+    Parameters:
+        - index_season_selected (int): Season number
+        - index_episode_selected (int): Episode index
+        - scape_info_serie (GetSerieInfo): Scraper object with series information
+
+    Returns:
+        - str: Master playlist URL
+    """
+    obj_episode = scape_info_serie.selectEpisode(index_season_selected, index_episode_selected-1)
+    video_source = VideoSource(obj_episode.get('url'))
+    return video_source.get_playlist()
+
+
+def download_video(index_season_selected: int, index_episode_selected: int, scape_info_serie: GetSerieInfo, master_playlist: str = None) -> Tuple[str,bool]:
     """
     Downloads a specific episode from a specified season.
 
@@ -46,6 +65,7 @@ def download_video(index_season_selected: int, index_episode_selected: int, scap
         - index_season_selected (int): Season number
         - index_episode_selected (int): Episode index
         - scape_info_serie (GetSerieInfo): Scraper object with series information
+        - master_playlist (str, optional): Playlist already resolved by `get_master_playlist`
 
     Returns:
         - str: Path to downloaded file
@@ -63,10 +83,11 @@ def download_video(index_season_selected: int, index_episode_selected: int, scap
     mp4_path = os.path.join(site_constant.SERIES_FOLDER, scape_info_serie.tv_name, f"S{index_season_selected}")
 
     # Setup video source
-    video_source = VideoSource(obj_episode.get('url'))
+    if master_playlist is None:
+        video_source = VideoSource(obj_episode.get('url'))
 
-    # Get m3u8 master playlist
-    master_playlist = video_source.get_playlist()
+        # Get m3u8 master playlist
+        master_playlist = video_source.get_playlist()
     
     # Download the film using the m3u8 playlist, and output filename
     r_proc = HLS_Downloader(
@@ -95,14 +116,17 @@ def download_episode(scape_info_serie: GetSerieInfo, index_season_selected: int,
     episodes = scape_info_serie.get_episode_number(index_season_selected)
     episodes_count = len(episodes)
 
+    # Resolve the next episodes while one downloads
+    def resolve(i_episode):
+        return get_master_playlist(index_season_selected, i_episode, scape_info_serie)
+
+    def download(i_episode, master_playlist):
+        return download_video(index_season_selected, i_episode, scape_info_serie, master_playlist)
+
     if download_all:
         
         # Download all episodes in the season
-        for i_episode in range(1, episodes_count + 1):
-            path, stopped = download_video(index_season_selected, i_episode, scape_info_serie)
-
-            if stopped:
-                break
+        download_batch(list(range(1, episodes_count + 1)), resolve, download)
 
         console.print(f"\n[red]End downloaded [yellow]season: [red]{index_season_selected}.")
 
@@ -120,11 +144,7 @@ def download_episode(scape_info_serie: GetSerieInfo, index_season_selected: int,
         list_episode_select = validate_episode_selection(list_episode_select, episodes_count)
 
         # Download selected episodes
-        for i_episode in list_episode_select:
-            path, stopped = download_video(index_season_selected, i_episode, scape_info_serie)
-
-            if stopped:
-                break
+        download_batch(list_episode_select, resolve, download)
 
 
 def download_series(dict_serie: MediaItem, season_selection: str = None, episode_selection: str = None) -> None:
@@ -16,9 +16,12 @@ from StreamingCommunity.Util.config_json import config_manager
 
 # Logic class
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
+from StreamingCommunity.Api.Template.Util import cached_response
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 max_timeout = config_manager.get_int("REQUESTS", "timeout")
 
 
@@ -35,26 +38,62 @@ class GetSerieInfo:
         self.tv_name = None
         self.list_episodes = None
 
-    def get_seasons_number(self) -> int:
+    def _load_page(self) -> dict:
         """
-        Retrieves the number of seasons of a TV series.
+        Parse the series page once: the title and the episodes of every season, from the metadata cache when possible.
 
         Returns:
-            int: Number of seasons of the TV series.
+            dict: 'tv_name' and 'seasons', the list of episodes of each season in page order.
         """
-        try:
-
-            # Make an HTTP request to the series URL
-            response = httpx.get(self.url, headers=self.headers, timeout=max_timeout, follow_redirects=True)
-            response.raise_for_status()
+        def request(headers: dict) -> httpx.Response:
+            return httpx.get(self.url, headers={**self.headers, **headers}, timeout=max_timeout, follow_redirects=True)
 
+        def parse(response: httpx.Response) -> dict:
             soup = BeautifulSoup(response.text, "html.parser")
+            seasons = []
+
+            for n_season in range(1, len(soup.find('div', class_="tt_season").find_all("li")) + 1):
+
+                # Find the container of episodes for the specified season, a missing tab leaves that season empty
+                table_content = soup.find('div', class_="tab-pane", id=f"season-{n_season}")
+                list_dict_episode = []
 
-            table_content = soup.find('div', class_="tt_season")
-            seasons_number = len(table_content.find_all("li"))
-            self.tv_name = soup.find("h1", class_="entry-title").get_text(strip=True)
+                if table_content is None:
+                    logging.error(f"Season {n_season} not found in the page")
+                    seasons.append(list_dict_episode)
+                    continue
 
-            return seasons_number
+                for episode_div in table_content.find_all("li"):
+                    link = episode_div.find("a")
+                    if link is None:
+                        continue
+
+                    list_dict_episode.append({
+                        'number': link.get("data-num"),
+                        'name': link.get("data-title"),
+                        'url': link.get("data-link")
+                    })
+
+                seasons.append(list_dict_episode)
+
+            return {
+                'tv_name': soup.find("h1", class_="entry-title").get_text(strip=True),
+                'seasons': seasons
+            }
+
+        return cached_response(site_constant.SITE_NAME, f"page/{self.url}", request, parse)
+
+    def get_seasons_number(self) -> int:
+        """
+        Retrieves the number of seasons of a TV series.
+
+        Returns:
+            int: Number of seasons of the TV series.
+        """
+        try:
+            page = self._load_page()
+            self.tv_name = page['tv_name']
+            return len(page['seasons'])
 
         except Exception as e:
             logging.error(f"Error parsing HTML page: {e}")
@@ -72,32 +111,7 @@ class GetSerieInfo:
             List[Dict[str, str]]: List of dictionaries containing episode information.
         """
         try:
-
-            # Make an HTTP request to the series URL
-            response = httpx.get(self.url, headers=self.headers, timeout=max_timeout, follow_redirects=True)
-            response.raise_for_status()
-
-            # Parse HTML content of the page
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Find the container of episodes for the specified season
-            table_content = soup.find('div', class_="tab-pane", id=f"season-{n_season}")
-            episode_content = table_content.find_all("li")
-            list_dict_episode = []
-
-            for episode_div in episode_content:
-                index = episode_div.find("a").get("data-num")
-                link = episode_div.find("a").get("data-link")
-                name = episode_div.find("a").get("data-title")
-
-                obj_episode = {
-                    'number': index,
-                    'name': name,
-                    'url': link
-                }
-                
-                list_dict_episode.append(obj_episode)
-
+            list_dict_episode = self._load_page()['seasons'][n_season - 1]
             self.list_episodes = list_dict_episode
             return list_dict_episode
         
@@ -20,9 +20,10 @@ from StreamingCommunity.Api.Template.Util import (
     map_episode_title,
     validate_selection, 
     validate_episode_selection, 
-    display_episodes_list
+    display_episodes_list,
+    download_batch
 )
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -31,11 +32,28 @@ from StreamingCommunity.Api.Player.mediapolisvod import VideoSource
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 msg = Prompt()
 console = Console()
 
 
-def download_video(index_season_selected: int, index_episode_selected: int, scrape_serie: GetSerieInfo) -> Tuple[str,bool]:
+def get_master_playlist(index_season_selected: int, index_episode_selected: int, scrape_serie: GetSerieInfo) -> str:
+    """
+    Resolves the master playlist of an episode, used by `download_batch` to prepare the next episodes.
+
+    Parameters:
+        - index_season_selected (int): Season number
+        - index_episode_selected (int): Episode index
+        - scrape_serie (GetSerieInfo): Scraper object with series information
+
+    Returns:
+        - str: Master playlist URL
+    """
+    obj_episode = scrape_serie.selectEpisode(index_season_selected, index_episode_selected-1)
+    return VideoSource.extract_m3u8_url(obj_episode.url)
+
+
+def download_video(index_season_selected: int, index_episode_selected: int, scrape_serie: GetSerieInfo, master_playlist: str = None) -> Tuple[str,bool]:
     """
     Downloads a specific episode from the specified season.
 
@@ -43,6 +61,7 @@ def download_video(index_season_selected: int, index_episode_selected: int, scra
         - index_season_selected (int): Season number
         - index_episode_selected (int): Episode index
         - scrape_serie (GetSerieInfo): Scraper object with series information
+        - master_playlist (str, optional): Playlist already resolved by `get_master_playlist`
 
     Returns:
         - str: Path to downloaded file
@@ -55,7 +74,8 @@ def download_video(index_season_selected: int, index_episode_selected: int, scra
     console.print(f"[bold yellow]Download:[/bold yellow] [red]{site_constant.SITE_NAME}[/red] → [bold magenta]{obj_episode.name}[/bold magenta] ([cyan]S{index_season_selected}E{index_episode_selected}[/cyan]) \n")
 
     # Get streaming URL
-    master_playlist = VideoSource.extract_m3u8_url(obj_episode.url)
+    if master_playlist is None:
+        master_playlist = VideoSource.extract_m3u8_url(obj_episode.url)
 
     # Define filename and path
     mp4_name = f"{map_episode_title(scrape_serie.series_name, index_season_selected, index_episode_selected, obj_episode.name)}.mp4"
@@ -88,11 +108,15 @@ def download_episode(index_season_selected: int, scrape_serie: GetSerieInfo, dow
     episodes = scrape_serie.getEpisodeSeasons(index_season_selected)
     episodes_count = len(episodes)
 
+    # Resolve the next episodes while one downloads
+    def resolve(i_episode):
+        return get_master_playlist(index_season_selected, i_episode, scrape_serie)
+
+    def download(i_episode, master_playlist):
+        return download_video(index_season_selected, i_episode, scrape_serie, master_playlist)
+
     if download_all:
-        for i_episode in range(1, episodes_count + 1):
-            path, stopped = download_video(index_season_selected, i_episode, scrape_serie)
-            if stopped:
-                break
+        download_batch(list(range(1, episodes_count + 1)), resolve, download)
         console.print(f"\n[red]End downloaded [yellow]season: [red]{index_season_selected}.")
 
     else:
@@ -108,10 +132,7 @@ def download_episode(index_season_selected: int, scrape_serie: GetSerieInfo, dow
         list_episode_select = validate_episode_selection(list_episode_select, episodes_count)
 
         # Download selected episodes if not stopped
-        for i_episode in list_episode_select:
-            path, stopped = download_video(index_season_selected, i_episode, scrape_serie)
-            if stopped:
-                break
+        download_batch(list_episode_select, resolve, download)
 
 def download_series(select_season: MediaItem, season_selection: str = None, episode_selection: str = None) -> None:
     """
@@ -17,11 +17,13 @@ from StreamingCommunity.Lib.TMBD.tmdb import tmdb
 
 
 # Logic class
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaManager
+from StreamingCommunity.Api.Template.Util import cached_title_search
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 media_search_manager = MediaManager()
 table_show_manager = TVShowManager()
@@ -96,6 +98,7 @@ def worker_determine_type(work_queue, result_dict, worker_id):
             work_queue.task_done()
 
 
+@cached_title_search(media_search_manager, console)
 def title_search(query: str) -> int:
     """
     Search for titles based on a search query.
@@ -107,7 +110,6 @@ def title_search(query: str) -> int:
         int: The number of titles found.
     """
     media_search_manager.clear()
-    table_show_manager.clear()
 
     search_url = f"https://www.raiplay.it/atomatic/raiplay-search-service/api/v1/msearch"
     console.print(f"[cyan]Search url: [yellow]{search_url}")
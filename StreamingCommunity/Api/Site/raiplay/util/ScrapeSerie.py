@@ -13,7 +13,13 @@ from StreamingCommunity.Util.config_json import config_manager
 from StreamingCommunity.Api.Player.Helper.Vixcloud.util import SeasonManager
 
 
+# Logic class
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
+from StreamingCommunity.Api.Template.Util import cached_response
+
+
 # Variable
+site_constant = get_site_constant(__name__)
 max_timeout = config_manager.get_int("REQUESTS", "timeout")
 
 
@@ -29,10 +35,12 @@ class GetSerieInfo:
         """Get series info including seasons."""
         try:
             program_url = f"{self.base_url}/programmi/{self.program_name}.json"
-            response = httpx.get(url=program_url, headers=get_headers(), timeout=max_timeout)
-            response.raise_for_status()
-
-            json_data = response.json()
+            json_data = cached_response(
+                site_constant.SITE_NAME,
+                f"title/{self.program_name}",
+                lambda headers: httpx.get(url=program_url, headers={**get_headers(), **headers}, timeout=max_timeout),
+                lambda response: response.json()
+            )
             
             # Look for seasons in the 'blocks' property
             for block in json_data.get('blocks'):
@@ -59,10 +67,12 @@ class GetSerieInfo:
             season = self.seasons_manager.get_season_by_number(number_season)
 
             url = f"{self.base_url}/programmi/{self.program_name}/{self.publishing_block_id}/{season.id}/episodes.json"
-            response = httpx.get(url=url, headers=get_headers(), timeout=max_timeout)
-            response.raise_for_status()
-            
-            episodes_data = response.json()
+            episodes_data = cached_response(
+                site_constant.SITE_NAME,
+                f"season/{self.program_name}/{season.id}",
+                lambda headers: httpx.get(url=url, headers={**get_headers(), **headers}, timeout=max_timeout),
+                lambda response: response.json()
+            )
             cards = []
             
             # Extract episodes from different possible structures 
@@ -13,7 +13,7 @@ from rich.prompt import Prompt
 # Internal utilities
 from StreamingCommunity.Api.Template import get_select_title
 from StreamingCommunity.Lib.Proxies.proxy import ProxyFinder
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance
 
@@ -25,6 +25,7 @@ from .series import download_series
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 indice = 0
 _useFor = "Film_&_Serie" # "Movies_&_Series"
 _priority = 0
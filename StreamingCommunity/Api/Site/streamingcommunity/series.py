@@ -22,9 +22,10 @@ from StreamingCommunity.Api.Template.Util import (
     dynamic_format_number, 
     validate_selection, 
     validate_episode_selection, 
-    display_episodes_list
+    display_episodes_list,
+    download_batch
 )
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaItem
 
 
@@ -33,11 +34,33 @@ from StreamingCommunity.Api.Player.vixcloud import VideoSource
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 msg = Prompt()
 console = Console()
 
 
-def download_video(index_season_selected: int, index_episode_selected: int, scrape_serie: GetSerieInfo, video_source: VideoSource) -> Tuple[str,bool]:
+def get_master_playlist(index_season_selected: int, index_episode_selected: int, scrape_serie: GetSerieInfo, video_source: VideoSource) -> str:
+    """
+    Resolves the master playlist of an episode with its own VideoSource, so several episodes can be resolved at once.
+
+    Parameters:
+        - index_season_selected (int): Season number
+        - index_episode_selected (int): Episode index
+        - scrape_serie (GetSerieInfo): Scraper object with series information
+        - video_source (VideoSource): Video source of the series, only its settings are used
+
+    Returns:
+        - str: Master playlist URL
+    """
+    obj_episode = scrape_serie.selectEpisode(index_season_selected, index_episode_selected-1)
+
+    episode_source = VideoSource(video_source.url, video_source.is_series, video_source.media_id, video_source.proxy)
+    episode_source.get_iframe(obj_episode.id)
+    episode_source.get_content()
+    return episode_source.get_playlist()
+
+
+def download_video(index_season_selected: int, index_episode_selected: int, scrape_serie: GetSerieInfo, video_source: VideoSource, master_playlist: str = None) -> Tuple[str,bool]:
     """
     Downloads a specific episode from the specified season.
 
@@ -46,6 +69,7 @@ def download_video(index_season_selected: int, index_episode_selected: int, scra
         - index_episode_selected (int): Episode index
         - scrape_serie (GetSerieInfo): Scraper object with series information
         - video_source (VideoSource): Video source handler
+        - master_playlist (str, optional): Playlist already resolved by `get_master_playlist`
 
     Returns:
         - str: Path to downloaded file
@@ -76,9 +100,10 @@ def download_video(index_season_selected: int, index_episode_selected: int, scra
     mp4_path = os.path.join(site_constant.SERIES_FOLDER, scrape_serie.series_name, f"S{index_season_selected}")
 
     # Retrieve scws and if available master playlist
-    video_source.get_iframe(obj_episode.id)
-    video_source.get_content()
-    master_playlist = video_source.get_playlist()
+    if master_playlist is None:
+        video_source.get_iframe(obj_episode.id)
+        video_source.get_content()
+        master_playlist = video_source.get_playlist()
 
     # Download the episode
     r_proc = HLS_Downloader(
@@ -112,13 +137,16 @@ def download_episode(index_season_selected: int, scrape_serie: GetSerieInfo, vid
         console.print(f"[red]No episodes found for season {index_season_selected}")
         return
 
+    # Resolve the next episodes while one downloads
+    def resolve(i_episode):
+        return get_master_playlist(index_season_selected, i_episode, scrape_serie, video_source)
+
+    def download(i_episode, master_playlist):
+        return download_video(index_season_selected, i_episode, scrape_serie, video_source, master_playlist)
+
     if download_all:
         # Download all episodes in the season
-        for i_episode in range(1, episodes_count + 1):
-            path, stopped = download_video(index_season_selected, i_episode, scrape_serie, video_source)
-
-            if stopped:
-                break
+        download_batch(list(range(1, episodes_count + 1)), resolve, download)
 
         console.print(f"\n[red]End downloaded [yellow]season: [red]{index_season_selected}.")
 
@@ -135,11 +163,7 @@ def download_episode(index_season_selected: int, scrape_serie: GetSerieInfo, vid
         list_episode_select = validate_episode_selection(list_episode_select, episodes_count)
 
         # Download selected episodes if not stopped
-        for i_episode in list_episode_select:
-            path, stopped = download_video(index_season_selected, i_episode, scrape_serie, video_source)
-
-            if stopped:
-                break
+        download_batch(list_episode_select, resolve, download)
 
 
 def download_series(select_season: MediaItem, season_selection: str = None, episode_selection: str = None, proxy = None) -> None:
@@ -17,17 +17,20 @@ from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance
 
 
 # Logic class
-from StreamingCommunity.Api.Template.config_loader import site_constant
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
 from StreamingCommunity.Api.Template.Class.SearchType import MediaManager
+from StreamingCommunity.Api.Template.Util import cached_title_search
 
 
 # Variable
+site_constant = get_site_constant(__name__)
 console = Console()
 media_search_manager = MediaManager()
 table_show_manager = TVShowManager()
 max_timeout = config_manager.get_int("REQUESTS", "timeout")
 
 
+@cached_title_search(media_search_manager, console)
 def title_search(query: str, proxy: str) -> int:
     """
     Search for titles based on a search query.
@@ -42,7 +45,6 @@ def title_search(query: str, proxy: str) -> int:
         bot = get_bot_instance()
 
     media_search_manager.clear()
-    table_show_manager.clear()
 
     try:
         response = httpx.get(
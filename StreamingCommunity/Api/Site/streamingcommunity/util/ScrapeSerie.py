@@ -15,7 +15,13 @@ from StreamingCommunity.Util.config_json import config_manager
 from StreamingCommunity.Api.Player.Helper.Vixcloud.util import SeasonManager
 
 
+# Logic class
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
+from StreamingCommunity.Api.Template.Util import cached_response
+
+
 # Variable
+site_constant = get_site_constant(__name__)
 max_timeout = config_manager.get_int("REQUESTS", "timeout")
 
 
@@ -40,29 +46,40 @@ class GetSerieInfo:
             self.is_series = True
             self.series_name = series_name
 
-    def collect_info_title(self) -> None:
+    def _load_title(self, force: bool = False) -> dict:
         """
-        Retrieve general information about the TV series from the streaming site.
-        
-        Raises:
-            Exception: If there's an error fetching series information
+        Return the Inertia version and the title data of the series page, from the metadata cache when possible.
         """
-        try:
-            response = httpx.get(
+        def request(headers: dict) -> httpx.Response:
+            return httpx.get(
                 url=f"{self.url}/titles/{self.media_id}-{self.series_name}",
-                headers=self.headers,
+                headers={**self.headers, **headers},
                 timeout=max_timeout,
                 proxy=self.proxy
             )
-            response.raise_for_status()
 
-            # Extract series info from JSON response
+        def parse(response: httpx.Response) -> dict:
             soup = BeautifulSoup(response.text, "html.parser")
             json_response = json.loads(soup.find("div", {"id": "app"}).get("data-page"))
-            self.version = json_response['version']
-            
+            return {
+                'version': json_response['version'],
+                'title': json_response.get("props", {}).get("title", {})
+            }
+
+        data = cached_response(site_constant.SITE_NAME, f"title/{self.media_id}", request, parse, force)
+        self.version = data['version']
+        return data
+
+    def collect_info_title(self) -> None:
+        """
+        Retrieve general information about the TV series from the streaming site.
+        
+        Raises:
+            Exception: If there's an error fetching series information
+        """
+        try:
             # Extract information about available seasons
-            title_data = json_response.get("props", {}).get("title", {})
+            title_data = self._load_title()['title']
             
             # Save general series information
             self.title_info = title_data
@@ -99,22 +116,36 @@ class GetSerieInfo:
                 logging.error(f"Season {number_season} not found")
                 return
             
-            response = httpx.get(
-                url=f'{self.url}/titles/{self.media_id}-{self.series_name}/season-{number_season}', 
-                headers={
-                    'User-Agent': self.headers['user-agent'],
-                    'x-inertia': 'true',
-                    'x-inertia-version': self.version,
-                },
-                timeout=max_timeout,
-                proxy=self.proxy
-            )
-
-            # Extract episodes from JSON response
-            json_response = response.json().get('props', {}).get('loadedSeason', {}).get('episodes', [])
+            def request(headers: dict) -> httpx.Response:
+                return httpx.get(
+                    url=f'{self.url}/titles/{self.media_id}-{self.series_name}/season-{number_season}', 
+                    headers={
+                        'User-Agent': self.headers['user-agent'],
+                        'x-inertia': 'true',
+                        'x-inertia-version': self.version,
+                        **headers
+                    },
+                    timeout=max_timeout,
+                    proxy=self.proxy
+                )
+
+            def parse(response: httpx.Response) -> list:
+                return response.json().get('props', {}).get('loadedSeason', {}).get('episodes', [])
+
+            key = f"season/{self.media_id}/{number_season}"
+            try:
+                episodes = cached_response(site_constant.SITE_NAME, key, request, parse)
+
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code != 409:
+                    raise
+
+                # The site was updated since the title was cached: 409 asks for the new Inertia version
+                self._load_title(force=True)
+                episodes = cached_response(site_constant.SITE_NAME, key, request, parse, force=True)
                 
             # Add each episode to the corresponding season's episode manager
-            for dict_episode in json_response:
+            for dict_episode in episodes:
                 season.episodes.add(dict_episode)
 
         except Exception as e:
@@ -14,7 +14,13 @@ from StreamingCommunity.Util.config_json import config_manager
 from StreamingCommunity.Api.Player.Helper.Vixcloud.util import SeasonManager, Episode
 
 
+# Logic class
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
+from StreamingCommunity.Api.Template.Util import cached_response
+
+
 # Variable
+site_constant = get_site_constant(__name__)
 max_timeout = config_manager.get_int("REQUESTS", "timeout")
 
 
@@ -32,42 +38,18 @@ class GetSerieInfo:
         Retrieve all series information including episodes and seasons.
         """
         try:
-            response = self.client.get(self.url)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            data = cached_response(
+                site_constant.SITE_NAME,
+                f"page/{self.url}",
+                lambda headers: self.client.get(self.url, headers=headers),
+                self._parse_page
+            )
             
             if not self.series_name:
-                title_tag = soup.find('h1', class_='title-border')
-                self.series_name = title_tag.get_text(strip=True) if title_tag else 'N/A'
-            
-            # Extract episodes and organize by season
-            episodes = {}
-            for ep in soup.find_all('div', class_='bolumust'):
-                a_tag = ep.find('a')
-                if not a_tag:
-                    continue
-                
-                ep_url = a_tag.get('href', '')
-                episode_title = a_tag.get_text(strip=True)
-                
-                # Clean up episode title by removing season info and date
-                clean_title = re.sub(r'Stagione \d+ Episodio \d+\s*\(?([^)]+)\)?\s*\d+\s*\w+\s*\d+', r'\1', episode_title)
-                
-                season_match = re.search(r'stagione-(\d+)', ep_url)
-                if season_match:
-                    season_num = int(season_match.group(1))
-                    if season_num not in episodes:
-                        episodes[season_num] = []
-                    
-                    episodes[season_num].append({
-                        'id': len(episodes[season_num]) + 1,
-                        'number': len(episodes[season_num]) + 1,
-                        'name': clean_title.strip(),
-                        'url': ep_url
-                    })
+                self.series_name = data['series_name']
             
             # Add seasons to SeasonManager
-            for season_num, eps in episodes.items():
+            for season_num, eps in data['seasons']:
                 season = self.seasons_manager.add_season({
                     'id': season_num,
                     'number': season_num,
@@ -82,6 +64,44 @@ class GetSerieInfo:
             logging.error(f"Error collecting series info: {str(e)}")
             raise
 
+    def _parse_page(self, response: httpx.Response) -> dict:
+        """
+        Extract the series name and the episodes of the page, as a list of (season number, episodes).
+        """
+        soup = BeautifulSoup(response.text, 'html.parser')
+        title_tag = soup.find('h1', class_='title-border')
+        
+        # Extract episodes and organize by season
+        episodes = {}
+        for ep in soup.find_all('div', class_='bolumust'):
+            a_tag = ep.find('a')
+            if not a_tag:
+                continue
+            
+            ep_url = a_tag.get('href', '')
+            episode_title = a_tag.get_text(strip=True)
+            
+            # Clean up episode title by removing season info and date
+            clean_title = re.sub(r'Stagione \d+ Episodio \d+\s*\(?([^)]+)\)?\s*\d+\s*\w+\s*\d+', r'\1', episode_title)
+            
+            season_match = re.search(r'stagione-(\d+)', ep_url)
+            if season_match:
+                season_num = int(season_match.group(1))
+                if season_num not in episodes:
+                    episodes[season_num] = []
+                
+                episodes[season_num].append({
+                    'id': len(episodes[season_num]) + 1,
+                    'number': len(episodes[season_num]) + 1,
+                    'name': clean_title.strip(),
+                    'url': ep_url
+                })
+
+        return {
+            'series_name': title_tag.get_text(strip=True) if title_tag else 'N/A',
+            'seasons': list(episodes.items())
+        }
+
     # ------------- FOR GUI -------------
     def getNumberSeason(self) -> int:
         """
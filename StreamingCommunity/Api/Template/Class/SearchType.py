@@ -1,5 +1,7 @@
 # 07.07.24
 
+import threading
+from contextlib import contextmanager
 from typing import List, TypedDict
 
 
@@ -59,7 +61,31 @@ class MediaItem(metaclass=MediaItemMeta):
     
 class MediaManager:
     def __init__(self):
-        self.media_list: List[MediaItem] = []
+        self._media_list: List[MediaItem] = []
+        self.local = threading.local()
+
+    @property
+    def media_list(self) -> List[MediaItem]:
+        """
+        The media found, or the private list of the calling thread inside `isolated()`.
+        """
+        isolated = getattr(self.local, 'media_list', None)
+        return self._media_list if isolated is None else isolated
+
+    @contextmanager
+    def isolated(self):
+        """
+        Within the block, the calling thread adds and clears media on its own list,
+        so a search in background does not change the list the user is choosing from.
+
+        Yields:
+            list: The private list of the thread.
+        """
+        self.local.media_list = []
+        try:
+            yield self.local.media_list
+        finally:
+            del self.local.media_list
 
     def add_media(self, data: dict) -> None:
         """
@@ -7,4 +7,7 @@ from .manage_ep import (
     validate_selection, 
     dynamic_format_number,
     display_episodes_list
-)
\ No newline at end of file
+)
+from .batch import download_batch
+from .search_cache import cached_title_search, SearchCache
+from .metadata_cache import cached_response, cached_value, get_cached_value, store_value, MetadataCache
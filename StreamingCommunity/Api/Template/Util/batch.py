@@ -0,0 +1,86 @@
+# 18.10.26
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, Callable, Dict, List, Tuple
+
+
+# External library
+from rich.console import Console
+
+
+# Internal utilities
+from StreamingCommunity.Util.config_json import config_manager
+
+
+# Variable
+console = Console()
+BATCH_PREFETCH = config_manager.get_int('M3U8_DOWNLOAD', 'batch_prefetch')
+
+
+def report_resolve_error(episode: Any, error: Exception) -> None:
+    """Log an episode that could not be resolved, the batch continues without it."""
+    logging.error(f"Batch: cannot resolve episode {episode}: {error}")
+    console.print(f"[red]Skipping episode {episode}: {error}")
+
+
+def download_batch(episodes: List[Any], resolve: Callable[[Any], Any], download: Callable[[Any, Any], Tuple[str, bool]]) -> bool:
+    """
+    Downloads a list of episodes as a pipeline of three stages that overlap:
+        - the next `batch_prefetch` episodes are resolved (iframe, playlist, ...) in a small pool,
+        - the current episode downloads, its tracks share the worker budget of the HLS downloader,
+        - the previous episodes are merged in background by the FFmpegScheduler, when `merge_in_background` is enabled.
+    With `batch_prefetch` set to 0 every episode is resolved before its download starts.
+    An episode that cannot be resolved is logged and skipped, the batch goes on with the next one.
+
+    Parameters:
+        - episodes (list): Episodes to download, in order.
+        - resolve (Callable): Returns what `download` needs for one episode, usually the master playlist.
+            It runs in a worker thread, so it must not share mutable state between episodes.
+        - download (Callable): Called as download(episode, resolved), returns (path, stopped).
+
+    Returns:
+        bool: True if a download was stopped.
+    """
+    if BATCH_PREFETCH <= 0 or len(episodes) <= 1:
+        for episode in episodes:
+            try:
+                resolved = resolve(episode)
+            except Exception as e:
+                report_resolve_error(episode, e)
+                continue
+
+            path, stopped = download(episode, resolved)
+            if stopped:
+                return True
+        return False
+
+    pending: Dict[int, Future] = {}
+    executor = ThreadPoolExecutor(max_workers=BATCH_PREFETCH, thread_name_prefix="batch-resolve")
+
+    try:
+        for idx, episode in enumerate(episodes):
+
+            # Keep the next episodes resolving while this one downloads
+            for ahead in range(idx, min(idx + BATCH_PREFETCH + 1, len(episodes))):
+                if ahead not in pending:
+                    pending[ahead] = executor.submit(resolve, episodes[ahead])
+
+            try:
+                resolved = pending.pop(idx).result()
+            except Exception as e:
+                report_resolve_error(episode, e)
+                continue
+
+            logging.info(f"Batch: start episode {episode}, {len(pending)} resolved ahead")
+
+            path, stopped = download(episode, resolved)
+            if stopped:
+                return True
+
+        return False
+
+    finally:
+        for future in pending.values():
+            future.cancel()
+        executor.shutdown(wait=False)
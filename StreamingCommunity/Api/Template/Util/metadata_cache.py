@@ -0,0 +1,232 @@
+# 18.10.26
+
+import json
+import time
+import sqlite3
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+# External libraries
+import httpx
+
+
+# Internal utilities
+from StreamingCommunity.Util.config_json import config_manager
+
+
+# Logic class
+from StreamingCommunity.Api.Template.config_loader import SiteConstant
+from .search_cache import get_cache_path, evict_lru
+
+
+# Config
+METADATA_CACHE = config_manager.get_bool('DEFAULT', 'metadata_cache')
+METADATA_CACHE_TTL = config_manager.get_int('DEFAULT', 'metadata_cache_ttl')
+METADATA_CACHE_MAX_MB = config_manager.get_int('DEFAULT', 'metadata_cache_max_mb')
+
+
+def get_site_domain(site: str) -> str:
+    """Current address of a site, part of the key so a site that moves does not serve the links of its old domain."""
+    try:
+        return SiteConstant(site).FULL_URL
+    except Exception:
+        return ""
+
+
+class MetadataCache:
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, path: str, max_bytes: int):
+        """
+        Seasons and episodes of the series already seen, stored in SQLite by site, domain and key,
+        e.g. 'title/123' or 'season/123/2', with the ETag and Last-Modified of the page they come from.
+
+        Parameters:
+            - path (str): Path of the database file.
+            - max_bytes (int): Maximum size of the stored data, the least recently read entries are removed first.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.conn: Optional[sqlite3.Connection] = None
+        self.lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "MetadataCache":
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(get_cache_path(), METADATA_CACHE_MAX_MB * 1024 * 1024)
+            return cls._instance
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+
+            # Entries written before the domain was part of the key are dropped
+            columns = [row[1] for row in self.conn.execute("PRAGMA table_info(metadata)")]
+            if columns and "domain" not in columns:
+                self.conn.execute("DROP TABLE metadata")
+
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                "site TEXT NOT NULL, domain TEXT NOT NULL, key TEXT NOT NULL, data TEXT NOT NULL, etag TEXT, last_modified TEXT, "
+                "size INTEGER NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL, "
+                "PRIMARY KEY (site, domain, key))"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS metadata_accessed ON metadata (accessed)")
+        return self.conn
+
+    def get(self, site: str, domain: str, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Read an entry and mark it as recently used.
+
+        Returns:
+            dict: 'data', 'etag', 'last_modified' and 'age' in seconds, None if there is no entry.
+        """
+        try:
+            with self.lock:
+                conn = self._connect()
+                row = conn.execute("SELECT data, etag, last_modified, created FROM metadata WHERE site = ? AND domain = ? AND key = ?", (site, domain, key)).fetchone()
+                if row is None:
+                    return None
+
+                with conn:
+                    conn.execute("UPDATE metadata SET accessed = ? WHERE site = ? AND domain = ? AND key = ?", (time.time(), site, domain, key))
+
+            return {'data': json.loads(row[0]), 'etag': row[1], 'last_modified': row[2], 'age': time.time() - row[3]}
+
+        except (sqlite3.Error, ValueError) as e:
+            logging.warning(f"Metadata cache read failed: {e}")
+            return None
+
+    def put(self, site: str, domain: str, key: str, data: Any, etag: str = None, last_modified: str = None) -> None:
+        """Store an entry as fresh, then evict the oldest entries if the cache is too large."""
+        try:
+            text = json.dumps(data, default=str)
+            now = time.time()
+
+            with self.lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO metadata (site, domain, key, data, etag, last_modified, size, created, accessed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (site, domain, key, text, etag, last_modified, len(text), now, now)
+                    )
+                    evict_lru(conn, "metadata", self.max_bytes)
+
+        except sqlite3.Error as e:
+            logging.warning(f"Metadata cache write failed: {e}")
+
+    def touch(self, site: str, domain: str, key: str) -> None:
+        """Mark an entry as fresh again, after the server answered 304 Not Modified."""
+        try:
+            with self.lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute("UPDATE metadata SET created = ? WHERE site = ? AND domain = ? AND key = ?", (time.time(), site, domain, key))
+
+        except sqlite3.Error as e:
+            logging.warning(f"Metadata cache write failed: {e}")
+
+
+def cached_response(site: str, key: str, request: Callable[[Dict[str, str]], httpx.Response], parse: Callable[[httpx.Response], Any], force: bool = False) -> Any:
+    """
+    Return the data parsed from a page, reusing the cached copy while it is younger than `metadata_cache_ttl`.
+    An older copy is revalidated with If-None-Match / If-Modified-Since when the page had an ETag or a Last-Modified,
+    and returned as is if the request fails.
+
+    Parameters:
+        - site (str): Name of the site.
+        - key (str): Key of the page within the site.
+        - request (Callable): Sends the request with the extra headers it receives and returns the response.
+        - parse (Callable): Turns the response into data made of dicts, lists and scalars.
+        - force (bool): Ignore the cached copy.
+
+    Returns:
+        Any: The parsed data.
+    """
+    if not METADATA_CACHE:
+        response = request({})
+        response.raise_for_status()
+        return parse(response)
+
+    cache = MetadataCache.get_instance()
+    domain = get_site_domain(site)
+    entry = None if force else cache.get(site, domain, key)
+
+    if entry is not None and entry['age'] < METADATA_CACHE_TTL:
+        logging.info(f"Metadata cache: {site} {key} from cache, age {entry['age']:.0f}s")
+        return entry['data']
+
+    headers = {}
+    if entry is not None:
+        if entry['etag']:
+            headers['If-None-Match'] = entry['etag']
+        if entry['last_modified']:
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    try:
+        response = request(headers)
+        if response.status_code == 304 and entry is not None:
+            logging.info(f"Metadata cache: {site} {key} not modified")
+            cache.touch(site, domain, key)
+            return entry['data']
+
+        response.raise_for_status()
+
+    except httpx.HTTPError as e:
+        if entry is None:
+            raise
+        logging.warning(f"Metadata cache: {site} {key} revalidation failed, using the cached copy: {e}")
+        return entry['data']
+
+    data = parse(response)
+    cache.put(site, domain, key, data, response.headers.get('etag'), response.headers.get('last-modified'))
+    return data
+
+
+def get_cached_value(site: str, key: str) -> Any:
+    """
+    Return the data stored with `store_value` while it is younger than `metadata_cache_ttl`, None otherwise.
+    """
+    if not METADATA_CACHE:
+        return None
+
+    entry = MetadataCache.get_instance().get(site, get_site_domain(site), key)
+    if entry is not None and entry['age'] < METADATA_CACHE_TTL:
+        logging.info(f"Metadata cache: {site} {key} from cache, age {entry['age']:.0f}s")
+        return entry['data']
+
+    return None
+
+
+def store_value(site: str, key: str, data: Any) -> None:
+    """Store data built by the caller, empty data is not stored."""
+    if METADATA_CACHE and data:
+        MetadataCache.get_instance().put(site, get_site_domain(site), key, data)
+
+
+def cached_value(site: str, key: str, produce: Callable[[], Any], force: bool = False) -> Any:
+    """
+    Return data built from several requests, reusing the cached copy while it is younger than `metadata_cache_ttl`.
+    Empty data is not stored, so a failed listing is fetched again next time.
+
+    Parameters:
+        - site (str): Name of the site.
+        - key (str): Key of the data within the site.
+        - produce (Callable): Fetches the data when the cached copy is missing or too old.
+        - force (bool): Ignore the cached copy.
+
+    Returns:
+        Any: The data.
+    """
+    data = None if force else get_cached_value(site, key)
+    if data is not None:
+        return data
+
+    data = produce()
+    store_value(site, key, data)
+    return data
@@ -0,0 +1,271 @@
+# 18.10.26
+
+import os
+import re
+import json
+import time
+import sqlite3
+import logging
+import threading
+import functools
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+# External library
+from rich.console import Console
+
+
+# Internal utilities
+from StreamingCommunity.Util.config_json import config_manager
+from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance
+
+
+# Logic class
+from StreamingCommunity.Api.Template.config_loader import get_site_constant
+from StreamingCommunity.Api.Template.Class.SearchType import MediaManager
+
+
+# Config
+SEARCH_CACHE = config_manager.get_bool('DEFAULT', 'search_cache')
+SEARCH_CACHE_TTL = config_manager.get_dict('DEFAULT', 'search_cache_ttl')
+SEARCH_CACHE_MAX_MB = config_manager.get_int('DEFAULT', 'search_cache_max_mb')
+TELEGRAM_BOT = config_manager.get_bool('DEFAULT', 'telegram_bot')
+
+
+# Variable
+CACHE_FILE_NAME = "cache.db"
+DEFAULT_TTL = 3600
+MAX_STALE_FACTOR = 24
+
+
+def normalize_query(query: str) -> str:
+    """Lower case the query and collapse its whitespace, so 'The  Office ' and 'the office' share an entry."""
+    return re.sub(r'\s+', ' ', query).strip().lower()
+
+
+def get_cache_path() -> str:
+    """Path of the database shared by the caches, next to config.json."""
+    return os.path.join(os.path.dirname(config_manager.file_path), CACHE_FILE_NAME)
+
+
+def evict_lru(conn: sqlite3.Connection, table: str, max_bytes: int) -> int:
+    """
+    Remove the least recently read rows of `table` until their `size` fits in `max_bytes`.
+
+    Returns:
+        int: Number of rows removed.
+    """
+    excess = conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {table}").fetchone()[0] - max_bytes
+    if excess <= 0:
+        return 0
+
+    evicted = []
+    for rowid, size in conn.execute(f"SELECT rowid, size FROM {table} ORDER BY accessed"):
+        if excess <= 0:
+            break
+        evicted.append((rowid,))
+        excess -= size
+
+    conn.executemany(f"DELETE FROM {table} WHERE rowid = ?", evicted)
+    logging.info(f"Cache {table}: evicted {len(evicted)} entries")
+    return len(evicted)
+
+
+def get_site_ttl(site_name: str) -> float:
+    """Seconds a search of `site_name` stays fresh, from `search_cache_ttl` or its 'default'."""
+    return float(SEARCH_CACHE_TTL.get(site_name, SEARCH_CACHE_TTL.get('default', DEFAULT_TTL)))
+
+
+class SearchCache:
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, path: str, max_bytes: int):
+        """
+        Search results stored in SQLite, keyed by site, domain and normalized query.
+        When the results take more than `max_bytes`, the least recently read entries are removed.
+
+        Parameters:
+            - path (str): Path of the database file.
+            - max_bytes (int): Maximum size of the stored results.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.conn: Optional[sqlite3.Connection] = None
+        self.lock = threading.Lock()
+        self.revalidating = set()
+
+    @classmethod
+    def get_instance(cls) -> "SearchCache":
+        """Returns the cache shared by all the sites, stored next to config.json."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(get_cache_path(), SEARCH_CACHE_MAX_MB * 1024 * 1024)
+            return cls._instance
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.path, timeout=5, check_same_thread=False)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS search ("
+                "site TEXT NOT NULL, domain TEXT NOT NULL, query TEXT NOT NULL, "
+                "results TEXT NOT NULL, size INTEGER NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL, "
+                "PRIMARY KEY (site, domain, query))"
+            )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS search_accessed ON search (accessed)")
+        return self.conn
+
+    def get(self, site: str, domain: str, query: str) -> Optional[Tuple[List[Dict], float]]:
+        """
+        Read an entry and mark it as recently used.
+
+        Returns:
+            tuple: The results and their age in seconds, None if there is no entry.
+        """
+        try:
+            with self.lock:
+                conn = self._connect()
+                row = conn.execute("SELECT results, created FROM search WHERE site = ? AND domain = ? AND query = ?", (site, domain, query)).fetchone()
+                if row is None:
+                    return None
+
+                with conn:
+                    conn.execute("UPDATE search SET accessed = ? WHERE site = ? AND domain = ? AND query = ?", (time.time(), site, domain, query))
+
+            return json.loads(row[0]), time.time() - row[1]
+
+        except (sqlite3.Error, ValueError) as e:
+            logging.warning(f"Search cache read failed: {e}")
+            return None
+
+    def put(self, site: str, domain: str, query: str, results: List[Dict]) -> None:
+        """Store the results of a search, then evict the oldest entries if the cache is too large."""
+        try:
+            data = json.dumps(results, default=str)
+            now = time.time()
+
+            with self.lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO search (site, domain, query, results, size, created, accessed) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (site, domain, query, data, len(data), now, now)
+                    )
+                    evict_lru(conn, "search", self.max_bytes)
+
+        except sqlite3.Error as e:
+            logging.warning(f"Search cache write failed: {e}")
+
+    def revalidate(self, site: str, domain: str, query: str, fetch: Callable[[], Optional[List[Dict]]]) -> None:
+        """
+        Refresh an entry in a background thread, once at a time for the same key.
+
+        Parameters:
+            - fetch (Callable): Runs the search and returns its results, None to keep the entry.
+        """
+        key = (site, domain, query)
+        with self.lock:
+            if key in self.revalidating:
+                return
+            self.revalidating.add(key)
+
+        def run():
+            try:
+                results = fetch()
+                if results:
+                    self.put(site, domain, query, results)
+                    logging.info(f"Search cache: revalidated {site} '{query}', {len(results)} results")
+
+            except Exception as e:
+                logging.warning(f"Search cache: revalidation of {site} '{query}' failed: {e}")
+
+            finally:
+                with self.lock:
+                    self.revalidating.discard(key)
+
+        threading.Thread(target=run, name=f"revalidate-{site}", daemon=True).start()
+
+
+def send_cached_choices(results: List[Dict]) -> None:
+    """Send the list of results to the Telegram bot, as the search of the site does."""
+    choices = []
+    for i, item in enumerate(results):
+        choice_text = f"{i} - {item.get('name')} ({item.get('type')})"
+        if item.get('date'):
+            choice_text += f" - {item.get('date')}"
+        choices.append(choice_text)
+
+    if choices:
+        get_bot_instance().send_message("Lista dei risultati:", choices)
+
+
+def cached_title_search(media_search_manager: MediaManager, console: Console = None):
+    """
+    Decorator for the `title_search` of a site, the first parameter of the search must be the query.
+    A fresh entry fills `media_search_manager` without going to the network. An entry older than its TTL,
+    up to MAX_STALE_FACTOR times, is returned as well and refreshed in background.
+    Results are stored only when the search finds something, so errors are never cached.
+
+    Parameters:
+        - media_search_manager (MediaManager): Manager filled by the search of the site.
+        - console (Console): Console of the site, its output is hidden while the search runs in background.
+    """
+    def decorator(func: Callable[..., int]) -> Callable[..., int]:
+        site_constant = get_site_constant(func.__module__)
+
+        def search_in_background(query: str, args: tuple, kwargs: dict) -> Optional[List[Dict]]:
+            with media_search_manager.isolated() as media_list:
+                if console is not None:
+                    console.begin_capture()
+                try:
+                    found = func(query, *args, **kwargs)
+                finally:
+                    if console is not None:
+                        logging.info(console.end_capture())
+
+                return [item.__dict__.copy() for item in media_list] if found else None
+
+        @functools.wraps(func)
+        def wrapper(query: str, *args, **kwargs) -> int:
+            if not SEARCH_CACHE:
+                return func(query, *args, **kwargs)
+
+            site_name = site_constant.SITE_NAME
+            key_query = normalize_query(query)
+            try:
+                domain = site_constant.FULL_URL
+            except Exception:
+                domain = ""
+
+            cache = SearchCache.get_instance()
+            ttl = get_site_ttl(site_name)
+            entry = cache.get(site_name, domain, key_query)
+
+            if entry is not None:
+                results, age = entry
+                stale = age >= ttl
+
+                # The search of the site also talks to the bot, so stale entries are refreshed before answering
+                if age < ttl * MAX_STALE_FACTOR and not (stale and TELEGRAM_BOT):
+                    media_search_manager.clear()
+                    for item in results:
+                        media_search_manager.add_media(item)
+
+                    logging.info(f"Search cache: {site_name} '{key_query}' from cache, age {age:.0f}s{' (stale)' if stale else ''}")
+                    if stale:
+                        cache.revalidate(site_name, domain, key_query, lambda: search_in_background(query, args, kwargs))
+                    if TELEGRAM_BOT:
+                        send_cached_choices(results)
+
+                    return media_search_manager.get_length()
+
+            found = func(query, *args, **kwargs)
+            if found > 0:
+                cache.put(site_name, domain, key_query, [item.__dict__.copy() for item in media_search_manager.media_list])
+
+            return found
+
+        return wrapper
+
+    return decorator
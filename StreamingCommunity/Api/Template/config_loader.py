@@ -1,16 +1,25 @@
 # 11.02.25
 
 import os
-import inspect
+import sys
 
 
 # Internal utilities
 from StreamingCommunity.Util.config_json import config_manager
 
 
+# Variable
+site_constants = {}
+
+
 def get_site_name_from_stack():
-    for frame_info in inspect.stack():
-        file_path = frame_info.filename
+    """
+    Find the site package of the caller from the `__init__.py` of a site on the call stack.
+    Only the frames are walked, without reading the source of each one like `inspect.stack()`.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        file_path = frame.f_code.co_filename
         
         if "__init__" in file_path:
             parts = file_path.split(f"Site{os.sep}")
@@ -18,13 +27,44 @@ def get_site_name_from_stack():
             if len(parts) > 1:
                 site_name = parts[1].split(os.sep)[0]
                 return site_name
+        
+        frame = frame.f_back
     
     return None
 
 
+def get_site_constant(module_name: str) -> "SiteConstant":
+    """
+    Return the constants of the site package a module belongs to, bound once at import.
+
+    Parameters:
+        - module_name (str): `__name__` of the module, e.g. 'StreamingCommunity.Api.Site.raiplay.film'.
+
+    Returns:
+        SiteConstant: Shared by all the modules of the same site.
+    """
+    parts = module_name.split('.')
+    site_name = parts[parts.index('Site') + 1] if 'Site' in parts[:-1] else None
+
+    if site_name not in site_constants:
+        site_constants[site_name] = SiteConstant(site_name)
+    return site_constants[site_name]
+
+
 class SiteConstant:
+    def __init__(self, site_name: str = None):
+        """
+        Constants of a site, read from the configuration.
+
+        Parameters:
+            - site_name (str): Folder of the site in Api/Site. When None, it is looked up on the call stack at every access.
+        """
+        self.site_name = site_name
+
     @property
     def SITE_NAME(self):
+        if self.site_name is not None:
+            return self.site_name
         return get_site_name_from_stack()
     
     @property
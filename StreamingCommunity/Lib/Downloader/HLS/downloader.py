@@ -3,8 +3,11 @@
 import os
 import re
 import time
+import signal
 import logging
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from typing import Any, Dict, List, Optional
 
 
@@ -25,11 +28,14 @@ from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance
 from ...FFmpeg import (
     print_duration_table,
     join_video,
-    join_audios,
-    join_subtitle
+    join_all,
+    open_video_pipe,
+    close_video_pipe,
+    is_transcode,
+    FFmpegScheduler
 )
-from ...M3U8 import M3U8_Parser, M3U8_UrlFix
-from .segments import M3U8_Segments
+from ...M3U8 import M3U8_Parser, M3U8_Codec, M3U8_UrlFix
+from .segments import M3U8_Segments, WorkerBudget
 
 
 # Config
@@ -40,6 +46,12 @@ DOWNLOAD_SPECIFIC_SUBTITLE = config_manager.get_list('M3U8_DOWNLOAD', 'specific_
 MERGE_AUDIO = config_manager.get_bool('M3U8_DOWNLOAD', 'merge_audio')
 MERGE_SUBTITLE = config_manager.get_bool('M3U8_DOWNLOAD', 'merge_subs')
 CLEANUP_TMP = config_manager.get_bool('M3U8_DOWNLOAD', 'cleanup_tmp_folder')
+RESUME_DOWNLOAD = config_manager.get_bool('M3U8_DOWNLOAD', 'resume_download')
+PARALLEL_TRACKS = config_manager.get_bool('M3U8_DOWNLOAD', 'parallel_tracks')
+MAX_TOTAL_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'max_total_workers')
+DEFAULT_VIDEO_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'default_video_workser')
+STREAM_TO_FFMPEG = config_manager.get_bool('M3U8_DOWNLOAD', 'stream_to_ffmpeg')
+MERGE_IN_BACKGROUND = config_manager.get_bool('M3U8_CONVERSION', 'merge_in_background')
 FILTER_CUSTOM_REOLUTION = str(config_manager.get('M3U8_PARSER', 'force_resolution')).strip().lower()
 GET_ONLY_LINK = config_manager.get_bool('M3U8_PARSER', 'get_only_link')
 RETRY_LIMIT = config_manager.get_int('REQUESTS', 'max_retry')
@@ -246,35 +258,67 @@ class DownloadManager:
         self.missing_segments = []
         self.stopped = False
 
-    def download_video(self, video_url: str):
-        """Downloads video segments from the M3U8 playlist."""
-        video_full_url = self.url_fixer.generate_full_url(video_url)
-        video_tmp_dir = os.path.join(self.temp_dir, 'video')
+        # Tracks downloaded in parallel share one worker budget
+        self.worker_budget: Optional[WorkerBudget] = None
+        self.active_downloaders: List[M3U8_Segments] = []
+        self.active_lock = threading.Lock()
+
+    def _download_track(self, url: str, tmp_dir: str, description: str, stream_type: str, priority: int = 0, position: Optional[int] = None, output_stream=None) -> bool:
+        """Downloads the segments of one track, registering it to receive forwarded interrupts."""
+        downloader = M3U8_Segments(
+            url=url,
+            tmp_folder=tmp_dir,
+            worker_budget=self.worker_budget,
+            priority=priority,
+            position=position,
+            output_stream=output_stream
+        )
+
+        with self.active_lock:
+            self.active_downloaders.append(downloader)
+
+        try:
+            result = downloader.download_streams(description, stream_type)
+        finally:
+            with self.active_lock:
+                self.active_downloaders.remove(downloader)
 
-        downloader = M3U8_Segments(url=video_full_url, tmp_folder=video_tmp_dir)
-        result = downloader.download_streams("Video", "video")
         self.missing_segments.append(result)
 
         if result.get('stopped', False):
             self.stopped = True
-        
         return self.stopped
 
-    def download_audio(self, audio: Dict):
+    def download_video(self, video_url: str, position: Optional[int] = None):
+        """Downloads video segments from the M3U8 playlist."""
+        video_full_url = self.url_fixer.generate_full_url(video_url)
+        video_tmp_dir = os.path.join(self.temp_dir, 'video')
+        return self._download_track(video_full_url, video_tmp_dir, "Video", "video", priority=0, position=position)
+
+    def download_video_to_file(self, video_url: str, out_path: str, codec: Optional[M3U8_Codec] = None):
+        """
+        Downloads the video segments straight into FFmpeg, which remuxes them to `out_path` while they arrive.
+        No intermediate 0.ts is written.
+        """
+        video_full_url = self.url_fixer.generate_full_url(video_url)
+        video_tmp_dir = os.path.join(self.temp_dir, 'video')
+
+        process = open_video_pipe(out_path, codec)
+        try:
+            self._download_track(video_full_url, video_tmp_dir, "Video", "video", output_stream=process.stdin)
+        finally:
+            close_video_pipe(process, out_path)
+
+        return self.stopped
+
+    def download_audio(self, audio: Dict, position: Optional[int] = None):
         """Downloads audio segments for a specific language track."""
         #if self.stopped:
         #    return True
 
         audio_full_url = self.url_fixer.generate_full_url(audio['uri'])
         audio_tmp_dir = os.path.join(self.temp_dir, 'audio', audio['language'])
-
-        downloader = M3U8_Segments(url=audio_full_url, tmp_folder=audio_tmp_dir)
-        result = downloader.download_streams(f"Audio {audio['language']}", "audio")
-        self.missing_segments.append(result)
-
-        if result.get('stopped', False):
-            self.stopped = True
-        return self.stopped
+        return self._download_track(audio_full_url, audio_tmp_dir, f"Audio {audio['language']}", "audio", priority=1, position=position)
 
     def download_subtitle(self, sub: Dict):
         """Downloads and saves subtitle file for a specific language."""
@@ -299,36 +343,85 @@ class DownloadManager:
         """
         Downloads all selected streams (video, audio, subtitles).
         """
-        return_stopped = False
+        jobs = []
 
-        video_file = os.path.join(self.temp_dir, 'video', '0.ts')
-        if not os.path.exists(video_file):
-            if self.download_video(video_url):
-                if not return_stopped:
-                    return_stopped = True
+        video_dir = os.path.join(self.temp_dir, 'video')
+        if not M3U8_Segments.is_download_complete(video_dir):
+            jobs.append((self.download_video, video_url))
 
         for audio in audio_streams:
-            #if self.stopped:
-            #    break
-
-            audio_file = os.path.join(self.temp_dir, 'audio', audio['language'], '0.ts')
-            if not os.path.exists(audio_file):
-                if self.download_audio(audio):
-                    if not return_stopped:
-                        return_stopped = True
+            audio_dir = os.path.join(self.temp_dir, 'audio', audio['language'])
+            if not M3U8_Segments.is_download_complete(audio_dir):
+                jobs.append((self.download_audio, audio))
 
         for sub in sub_streams:
-            #if self.stopped:
-            #    break
-
             sub_file = os.path.join(self.temp_dir, 'subs', f"{sub['language']}.vtt")
             if not os.path.exists(sub_file):
-                if self.download_subtitle(sub):
-                    if not return_stopped:
-                        return_stopped = True
+                jobs.append((self.download_subtitle, sub))
+
+        if PARALLEL_TRACKS and len(jobs) > 1:
+            return self._download_parallel(jobs)
+
+        return_stopped = False
+        for download, arg in jobs:
+            if download(arg):
+                if not return_stopped:
+                    return_stopped = True
+
+        return return_stopped
+
+    def _download_parallel(self, jobs: List) -> bool:
+        """
+        Downloads all tracks at the same time under one worker budget, video requests are served first.
+        Ctrl+C is caught in the main thread and forwarded to every running track.
+        """
+        self.worker_budget = WorkerBudget(MAX_TOTAL_WORKERS or DEFAULT_VIDEO_WORKERS)
+
+        def interrupt_handler(signum, frame):
+            with self.active_lock:
+                downloaders = list(self.active_downloaders)
+            for downloader in downloaders:
+                downloader.handle_interrupt()
+
+        previous_handler = None
+        if threading.current_thread() is threading.main_thread():
+            previous_handler = signal.signal(signal.SIGINT, interrupt_handler)
+
+        return_stopped = False
+        try:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = []
+                position = 0
+                for download, arg in jobs:
+                    if download == self.download_subtitle:
+                        futures.append(executor.submit(download, arg))
+                    else:
+                        futures.append(executor.submit(download, arg, position))
+                        position += 1
+
+                # Wait with a timeout so the main thread keeps handling signals
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if future.result():
+                            return_stopped = True
+
+        finally:
+            self.worker_budget = None
+            if previous_handler is not None:
+                signal.signal(signal.SIGINT, previous_handler)
 
         return return_stopped
 
+    def is_complete(self, audio_streams: List[Dict]) -> bool:
+        """
+        Check if the video and every audio track have been fully downloaded.
+        """
+        track_dirs = [os.path.join(self.temp_dir, 'video')]
+        track_dirs += [os.path.join(self.temp_dir, 'audio', audio['language']) for audio in audio_streams]
+        return all(M3U8_Segments.is_download_complete(track_dir) for track_dir in track_dirs)
+
 
 class MergeManager:
     """Handles merging of video, audio, and subtitle streams."""
@@ -345,61 +438,64 @@ class MergeManager:
         self.audio_streams = audio_streams
         self.sub_streams = sub_streams
 
-    def merge(self) -> str:
+    def merge(self, progress_callback=None, cancel_event: Optional[threading.Event] = None) -> str:
         """
         Merges downloaded streams into final video file.
         Returns path to the final merged file.
+        `progress_callback` and `cancel_event` are forwarded to FFmpeg, see FFmpegScheduler.
 
         Process:
-        1. If no audio/subs, just process video
-        2. If audio exists, merge with video
-        3. If subtitles exist, add them to the video
+        1. If no audio/subs to merge, just process video
+        2. Otherwise map video, every audio track and every subtitle in a single FFmpeg pass
         """
         video_file = os.path.join(self.temp_dir, 'video', '0.ts')
-        merged_file = video_file
 
-        if not self.audio_streams and not self.sub_streams:
-            merged_file = join_video(
+        audio_tracks = []
+        if MERGE_AUDIO:
+            audio_tracks = [{
+                'path': os.path.join(self.temp_dir, 'audio', a['language'], '0.ts'),
+                'name': a['language']
+            } for a in self.audio_streams]
+
+        sub_tracks = []
+        if MERGE_SUBTITLE:
+            sub_tracks = [{
+                'path': os.path.join(self.temp_dir, 'subs', f"{s['language']}.vtt"),
+                'language': s['language']
+            } for s in self.sub_streams]
+
+        if not audio_tracks and not sub_tracks:
+            return join_video(
                 video_path=video_file,
                 out_path=os.path.join(self.temp_dir, 'video.mp4'),
-                codec=self.parser.codec
+                codec=self.parser.codec,
+                progress_callback=progress_callback,
+                cancel_event=cancel_event
             )
 
-        else:
-            if MERGE_AUDIO and self.audio_streams:
-                audio_tracks = [{
-                    'path': os.path.join(self.temp_dir, 'audio', a['language'], '0.ts'),
-                    'name': a['language']
-                } for a in self.audio_streams]
-
-                merged_audio_path = os.path.join(self.temp_dir, 'merged_audio.mp4')
-                merged_file = join_audios(
-                    video_path=video_file,
-                    audio_tracks=audio_tracks,
-                    out_path=merged_audio_path,
-                    codec=self.parser.codec
-                )
-
-            if MERGE_SUBTITLE and self.sub_streams:
-                sub_tracks = [{
-                    'path': os.path.join(self.temp_dir, 'subs', f"{s['language']}.vtt"),
-                    'language': s['language']
-                } for s in self.sub_streams]
-
-                merged_subs_path = os.path.join(self.temp_dir, 'final.mp4')
-                merged_file = join_subtitle(
-                    video_path=merged_file,
-                    subtitles_list=sub_tracks,
-                    out_path=merged_subs_path
-                )
-
-        return merged_file
+        return join_all(
+            video_path=video_file,
+            audio_tracks=audio_tracks,
+            subtitles_list=sub_tracks,
+            out_path=os.path.join(self.temp_dir, 'final.mp4'),
+            codec=self.parser.codec,
+            progress_callback=progress_callback,
+            cancel_event=cancel_event
+        )
 
 
 class HLS_Downloader:
     """Main class for HLS video download and processing."""
-    def __init__(self, m3u8_url: str, output_path: Optional[str] = None):
+    def __init__(self, m3u8_url: str, output_path: Optional[str] = None, merge_in_background: Optional[bool] = None):
+        """
+        Args:
+            m3u8_url: URL of the master or index playlist
+            output_path: Path of the final MP4
+            merge_in_background: Queue the merge on the FFmpegScheduler and return right after the download,
+                None to follow 'merge_in_background' of M3U8_CONVERSION
+        """
         self.m3u8_url = m3u8_url
+        self.merge_in_background = MERGE_IN_BACKGROUND if merge_in_background is None else merge_in_background
         self.path_manager = PathManager(m3u8_url, output_path)
         self.client = HLSClient()
         self.m3u8_manager = M3U8Manager(m3u8_url, self.client)
@@ -462,6 +558,16 @@ class HLS_Downloader:
                 url_fixer=self.m3u8_manager.url_fixer
             )
 
+            # Video only: remux while downloading, no intermediate .ts and no merge step
+            if STREAM_TO_FFMPEG and not self.m3u8_manager.audio_streams and not self.m3u8_manager.sub_streams:
+                final_file = os.path.join(self.path_manager.temp_dir, 'video.mp4')
+                download_stopped = self.download_manager.download_video_to_file(
+                    video_url=self.m3u8_manager.video_url,
+                    out_path=final_file,
+                    codec=self.m3u8_manager.parser.codec
+                )
+                return self._finalize(final_file, download_stopped)
+
             # Check if download was stopped
             download_stopped = self.download_manager.download_all(
                 video_url=self.m3u8_manager.video_url,
@@ -469,6 +575,18 @@ class HLS_Downloader:
                 sub_streams=self.m3u8_manager.sub_streams
             )
 
+            # Keep the temporary folder of an interrupted download, the next run resumes it
+            if RESUME_DOWNLOAD and download_stopped and not self.download_manager.is_complete(self.m3u8_manager.audio_streams):
+                console.print(f"[yellow]Download paused, run it again to resume from [cyan]{self.path_manager.temp_dir}")
+                return {
+                    'path': None,
+                    'url': self.m3u8_url,
+                    'is_master': self.m3u8_manager.is_master,
+                    'msg': 'Download paused',
+                    'error': None,
+                    'stopped': True
+                }
+
             self.merge_manager = MergeManager(
                 temp_dir=self.path_manager.temp_dir,
                 parser=self.m3u8_manager.parser,
@@ -476,19 +594,27 @@ class HLS_Downloader:
                 sub_streams=self.m3u8_manager.sub_streams
             )
 
-            final_file = self.merge_manager.merge()
-            self.path_manager.move_final_file(final_file)
-            self._print_summary()
-            self.path_manager.cleanup()
+            # Remux in the background, the caller can start the next download meanwhile
+            if self.merge_in_background and not download_stopped:
+                job = FFmpegScheduler.get_instance().submit(
+                    self._merge_and_finalize,
+                    download_stopped,
+                    description=os.path.basename(self.path_manager.output_path),
+                    transcode=is_transcode(self.m3u8_manager.parser.codec)
+                )
+                console.print(f"[cyan]Merge of [bold]{os.path.basename(self.path_manager.output_path)}[/bold] queued in background")
+                return {
+                    'path': self.path_manager.output_path,
+                    'url': self.m3u8_url,
+                    'is_master': self.m3u8_manager.is_master,
+                    'msg': 'Merge queued',
+                    'error': None,
+                    'stopped': False,
+                    'merge_job': job
+                }
 
-            return {
-                'path': self.path_manager.output_path,
-                'url': self.m3u8_url,
-                'is_master': self.m3u8_manager.is_master,
-                'msg': None,
-                'error': None,
-                'stopped': download_stopped
-            }
+            final_file = self.merge_manager.merge()
+            return self._finalize(final_file, download_stopped)
 
         except Exception as e:
             error_msg = str(e)
@@ -504,6 +630,31 @@ class HLS_Downloader:
                 'stopped': False
             }
 
+    def _merge_and_finalize(self, download_stopped: bool, progress_callback=None, cancel_event: Optional[threading.Event] = None) -> Optional[Dict[str, Any]]:
+        """Merge step of `start` run by the FFmpegScheduler, a cancelled job keeps the temporary folder."""
+        final_file = self.merge_manager.merge(progress_callback=progress_callback, cancel_event=cancel_event)
+
+        if cancel_event is not None and cancel_event.is_set():
+            console.print(f"[yellow]Merge cancelled, files kept in [cyan]{self.path_manager.temp_dir}")
+            return None
+
+        return self._finalize(final_file, download_stopped)
+
+    def _finalize(self, final_file: str, download_stopped: bool) -> Dict[str, Any]:
+        """Moves the final file to the output path, prints the summary and removes the temporary files."""
+        self.path_manager.move_final_file(final_file)
+        self._print_summary()
+        self.path_manager.cleanup()
+
+        return {
+            'path': self.path_manager.output_path,
+            'url': self.m3u8_url,
+            'is_master': self.m3u8_manager.is_master,
+            'msg': None,
+            'error': None,
+            'stopped': download_stopped
+        }
+
     def _print_summary(self):
         """Prints download summary including file size, duration, and any missing segments."""
         if TELEGRAM_BOT:
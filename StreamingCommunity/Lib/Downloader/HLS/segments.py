@@ -2,16 +2,20 @@
 
 import os
 import sys
+import shutil
 import time
 import queue
+import asyncio
 import signal
+import weakref
 import logging
 import binascii
 import threading
+import importlib.util
 from queue import PriorityQueue
 from urllib.parse import urljoin, urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from typing import BinaryIO, Dict, List, Tuple
 
 
 # External libraries
@@ -29,6 +33,8 @@ from StreamingCommunity.Util.config_json import config_manager
 # Logic class
 from ...M3U8 import (
     M3U8_Decryption,
+    M3U8_SegmentDecryptor,
+    decrypt_segment,
     M3U8_Ts_Estimator,
     M3U8_Parser,
     M3U8_UrlFix
@@ -40,17 +46,385 @@ REQUEST_MAX_RETRY = config_manager.get_int('REQUESTS', 'max_retry')
 REQUEST_VERIFY = config_manager.get_bool('REQUESTS', 'verify')
 DEFAULT_VIDEO_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'default_video_workser')
 DEFAULT_AUDIO_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'default_audio_workser')
+ADAPTIVE_WORKERS = config_manager.get_bool('M3U8_DOWNLOAD', 'adaptive_workers')
+MAX_ADAPTIVE_WORKERS = config_manager.get_int('M3U8_DOWNLOAD', 'max_adaptive_workers')
 MAX_TIMEOOUT = config_manager.get_int("REQUESTS", "timeout")
 SEGMENT_MAX_TIMEOUT = config_manager.get_int("M3U8_DOWNLOAD", "segment_timeout")
+USE_HTTP2 = config_manager.get_bool('M3U8_DOWNLOAD', 'use_http2')
+MAX_BUFFER_SEGMENTS = config_manager.get_int('M3U8_DOWNLOAD', 'max_buffer_segments')
+MAX_BUFFER_MB = config_manager.get_int('M3U8_DOWNLOAD', 'max_buffer_mb')
+RESUME_DOWNLOAD = config_manager.get_bool('M3U8_DOWNLOAD', 'resume_download')
+SEGMENT_STORAGE = str(config_manager.get('M3U8_DOWNLOAD', 'segment_storage')).strip().lower()
+DECRYPTION_POOL = str(config_manager.get('M3U8_DOWNLOAD', 'decryption_pool')).strip().lower()
+DOWNLOAD_ENGINE = str(config_manager.get('M3U8_DOWNLOAD', 'download_engine')).strip().lower()
+DEBUG_MODE = config_manager.get_bool("DEFAULT", "debug")
 TELEGRAM_BOT = config_manager.get_bool('DEFAULT', 'telegram_bot')
 MAX_INTERRUPT_COUNT = 3
 
 # Variable
 console = Console()
+h2_installed = importlib.util.find_spec("h2") is not None
+COPY_CHUNK_SIZE = 4 * 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+JOURNAL_FILE_NAME = "segments.journal"
+JOURNAL_SYNC_INTERVAL = 2.0
+ADAPTIVE_MIN_WINDOW = 4
+ADAPTIVE_GAIN = 1.05
+ADAPTIVE_LATENCY_TOLERANCE = 2.0
+ADAPTIVE_LATENCY_SLACK = 0.05
+ADAPTIVE_COOLDOWN = 1.0
+
+
+def append_file(src_path: str, dst_fd: int) -> None:
+    """
+    Append the content of a file to an open file descriptor with large sequential copies.
+    Uses `copy_file_range` or `sendfile` so data stays in the kernel when the platform supports it.
+
+    Parameters:
+        - src_path (str): Path of the file to append.
+        - dst_fd (int): File descriptor opened for writing, positioned at the end.
+    """
+    with open(src_path, 'rb', buffering=0) as src:
+        remaining = os.fstat(src.fileno()).st_size
+
+        try:
+            if hasattr(os, 'copy_file_range'):
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst_fd, min(remaining, COPY_CHUNK_SIZE))
+                    if copied == 0:
+                        break
+                    remaining -= copied
+
+            elif hasattr(os, 'sendfile') and sys.platform.startswith('linux'):
+                while remaining > 0:
+                    copied = os.sendfile(dst_fd, src.fileno(), None, min(remaining, COPY_CHUNK_SIZE))
+                    if copied == 0:
+                        break
+                    remaining -= copied
+
+        except OSError as e:
+            logging.info(f"Kernel copy not available for {src_path}, falling back to user space copy: {e}")
+
+        # Copy whatever is left in user space
+        while remaining > 0:
+            chunk = src.read(min(remaining, COPY_CHUNK_SIZE))
+            if not chunk:
+                break
+            os.write(dst_fd, chunk)
+            remaining -= len(chunk)
+
+
+class SegmentJournal:
+    def __init__(self, path: str, sync_interval: float = JOURNAL_SYNC_INTERVAL):
+        """
+        Append-only record of the segments durably written to the output file.
+        Each line holds `<index> <offset> <size>`.
+
+        Parameters:
+            - path (str): Path of the journal file.
+            - sync_interval (float): Minimum seconds between two fsync of the output file and the journal.
+        """
+        self.path = path
+        self.sync_interval = sync_interval
+        self.pending: List[Tuple[int, int, int]] = []
+        self.last_sync = time.time()
+        self.file = None
+
+    def load(self) -> List[Tuple[int, int, int]]:
+        """Read the entries of an existing journal, ignoring a torn last line."""
+        entries = []
+        if not os.path.exists(self.path):
+            return entries
+
+        with open(self.path, 'r') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) != 3:
+                    continue
+
+                try:
+                    entries.append((int(parts[0]), int(parts[1]), int(parts[2])))
+                except ValueError:
+                    continue
+
+        return entries
+
+    def open(self, entries: List[Tuple[int, int, int]]) -> None:
+        """Rewrite the journal with the entries still valid and open it for appending."""
+        with open(f"{self.path}.tmp", 'w') as f:
+            f.write(''.join(f"{index} {offset} {size}\n" for index, offset, size in entries))
+        os.replace(f"{self.path}.tmp", self.path)
+
+        self.file = open(self.path, 'a')
+
+    def record(self, index: int, offset: int, size: int, data_file) -> None:
+        """Record a written segment, syncing to disk at most every `sync_interval` seconds."""
+        self.pending.append((index, offset, size))
+
+        if time.time() - self.last_sync >= self.sync_interval:
+            self.sync(data_file)
+
+    def sync(self, data_file) -> None:
+        """Make the output file durable first, then the journal entries that describe it."""
+        self.last_sync = time.time()
+        if not self.pending or self.file is None:
+            return
+
+        data_file.flush()
+        os.fsync(data_file.fileno())
+
+        self.file.write(''.join(f"{index} {offset} {size}\n" for index, offset, size in self.pending))
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.pending.clear()
+
+    def close(self, data_file=None) -> None:
+        """Flush the pending entries and close the journal."""
+        if self.file is None:
+            return
+
+        if data_file is not None:
+            self.sync(data_file)
+        self.file.close()
+        self.file = None
+
+    def remove(self) -> None:
+        """Delete the journal once the download is complete."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def _resolve_waiter(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AsyncWaiters:
+    def __init__(self):
+        """
+        Coroutines waiting on a state guarded by a `threading.Condition`, possibly from several event loops.
+        `add` and `wake_all` are called with the condition held, `wait` without it.
+        """
+        self.waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    def add(self) -> asyncio.Future:
+        """Register the calling coroutine, the returned future is resolved by the next `wake_all`."""
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self.waiters.append((loop, waiter))
+        return waiter
+
+    async def wait(self, waiter: asyncio.Future, cond: threading.Condition, timeout: float = 0.5) -> None:
+        """Wait for `waiter` at most `timeout` seconds, like `Condition.wait(timeout)`, so interrupts are still noticed."""
+        await asyncio.wait({waiter}, timeout=timeout)
+        if not waiter.done():
+            with cond:
+                self.waiters = [(loop, w) for loop, w in self.waiters if w is not waiter]
+
+    def wake_all(self) -> None:
+        """Resolve every registered future on its own event loop."""
+        for loop, waiter in self.waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve_waiter, waiter)
+            except RuntimeError:
+                pass    # The loop is already closed
+        self.waiters.clear()
+
+
+class WorkerBudget:
+    def __init__(self, total: int):
+        """
+        Limits the number of segment requests in flight across several tracks downloaded together.
+        When a slot frees up, it goes to the waiting request with the lowest priority value.
+
+        Parameters:
+            - total (int): Maximum number of concurrent requests.
+        """
+        self.total = max(1, total)
+        self.in_use = 0
+        self.waiting: Dict[int, int] = {}
+        self.cond = threading.Condition()
+        self.async_waiters = AsyncWaiters()
+
+    def _can_acquire(self, priority: int) -> bool:
+        """Check if a slot is free and no request with a higher priority is waiting for it."""
+        if self.in_use >= self.total:
+            return False
+        return not any(count > 0 for p, count in self.waiting.items() if p < priority)
+
+    def acquire(self, priority: int = 0) -> None:
+        """Block until a slot is available for `priority`."""
+        with self.cond:
+            self.waiting[priority] = self.waiting.get(priority, 0) + 1
+            try:
+                while not self._can_acquire(priority):
+                    self.cond.wait(0.5)
+                self.in_use += 1
+            finally:
+                self.waiting[priority] -= 1
+
+    async def acquire_async(self, priority: int = 0) -> None:
+        """Wait for a slot without blocking the event loop."""
+        with self.cond:
+            self.waiting[priority] = self.waiting.get(priority, 0) + 1
+
+        try:
+            while True:
+                with self.cond:
+                    if self._can_acquire(priority):
+                        self.in_use += 1
+                        return
+                    waiter = self.async_waiters.add()
+                await self.async_waiters.wait(waiter, self.cond)
+
+        finally:
+            with self.cond:
+                self.waiting[priority] -= 1
+                self._notify_all()
+
+    def _notify_all(self) -> None:
+        self.cond.notify_all()
+        self.async_waiters.wake_all()
+
+    def release(self) -> None:
+        """Give back a slot and wake up the waiting requests."""
+        with self.cond:
+            self.in_use = max(0, self.in_use - 1)
+            self._notify_all()
+
+
+class AdaptiveConcurrency:
+    def __init__(self, initial: int, maximum: int, minimum: int = 1):
+        """
+        AIMD limit on the segment requests in flight of one track.
+        Every window of about `limit` responses the limit grows by one if the throughput rose and the workers were all busy,
+        it is cut by half on timeouts, 429 and 5xx responses, and by a quarter when the time to first byte rises well above the lowest seen.
+
+        Parameters:
+            - initial (int): Starting limit, the configured worker count.
+            - maximum (int): Highest limit, also the size of the worker pool.
+            - minimum (int): Lowest limit.
+        """
+        self.maximum = max(1, maximum)
+        self.minimum = max(1, min(minimum, self.maximum))
+        self.limit = float(max(self.minimum, min(initial, self.maximum)))
+        self.peak_limit = self.limit
+        self.in_flight = 0
+        self.cond = threading.Condition()
+        self.async_waiters = AsyncWaiters()
+
+        self.base_latency = None
+        self.last_throughput = None
+        self.last_decrease = 0.0
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        self.window_start = time.perf_counter()
+        self.window_bytes = 0
+        self.window_latencies: List[float] = []
+        self.window_saturated = False
+
+    def _can_acquire(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def acquire(self) -> None:
+        """Block until the number of requests in flight is below the limit."""
+        with self.cond:
+            while not self._can_acquire():
+                self.cond.wait(0.5)
+            self.in_flight += 1
+            if self.in_flight >= int(self.limit):
+                self.window_saturated = True
+
+    async def acquire_async(self) -> None:
+        """Wait for a free slot without blocking the event loop."""
+        while True:
+            with self.cond:
+                if self._can_acquire():
+                    self.in_flight += 1
+                    if self.in_flight >= int(self.limit):
+                        self.window_saturated = True
+                    return
+                waiter = self.async_waiters.add()
+            await self.async_waiters.wait(waiter, self.cond)
+
+    def _notify_all(self) -> None:
+        self.cond.notify_all()
+        self.async_waiters.wake_all()
+
+    def release(self) -> None:
+        with self.cond:
+            self.in_flight = max(0, self.in_flight - 1)
+            self._notify_all()
+
+    def _decrease(self, factor: float, reason: str) -> None:
+        """Cut the limit at most once per cooldown, the requests already in flight report the same congestion."""
+        now = time.perf_counter()
+        if now - self.last_decrease < ADAPTIVE_COOLDOWN:
+            return
+
+        self.limit = max(float(self.minimum), self.limit * factor)
+        self.last_decrease = now
+        self.last_throughput = None
+        self._reset_window()
+        logging.info(f"Adaptive workers: limit {int(self.limit)} ({reason})")
+
+    def on_success(self, size: int, latency: float, retrying: int = 0) -> None:
+        """
+        Record a completed segment and adjust the limit at the end of each window.
+
+        Parameters:
+            - size (int): Bytes received.
+            - latency (float): Time to first byte of the response, in seconds.
+            - retrying (int): Segments waiting for a retry, the limit does not grow while there are any.
+        """
+        with self.cond:
+            self.window_bytes += size
+            self.window_latencies.append(latency)
+            if len(self.window_latencies) < max(ADAPTIVE_MIN_WINDOW, int(self.limit)):
+                return
+
+            elapsed = time.perf_counter() - self.window_start
+            throughput = self.window_bytes / elapsed if elapsed > 0 else 0.0
+            latency = sorted(self.window_latencies)[len(self.window_latencies) // 2]
+            saturated = self.window_saturated
+            self._reset_window()
+
+            if self.base_latency is None or latency < self.base_latency:
+                self.base_latency = latency
+
+            if latency > self.base_latency * ADAPTIVE_LATENCY_TOLERANCE + ADAPTIVE_LATENCY_SLACK:
+                self._decrease(0.75, f"latency {latency:.2f}s, lowest {self.base_latency:.2f}s")
+                return
+
+            rising = self.last_throughput is None or throughput > self.last_throughput * ADAPTIVE_GAIN
+            self.last_throughput = throughput
+
+            if rising and saturated and not retrying and self.limit < self.maximum:
+                self.limit = min(float(self.maximum), self.limit + 1)
+                self.peak_limit = max(self.peak_limit, self.limit)
+                logging.info(f"Adaptive workers: limit {int(self.limit)} ({throughput / (1024 * 1024):.1f} MB/s)")
+                self._notify_all()
+
+    def on_failure(self, error: Exception) -> None:
+        """Shrink the limit if the error is a sign that the server is overloaded."""
+        if isinstance(error, httpx.HTTPStatusError):
+            status = error.response.status_code
+            if status != 429 and status < 500:
+                return
+            reason = f"status {status}"
+        elif isinstance(error, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)):
+            reason = type(error).__name__
+        else:
+            return
+
+        with self.cond:
+            self._decrease(0.5, reason)
 
 
 class M3U8_Segments:
-    def __init__(self, url: str, tmp_folder: str, is_index_url: bool = True):
+    def __init__(self, url: str, tmp_folder: str, is_index_url: bool = True, worker_budget: WorkerBudget = None, priority: int = 0, position: int = None, output_stream: BinaryIO = None):
         """
         Initializes the M3U8_Segments object.
 
@@ -58,16 +432,33 @@ class M3U8_Segments:
             - url (str): The URL of the M3U8 playlist.
             - tmp_folder (str): The temporary folder to store downloaded segments.
             - is_index_url (bool): Flag indicating if `m3u8_index` is a URL (default True).
+            - worker_budget (WorkerBudget): Budget shared with the other tracks downloaded at the same time.
+            - priority (int): Priority of this track in the shared budget (lower first).
+            - position (int): Line of the progress bar when several tracks are displayed together.
+            - output_stream (BinaryIO): Write the segments to this stream (e.g. FFmpeg stdin) instead of 0.ts. It is closed at the end.
         """
         self.url = url
         self.tmp_folder = tmp_folder
         self.is_index_url = is_index_url
+        self.worker_budget = worker_budget
+        self.priority = priority
+        self.position = position
         self.expected_real_time = None
         self.tmp_file_path = os.path.join(self.tmp_folder, "0.ts")
+        self.segments_folder = os.path.join(self.tmp_folder, "segments")
+        self.output_stream = output_stream
+        self.stage_on_disk = SEGMENT_STORAGE == "disk" and output_stream is None
         os.makedirs(self.tmp_folder, exist_ok=True)
 
+        # Resume
+        self.journal: SegmentJournal = None
+        self.journal_path = os.path.join(self.tmp_folder, JOURNAL_FILE_NAME)
+        self.resume_offset = 0
+
         # Util class
         self.decryption: M3U8_Decryption = None 
+        self.media_sequence = 0
+        self.decrypt_executor: Executor = None
         self.class_ts_estimator = M3U8_Ts_Estimator(0, self) 
         self.class_url_fixer = M3U8_UrlFix(url)
 
@@ -76,6 +467,13 @@ class M3U8_Segments:
         self.buffer = {}
         self.expected_index = 0 
 
+        # Reorder window: bytes handed to the writer but not yet on disk
+        self.window_cond = threading.Condition()
+        self.window_waiters = AsyncWaiters()
+        self.pending_bytes = 0
+        self.max_buffer_segments = MAX_BUFFER_SEGMENTS
+        self.max_buffer_bytes = MAX_BUFFER_MB * 1024 * 1024
+
         self.stop_event = threading.Event()
         self.downloaded_segments = set()
         self.base_timeout = 0.5
@@ -95,6 +493,15 @@ class M3U8_Segments:
         self.active_retries = 0 
         self.active_retries_lock = threading.Lock()
 
+        # Connection pool shared by all workers
+        self.max_workers = None
+        self.concurrency: AdaptiveConcurrency = None
+        self.client: httpx.Client = None
+        self.client_lock = threading.Lock()
+        self.seen_connections = weakref.WeakSet()
+        self.info_poolHit = 0
+        self.info_poolMiss = 0
+
     def __get_key__(self, m3u8_parser: M3U8_Parser) -> bytes:
         """
         Fetches the encryption key from the M3U8 playlist.
@@ -131,6 +538,7 @@ class M3U8_Segments:
         m3u8_parser.parse_data(uri=self.url, raw_content=m3u8_content)
 
         self.expected_real_time_s = m3u8_parser.duration
+        self.media_sequence = m3u8_parser.media_sequence
 
         if m3u8_parser.keys:
             key = self.__get_key__(m3u8_parser)    
@@ -156,6 +564,12 @@ class M3U8_Segments:
             - Parses the M3U8 content using `parse_data`.
             - Saves the playlist to a temporary folder.
         """
+        playlist_path = os.path.join(self.tmp_folder, "playlist.m3u8")
+        if self.is_index_url and self._can_resume() and os.path.exists(playlist_path):
+            with open(playlist_path, "r") as f:
+                self.parse_data(f.read())
+            return
+
         if self.is_index_url:
             try:
                 client_params = {'headers': {'User-Agent': get_userAgent()}, 'timeout': MAX_TIMEOOUT}
@@ -163,49 +577,404 @@ class M3U8_Segments:
                 response.raise_for_status()
                 
                 self.parse_data(response.text)
-                with open(os.path.join(self.tmp_folder, "playlist.m3u8"), "w") as f:
+                with open(playlist_path, "w") as f:
                     f.write(response.text)
                     
             except Exception as e:
                 raise RuntimeError(f"M3U8 info retrieval failed: {e}")
     
-    def setup_interrupt_handler(self):
+    @staticmethod
+    def is_download_complete(tmp_folder: str) -> bool:
         """
-        Set up a signal handler for graceful interruption.
+        Check if a previous download in `tmp_folder` produced a complete 0.ts.
+        An interrupted download leaves its journal (or staged segments) behind and can be resumed.
         """
-        def interrupt_handler(signum, frame):
-            with self.interrupt_lock:
-                self.interrupt_count += 1
-                if self.interrupt_count >= MAX_INTERRUPT_COUNT:
-                    self.force_stop = True
-                    
-            if self.force_stop:
-                console.print("\n[red]Force stop triggered! Exiting immediately.")
+        return (
+            os.path.exists(os.path.join(tmp_folder, "0.ts"))
+            and not os.path.exists(os.path.join(tmp_folder, JOURNAL_FILE_NAME))
+            and not os.path.isdir(os.path.join(tmp_folder, "segments"))
+        )
+
+    def _can_resume(self) -> bool:
+        """Check if an interrupted download was left in the temporary folder."""
+        if not RESUME_DOWNLOAD or self.output_stream is not None:
+            return False
+
+        if self.stage_on_disk:
+            return os.path.isdir(self.segments_folder)
+        return os.path.exists(self.journal_path) and os.path.exists(self.tmp_file_path)
+
+    def _load_resume_state(self) -> None:
+        """
+        Mark the segments already saved by an interrupted download as downloaded.
+
+        In memory mode the journal is replayed from segment 0 and stops at the first gap, or at an
+        entry that does not match the file on disk. The output file is then truncated to the end of
+        the last valid segment and every following segment is fetched again.
+        In disk mode every staged segment file is already complete.
+        """
+        if not RESUME_DOWNLOAD or self.output_stream is not None:
+            return
+
+        if self.stage_on_disk:
+            if os.path.isdir(self.segments_folder):
+                for file_name in os.listdir(self.segments_folder):
+                    if file_name.endswith(".ts") and file_name[:-3].isdigit():
+                        index = int(file_name[:-3])
+                        if index < len(self.segments):
+                            self.downloaded_segments.add(index)
+            return
+
+        self.journal = SegmentJournal(self.journal_path)
+        entries = self.journal.load() if self._can_resume() else []
+        file_size = os.path.getsize(self.tmp_file_path) if entries else 0
+        entries_by_index = {index: (offset, size) for index, offset, size in entries}
+
+        valid_entries = []
+        end_offset = 0
+        while len(valid_entries) in entries_by_index and len(valid_entries) < len(self.segments):
+            offset, size = entries_by_index[len(valid_entries)]
+            if offset != end_offset or offset + size > file_size:
+                break
+
+            valid_entries.append((len(valid_entries), offset, size))
+            end_offset += size
 
+        self.resume_offset = end_offset
+        self.expected_index = len(valid_entries)
+        self.downloaded_segments.update(range(len(valid_entries)))
+        self.journal.open(valid_entries)
+
+        if valid_entries:
+            console.print(f"[cyan]Resuming from segment [green]{len(valid_entries)}[cyan] of [green]{len(self.segments)}")
+
+    def _open_output_file(self):
+        """Open 0.ts for writing, keeping the part recorded in the journal when resuming."""
+        if self.output_stream is not None:
+            return self.output_stream
+
+        if self.resume_offset > 0:
+            f = open(self.tmp_file_path, 'r+b')
+            f.truncate(self.resume_offset)
+            f.seek(self.resume_offset)
+            return f
+
+        return open(self.tmp_file_path, 'wb')
+
+    def _finalize_resume_state(self) -> None:
+        """Drop the journal once the download ran to the end, keep it if it was interrupted."""
+        if self.journal is not None:
+            if self.interrupt_flag.is_set():
+                self.journal.close()
             else:
-                if not self.interrupt_flag.is_set():
-                    remaining = MAX_INTERRUPT_COUNT - self.interrupt_count
-                    console.print(f"\n[red]- Stopping gracefully... (Ctrl+C {remaining}x to force)")
-                    self.download_interrupted = True
+                self.journal.remove()
+
+    def handle_interrupt(self):
+        """
+        Register a Ctrl+C, the download stops gracefully and is forced after `MAX_INTERRUPT_COUNT` presses.
+        """
+        with self.interrupt_lock:
+            self.interrupt_count += 1
+            if self.interrupt_count >= MAX_INTERRUPT_COUNT:
+                self.force_stop = True
+                
+        if self.force_stop:
+            console.print("\n[red]Force stop triggered! Exiting immediately.")
+
+        else:
+            if not self.interrupt_flag.is_set():
+                remaining = MAX_INTERRUPT_COUNT - self.interrupt_count
+                console.print(f"\n[red]- Stopping gracefully... (Ctrl+C {remaining}x to force)")
+                self.download_interrupted = True
 
-                    if remaining == 1:
-                        self.interrupt_flag.set()
+                if remaining == 1:
+                    self.interrupt_flag.set()
 
+    def setup_interrupt_handler(self):
+        """
+        Set up a signal handler for graceful interruption.
+        Tracks downloaded in parallel run outside the main thread, their interrupts are forwarded by the caller.
+        """
+        def interrupt_handler(signum, frame):
+            self.handle_interrupt()
                     
         if threading.current_thread() is threading.main_thread():
             signal.signal(signal.SIGINT, interrupt_handler)
-        else:
+        elif self.worker_budget is None:
             print("Signal handler must be set in the main thread")
 
-    def _get_http_client(self):
-        client_params = {
+    def _get_client_params(self) -> Dict:
+        """
+        Build the parameters of the connection pool shared by all segment workers.
+        The pool is sized to the number of workers so each worker can keep its own connection open.
+        """
+        pool_size = self.max_workers or DEFAULT_VIDEO_WORKERS
+
+        use_http2 = USE_HTTP2
+        if use_http2 and not h2_installed:
+            logging.warning("HTTP/2 requested but 'h2' is not installed, falling back to HTTP/1.1")
+            use_http2 = False
+
+        return {
             'headers': {'User-Agent': get_userAgent()},
             'timeout': SEGMENT_MAX_TIMEOUT,
             'follow_redirects': True,
-            'http2': False
+            'http2': use_http2,
+            'limits': httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
         }
-        return httpx.Client(**client_params)
-                            
+
+    def _get_http_client(self) -> httpx.Client:
+        """
+        Returns the keep-alive client shared by all segment workers, creating it on first use.
+        """
+        with self.client_lock:
+            if self.client is None:
+                self.client = httpx.Client(**self._get_client_params())
+
+            return self.client
+
+    def _close_http_client(self) -> None:
+        """Close the shared client and release all pooled connections."""
+        with self.client_lock:
+            if self.client is not None:
+                self.client.close()
+                self.client = None
+
+    def _track_connection(self, response: httpx.Response) -> None:
+        """
+        Count whether a response was served over an already open connection (hit) or a new one (miss).
+        """
+        network_stream = response.extensions.get("network_stream")
+        if network_stream is None:
+            return
+
+        # Keep the stream itself: the id of a closed connection can be reused by a new one
+        with self.client_lock:
+            if network_stream in self.seen_connections:
+                self.info_poolHit += 1
+            else:
+                self.seen_connections.add(network_stream)
+                self.info_poolMiss += 1
+
+    def _window_has_room(self, index: int) -> bool:
+        """
+        Check if segment `index` can be fetched without growing the reorder window past its limits.
+        The next segment expected by the writer is always admitted, so the window can never deadlock.
+        """
+        if self.stage_on_disk or index <= self.expected_index:
+            return True
+
+        if self.max_buffer_segments > 0 and index - self.expected_index >= self.max_buffer_segments:
+            return False
+
+        if self.max_buffer_bytes > 0 and self.pending_bytes >= self.max_buffer_bytes:
+            return False
+
+        return True
+
+    def _wait_for_window(self, index: int) -> bool:
+        """
+        Block the calling worker until segment `index` fits in the reorder window.
+
+        Returns:
+            bool: False if the download was interrupted while waiting.
+        """
+        with self.window_cond:
+            while not self._window_has_room(index):
+                if self.interrupt_flag.is_set() or self.stop_event.is_set():
+                    return False
+                self.window_cond.wait(timeout=0.5)
+
+        return True
+
+    async def _wait_for_window_async(self, index: int) -> bool:
+        """Asyncio counterpart of `_wait_for_window`, woken by the writer instead of polling."""
+        while True:
+            with self.window_cond:
+                if self._window_has_room(index):
+                    return True
+                if self.interrupt_flag.is_set() or self.stop_event.is_set():
+                    return False
+                waiter = self.window_waiters.add()
+
+            await self.window_waiters.wait(waiter, self.window_cond)
+
+    def _release_window(self, size: int) -> None:
+        """Called by the writer once `size` bytes are on disk, waking up the waiting workers."""
+        with self.window_cond:
+            self.pending_bytes -= size
+            self.window_cond.notify_all()
+            self.window_waiters.wake_all()
+
+    def _new_segment_decryptor(self, index: int) -> M3U8_SegmentDecryptor:
+        """Return the decryptor of segment `index`, or None if the stream is not encrypted."""
+        if self.decryption is None:
+            return None
+        return self.decryption.segment_decryptor(self.media_sequence + index)
+
+    def _start_decrypt_pool(self) -> None:
+        """
+        Start the pool that decrypts whole segments away from the download workers, if configured.
+            - "thread": pycryptodomex releases the GIL while decrypting, so a thread pool can run on several cores.
+            - "process": separate processes, the ciphertext is copied to the worker process. Frozen executables fall back to threads.
+        """
+        if self.decryption is None or DECRYPTION_POOL not in ("thread", "process"):
+            return
+
+        pool_size = os.cpu_count() or 1
+        if DECRYPTION_POOL == "process" and not getattr(sys, 'frozen', False):
+            self.decrypt_executor = ProcessPoolExecutor(max_workers=pool_size)
+        else:
+            self.decrypt_executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="decrypt")
+
+    def _submit_decrypt(self, ciphertext: bytes, index: int):
+        """Queue the decryption of a whole segment on the decrypt pool."""
+        return self.decrypt_executor.submit(
+            decrypt_segment,
+            self.decryption.key,
+            self.decryption.iv,
+            self.decryption.method,
+            self.media_sequence + index,
+            ciphertext
+        )
+
+    def _read_segment(self, response: httpx.Response, index: int) -> Tuple[bytearray, int]:
+        """
+        Read a streamed response, decrypting each chunk as it arrives.
+        With a decrypt pool the whole ciphertext is read first, then decrypted by the pool.
+
+        Returns:
+            tuple: The segment content, or None if it could not be decrypted, and the number of bytes received.
+        """
+        decryptor = self._new_segment_decryptor(index)
+        segment_content = bytearray()
+        received = 0
+
+        try:
+            if self.decrypt_executor is not None:
+                ciphertext = response.read()
+                return self._submit_decrypt(ciphertext, index).result(), len(ciphertext)
+
+            for chunk in response.iter_bytes(STREAM_CHUNK_SIZE):
+                received += len(chunk)
+                segment_content += decryptor.update(chunk) if decryptor is not None else chunk
+
+            if decryptor is not None:
+                segment_content += decryptor.finalize()
+
+        except ValueError as e:
+            self._handle_decryption_error(index, e)
+            return None, received
+
+        return segment_content, received
+
+    async def _read_segment_async(self, response: httpx.Response, index: int) -> Tuple[bytearray, int]:
+        """Asyncio counterpart of `_read_segment`."""
+        decryptor = self._new_segment_decryptor(index)
+        segment_content = bytearray()
+        received = 0
+
+        try:
+            if self.decrypt_executor is not None:
+                ciphertext = await response.aread()
+                return await asyncio.wrap_future(self._submit_decrypt(ciphertext, index)), len(ciphertext)
+
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                received += len(chunk)
+                segment_content += decryptor.update(chunk) if decryptor is not None else chunk
+
+            if decryptor is not None:
+                segment_content += decryptor.finalize()
+
+        except ValueError as e:
+            self._handle_decryption_error(index, e)
+            return None, received
+
+        return segment_content, received
+
+    def _handle_decryption_error(self, index: int, error: Exception) -> None:
+        """A segment that cannot be decrypted means a wrong key, so the whole download is stopped."""
+        logging.error(f"Decryption failed for segment {index}: {str(error)}")
+        self.interrupt_flag.set()   # Interrupt the download process
+        self.stop_event.set()       # Trigger the stopping event for all threads
+
+    def _process_segment(self, index: int, segment_content: bytes, content_size: int, progress_bar: tqdm) -> None:
+        """
+        Hands a downloaded and decrypted segment to the writer.
+
+        Parameters:
+            - index (int): The index of the segment.
+            - segment_content (bytes): The decrypted segment content.
+            - content_size (int): Bytes received from the network for this segment.
+            - progress_bar (tqdm): Progress counter for tracking download progress.
+        """
+        if self.stage_on_disk:
+            self._stage_segment(index, segment_content)
+        else:
+            with self.window_cond:
+                self.pending_bytes += len(segment_content)
+            self.queue.put((index, segment_content))
+
+        self.class_ts_estimator.update_progress_bar(content_size, progress_bar)
+        self.downloaded_segments.add(index)  
+        progress_bar.update(1)
+
+    def _get_segment_path(self, index: int) -> str:
+        """Path of the staging file of segment `index`."""
+        return os.path.join(self.segments_folder, f"{index:06d}.ts")
+
+    def _stage_segment(self, index: int, segment_content: bytes) -> None:
+        """
+        Write a segment to its own staging file. The file only gets its final name once fully written.
+        """
+        segment_path = self._get_segment_path(index)
+        with open(f"{segment_path}.part", 'wb') as f:
+            f.write(segment_content)
+        os.replace(f"{segment_path}.part", segment_path)
+
+    def _concatenate_segments(self) -> None:
+        """
+        Stitch the staged segments into the output file in playlist order, then remove them.
+        """
+        fd = os.open(self.tmp_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0))
+        try:
+            for index in range(len(self.segments)):
+                segment_path = self._get_segment_path(index)
+                if not os.path.exists(segment_path):
+                    continue
+
+                append_file(segment_path, fd)
+                os.remove(segment_path)
+        finally:
+            os.close(fd)
+
+        shutil.rmtree(self.segments_folder, ignore_errors=True)
+
+    def _register_failure(self, ts_url: str, index: int, attempt: int, error: Exception, progress_bar: tqdm) -> bool:
+        """
+        Updates retry counters after a failed attempt.
+
+        Returns:
+            bool: True if it was the last attempt and the segment has been marked as failed.
+        """
+        logging.info(f"Attempt {attempt + 1} failed for segment {index} - '{ts_url}': {error}")
+        if self.concurrency is not None:
+            self.concurrency.on_failure(error)
+        
+        if attempt > self.info_maxRetry:
+            self.info_maxRetry = ( attempt + 1 )
+        self.info_nRetry += 1
+
+        if attempt + 1 == REQUEST_MAX_RETRY:
+            console.log(f"[red]Final retry failed for segment: {index}")
+            if not self.stage_on_disk:
+                self.queue.put((index, None))  # Marker for failed segment
+            progress_bar.update(1)
+            self.info_nFailed += 1
+            return True
+
+        return False
+
     def download_segment(self, ts_url: str, index: int, progress_bar: tqdm, backoff_factor: float = 1.1) -> None:
         """
         Downloads a TS segment and adds it to the segment queue with retry logic.
@@ -216,48 +985,42 @@ class M3U8_Segments:
             - progress_bar (tqdm): Progress counter for tracking download progress.
             - backoff_factor (float): The backoff factor for exponential backoff (default is 1.5 seconds).
         """
+        if not self._wait_for_window(index):
+            return
+
         for attempt in range(REQUEST_MAX_RETRY):
             if self.interrupt_flag.is_set():
                 return
             
             try:
-                with self._get_http_client() as client:
-                    response = client.get(ts_url)
-        
-                    # Validate response and content
-                    response.raise_for_status()
-                    segment_content = response.content
-                    content_size = len(segment_content)
-
-                    # Decrypt if needed and verify decrypted content
-                    if self.decryption is not None:
-                        try:
-                            segment_content = self.decryption.decrypt(segment_content)
-                            
-                        except Exception as e:
-                            logging.error(f"Decryption failed for segment {index}: {str(e)}")
-                            self.interrupt_flag.set()   # Interrupt the download process
-                            self.stop_event.set()       # Trigger the stopping event for all threads
-                            break                       # Stop the current task immediately
-
-                    self.class_ts_estimator.update_progress_bar(content_size, progress_bar)
-                    self.queue.put((index, segment_content))
-                    self.downloaded_segments.add(index)  
-                    progress_bar.update(1)
-                    return
+                if self.concurrency is not None:
+                    self.concurrency.acquire()
+                if self.worker_budget is not None:
+                    self.worker_budget.acquire(self.priority)
+                try:
+                    start = time.perf_counter()
+                    with self._get_http_client().stream("GET", ts_url) as response:
+                        latency = time.perf_counter() - start
+                        self._track_connection(response)
+
+                        # Validate response, then decrypt the content while it is received
+                        response.raise_for_status()
+                        segment_content, content_size = self._read_segment(response, index)
+                finally:
+                    if self.worker_budget is not None:
+                        self.worker_budget.release()
+                    if self.concurrency is not None:
+                        self.concurrency.release()
+
+                if self.concurrency is not None:
+                    self.concurrency.on_success(content_size, latency, self.active_retries)
+
+                if segment_content is not None:
+                    self._process_segment(index, segment_content, content_size, progress_bar)
+                return
 
             except Exception as e:
-                logging.info(f"Attempt {attempt + 1} failed for segment {index} - '{ts_url}': {e}")
-                
-                if attempt > self.info_maxRetry:
-                    self.info_maxRetry = ( attempt + 1 )
-                self.info_nRetry += 1
-
-                if attempt + 1 == REQUEST_MAX_RETRY:
-                    console.log(f"[red]Final retry failed for segment: {index}")
-                    self.queue.put((index, None))  # Marker for failed segment
-                    progress_bar.update(1)
-                    self.info_nFailed += 1
+                if self._register_failure(ts_url, index, attempt, e, progress_bar):
                     return
                 
                 with self.active_retries_lock:
@@ -270,56 +1033,164 @@ class M3U8_Segments:
                 with self.active_retries_lock:
                     self.active_retries -= 1
 
+    async def download_segment_async(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, ts_url: str, index: int, progress_bar: tqdm, backoff_factor: float = 1.1) -> None:
+        """
+        Asyncio counterpart of `download_segment`, with the same retry and interrupt semantics.
+
+        Parameters:
+            - client (httpx.AsyncClient): The client shared by all segment tasks.
+            - semaphore (asyncio.Semaphore): Bounds the number of concurrent requests.
+            - ts_url (str): The URL of the TS segment.
+            - index (int): The index of the segment.
+            - progress_bar (tqdm): Progress counter for tracking download progress.
+            - backoff_factor (float): The backoff factor for exponential backoff.
+        """
+        if not await self._wait_for_window_async(index):
+            return
+
+        for attempt in range(REQUEST_MAX_RETRY):
+            if self.interrupt_flag.is_set():
+                return
+            
+            try:
+                async with semaphore:
+                    if self.interrupt_flag.is_set():
+                        return
+
+                    if self.concurrency is not None:
+                        await self.concurrency.acquire_async()
+                    if self.worker_budget is not None:
+                        await self.worker_budget.acquire_async(self.priority)
+                    try:
+                        start = time.perf_counter()
+                        async with client.stream("GET", ts_url) as response:
+                            latency = time.perf_counter() - start
+                            self._track_connection(response)
+
+                            # Validate response, then decrypt the content while it is received
+                            response.raise_for_status()
+                            segment_content, content_size = await self._read_segment_async(response, index)
+                    finally:
+                        if self.worker_budget is not None:
+                            self.worker_budget.release()
+                        if self.concurrency is not None:
+                            self.concurrency.release()
+
+                if self.concurrency is not None:
+                    self.concurrency.on_success(content_size, latency, self.active_retries)
+
+                if segment_content is not None:
+
+                    # Staging files are written by the default executor so the event loop keeps serving the other requests
+                    if self.stage_on_disk:
+                        await asyncio.get_running_loop().run_in_executor(None, self._process_segment, index, segment_content, content_size, progress_bar)
+                    else:
+                        self._process_segment(index, segment_content, content_size, progress_bar)
+                return
+
+            except Exception as e:
+                if self._register_failure(ts_url, index, attempt, e, progress_bar):
+                    return
+                
+                with self.active_retries_lock:
+                    self.active_retries += 1
+                
+                sleep_time = backoff_factor * (2 ** attempt)
+                logging.info(f"Retrying segment {index} in {sleep_time} seconds...")
+                await asyncio.sleep(sleep_time)
+                
+                with self.active_retries_lock:
+                    self.active_retries -= 1
+
     def write_segments_to_file(self):
         """
         Writes segments to file with additional verification.
         """
-        with open(self.tmp_file_path, 'wb') as f:
-            while not self.stop_event.is_set() or not self.queue.empty():
-                if self.interrupt_flag.is_set():
-                    break
-                
-                try:
-                    index, segment_content = self.queue.get(timeout=self.current_timeout)
+        with self._open_output_file() as f:
+            self._write_queued_segments(f)
 
-                    # Successful queue retrieval: reduce timeout
-                    self.current_timeout = max(self.base_timeout, self.current_timeout / 2)
+            if self.journal is not None:
+                self.journal.close(f)
 
-                    # Handle failed segments
-                    if segment_content is None:
-                        if index == self.expected_index:
-                            self.expected_index += 1
-                        continue
+    def _write_queued_segments(self, f) -> None:
+        """
+        Consume the segment queue, writing segments to `f` in playlist order.
+        """
+        while not self.stop_event.is_set() or not self.queue.empty():
+            if self.interrupt_flag.is_set():
+                break
+            
+            try:
+                index, segment_content = self.queue.get(timeout=self.current_timeout)
+
+                # Successful queue retrieval: reduce timeout
+                self.current_timeout = max(self.base_timeout, self.current_timeout / 2)
 
-                    # Write segment if it's the next expected one
+                # Handle failed segments
+                if segment_content is None:
                     if index == self.expected_index:
-                        f.write(segment_content)
-                        f.flush()
                         self.expected_index += 1
+                        self._write_buffered_segments(f)
+                    else:
+                        self.buffer[index] = None
+                    self._release_window(0)
+                    continue
 
-                        # Write any buffered segments that are now in order
-                        while self.expected_index in self.buffer:
-                            next_segment = self.buffer.pop(self.expected_index)
+                # Write segment if it's the next expected one
+                if index == self.expected_index:
+                    self._write_segment(f, index, segment_content)
+                    self.expected_index += 1
+                    self._release_window(len(segment_content))
 
-                            if next_segment is not None:
-                                f.write(next_segment)
-                                f.flush()
+                    # Write any buffered segments that are now in order
+                    self._write_buffered_segments(f)
+                
+                else:
+                    self.buffer[index] = segment_content
 
-                            self.expected_index += 1
-                    
-                    else:
-                        self.buffer[index] = segment_content
+            except BrokenPipeError:
+                logging.error("Output stream closed, stopping the download")
+                self.interrupt_flag.set()
+                self.stop_event.set()
+                break
 
-                except queue.Empty:
-                    self.current_timeout = min(MAX_TIMEOOUT, self.current_timeout * 1.1)
-                    time.sleep(0.05)
+            except queue.Empty:
+                self.current_timeout = min(MAX_TIMEOOUT, self.current_timeout * 1.1)
+                time.sleep(0.05)
 
-                    if self.stop_event.is_set():
-                        break
+                if self.stop_event.is_set():
+                    break
+
+            except Exception as e:
+                logging.error(f"Error writing segment {index}: {str(e)}")
+
+    def _write_segment(self, f, index: int, segment_content: bytes) -> None:
+        """
+        Append a segment to the output file and record it in the journal.
+        """
+        if self.journal is None:
+            f.write(segment_content)
+            f.flush()
+            return
+
+        offset = f.tell()
+        f.write(segment_content)
+        f.flush()
+        self.journal.record(index, offset, len(segment_content), f)
+
+    def _write_buffered_segments(self, f) -> None:
+        """
+        Flush the buffered segments that are now in order.
+        """
+        while self.expected_index in self.buffer:
+            next_segment = self.buffer.pop(self.expected_index)
+
+            if next_segment is not None:
+                self._write_segment(f, self.expected_index, next_segment)
+
+            self.expected_index += 1
+            self._release_window(len(next_segment) if next_segment is not None else 0)
 
-                except Exception as e:
-                    logging.error(f"Error writing segment {index}: {str(e)}")
-    
     def download_streams(self, description: str, type: str):
         """
         Downloads all TS segments in parallel and writes them to a file.
@@ -334,10 +1205,14 @@ class M3U8_Segments:
           console.log("####")
           
         self.get_info()
+        self._load_resume_state()
+        self._start_decrypt_pool()
         self.setup_interrupt_handler()
 
         progress_bar = tqdm(
             total=len(self.segments), 
+            initial=len(self.downloaded_segments),
+            position=self.position,
             unit='s',
             ascii='░▒█',
             bar_format=self._get_bar_format(description),
@@ -346,62 +1221,146 @@ class M3U8_Segments:
             file=sys.stdout,        # Using file=sys.stdout to force in-place updates because sys.stderr may not support carriage returns in this environment.
         )
 
+        writer_thread = None
         try:
-            writer_thread = threading.Thread(target=self.write_segments_to_file)
-            writer_thread.daemon = True
-            writer_thread.start()
+            if self.stage_on_disk:
+                os.makedirs(self.segments_folder, exist_ok=True)
+            else:
+                writer_thread = threading.Thread(target=self.write_segments_to_file)
+                writer_thread.daemon = True
+                writer_thread.start()
 
-            # Configure workers and delay
+            # Configure workers and delay, with adaptive workers the pool is sized for the highest limit
             max_workers = self._get_worker_count(type)
+            if ADAPTIVE_WORKERS:
+                self.concurrency = AdaptiveConcurrency(max_workers, max(max_workers, MAX_ADAPTIVE_WORKERS))
+                max_workers = self.concurrency.maximum
+            self.max_workers = max_workers
             
-            # Download segments with completion verification
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = []
-                for index, segment_url in enumerate(self.segments):
+            # Download segments with the selected engine
+            if DOWNLOAD_ENGINE == "async":
+                asyncio.run(self._download_segments_async(progress_bar, max_workers))
+            else:
+                self._download_segments_threaded(progress_bar, max_workers)
 
-                    # Check for interrupt before submitting each task
-                    if self.interrupt_flag.is_set():
-                        break
+        finally:
+            self._cleanup_resources(writer_thread, progress_bar)
+
+        # Keep the staged segments of an interrupted download so it can be resumed
+        if self.stage_on_disk and not (RESUME_DOWNLOAD and self.interrupt_flag.is_set()):
+            self._concatenate_segments()
+
+        self._finalize_resume_state()
+
+        if not self.interrupt_flag.is_set():
+            self._verify_download_completion()
+
+        return self._generate_results(type)
+
+    def _get_missing_segments(self) -> list:
+        """
+        Return the sorted indices of segments that have not been downloaded, logging them if any.
+        """
+        total_segments = len(self.segments)
+        if len(self.downloaded_segments) >= total_segments:
+            return []
+
+        missing_segments = sorted(set(range(total_segments)) - self.downloaded_segments)
+        logging.warning(f"Missing segments: {missing_segments}")
+        return missing_segments
 
-                    time.sleep(TQDM_DELAY_WORKER)
-                    futures.append(executor.submit(self.download_segment, segment_url, index, progress_bar))
+    def _download_segments_threaded(self, progress_bar: tqdm, max_workers: int) -> None:
+        """
+        Download all segments with a pool of worker threads.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for index, segment_url in enumerate(self.segments):
+
+                # Check for interrupt before submitting each task
+                if self.interrupt_flag.is_set():
+                    break
+
+                # Skip segments saved by a previous run
+                if index in self.downloaded_segments:
+                    continue
+
+                time.sleep(TQDM_DELAY_WORKER)
+                futures.append(executor.submit(self.download_segment, segment_url, index, progress_bar))
+
+            # Wait for futures with interrupt handling
+            for future in as_completed(futures):
+                if self.interrupt_flag.is_set():
+                    break
+                try:
+                    future.result()
+                except Exception as e:
+                    logging.error(f"Error in download thread: {str(e)}")
 
-                # Wait for futures with interrupt handling
-                for future in as_completed(futures):
+            # Interrupt handling for missing segments
+            if not self.interrupt_flag.is_set():
+                
+                # Retry missing segments with interrupt check
+                for index in self._get_missing_segments():
                     if self.interrupt_flag.is_set():
                         break
+
                     try:
-                        future.result()
+                        self.download_segment(self.segments[index], index, progress_bar)
+                        
                     except Exception as e:
-                        logging.error(f"Error in download thread: {str(e)}")
+                        logging.error(f"Failed to retry segment {index}: {str(e)}")
 
-                # Interrupt handling for missing segments
-                if not self.interrupt_flag.is_set():
-                    total_segments = len(self.segments)
-                    completed_segments = len(self.downloaded_segments)
-                    
-                    if completed_segments < total_segments:
-                        missing_segments = set(range(total_segments)) - self.downloaded_segments
-                        logging.warning(f"Missing segments: {sorted(missing_segments)}")
-                        
-                        # Retry missing segments with interrupt check
-                        for index in missing_segments:
-                            if self.interrupt_flag.is_set():
-                                break
+    async def _download_segments_async(self, progress_bar: tqdm, max_workers: int) -> None:
+        """
+        Download all segments on a single event loop, with at most `max_workers` requests in flight.
+        A producer feeds the segments to `max_workers` consumer tasks through a bounded queue,
+        so the number of tasks does not grow with the length of the playlist.
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+        segment_queue = asyncio.Queue(maxsize=max_workers)
 
-                            try:
-                                self.download_segment(self.segments[index], index, progress_bar)
-                                
-                            except Exception as e:
-                                logging.error(f"Failed to retry segment {index}: {str(e)}")
+        async def produce() -> None:
+            try:
+                for index, segment_url in enumerate(self.segments):
+                    if self.interrupt_flag.is_set():
+                        break
 
-        finally:
-            self._cleanup_resources(writer_thread, progress_bar)
+                    # Skip segments saved by a previous run
+                    if index not in self.downloaded_segments:
+                        await segment_queue.put((index, segment_url))
+            finally:
+                for _ in range(max_workers):
+                    await segment_queue.put(None)
 
-        if not self.interrupt_flag.is_set():
-            self._verify_download_completion()
+        async def consume() -> None:
+            while True:
+                item = await segment_queue.get()
+                if item is None:
+                    return
 
-        return self._generate_results(type)
+                index, segment_url = item
+                try:
+                    await self.download_segment_async(client, semaphore, segment_url, index, progress_bar)
+                except Exception as e:
+                    logging.error(f"Error in download task: {str(e)}")
+
+        async with httpx.AsyncClient(**self._get_client_params()) as client:
+            await asyncio.gather(produce(), *(consume() for _ in range(max_workers)))
+
+            # Interrupt handling for missing segments
+            if not self.interrupt_flag.is_set():
+
+                # Retry missing segments with interrupt check
+                for index in self._get_missing_segments():
+                    if self.interrupt_flag.is_set():
+                        break
+
+                    try:
+                        await self.download_segment_async(client, semaphore, self.segments[index], index, progress_bar)
+
+                    except Exception as e:
+                        logging.error(f"Failed to retry segment {index}: {str(e)}")
     
     def _get_bar_format(self, description: str) -> str:
         """
@@ -443,8 +1402,21 @@ class M3U8_Segments:
     def _cleanup_resources(self, writer_thread: threading.Thread, progress_bar: tqdm) -> None:
         """Ensure resource cleanup and final reporting."""
         self.stop_event.set()
-        writer_thread.join(timeout=30)
+        if writer_thread is not None:
+            writer_thread.join(timeout=30)
         progress_bar.close()
+        self._close_http_client()
+        self.class_ts_estimator.close()
+
+        if self.decrypt_executor is not None:
+            self.decrypt_executor.shutdown(wait=True)
+            self.decrypt_executor = None
+
+        logging.info(f"Connection pool: hit {self.info_poolHit}, miss {self.info_poolMiss}")
+        if self.concurrency is not None:
+            logging.info(f"Adaptive workers: final limit {int(self.concurrency.limit)}, peak {int(self.concurrency.peak_limit)}")
+        if DEBUG_MODE:
+            self._display_pool_summary()
         
         #if self.download_interrupted:
         #    console.print("\n[red]Download terminated by user")
@@ -454,6 +1426,16 @@ class M3U8_Segments:
 
         self.buffer = {}
         self.expected_index = 0
+        self.pending_bytes = 0
+
+    def _display_pool_summary(self) -> None:
+        """Report how often segment requests reused an open connection."""
+        total_requests = self.info_poolHit + self.info_poolMiss
+        reuse_ratio = (self.info_poolHit / total_requests) if total_requests else 0
+        console.print(f"[cyan]Connection Summary: "
+                     f"[white]Reused: [green]{self.info_poolHit} "
+                     f"[white]New: [red]{self.info_poolMiss} "
+                     f"[white]Reuse ratio: [green]{reuse_ratio:.1%}")
 
     def _display_error_summary(self) -> None:
         """Generate final error report."""
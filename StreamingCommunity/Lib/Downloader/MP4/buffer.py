@@ -0,0 +1,97 @@
+# 18.10.26
+
+import time
+from typing import BinaryIO, Callable
+
+
+# Variable
+MIN_BUFFER_SIZE = 64 * 1024
+MAX_BUFFER_SIZE = 4 * 1024 * 1024
+FLUSH_INTERVAL = 0.25
+PROGRESS_INTERVAL = 0.1
+
+
+class AdaptiveBufferWriter:
+    def __init__(self, file: BinaryIO, progress_callback: Callable[[int], None], min_size: int = MIN_BUFFER_SIZE, max_size: int = MAX_BUFFER_SIZE):
+        """
+        Collects the chunks of a response in one reusable buffer and writes it to the file in large blocks.
+        The block size follows the measured throughput, about FLUSH_INTERVAL seconds of data between
+        `min_size` and `max_size`, and the progress is reported at most every PROGRESS_INTERVAL seconds.
+
+        Parameters:
+            - file (BinaryIO): Destination, opened in binary mode.
+            - progress_callback (Callable): Receives the bytes received since the last report.
+            - min_size (int): Smallest block written to the file.
+            - max_size (int): Largest block, also the size of the buffer.
+        """
+        self.file = file
+        self.progress_callback = progress_callback
+        self.min_size = min_size
+        self.max_size = max_size
+
+        self.buffer = bytearray(max_size)
+        self.view = memoryview(self.buffer)
+        self.used = 0
+        self.block_size = min_size
+        self.written = 0
+
+        self.last_flush = time.perf_counter()
+        self.last_progress = self.last_flush
+        self.unreported = 0
+
+    def write(self, data: bytes) -> None:
+        """Copies `data` into the buffer, writing out every block that fills up."""
+        data = memoryview(data)
+
+        # A chunk that fills a whole block goes straight to the file, without the copy
+        if self.used == 0 and len(data) >= self.block_size:
+            self.file.write(data)
+            self.written += len(data)
+            self.unreported += len(data)
+            self._after_write(len(data))
+            return
+
+        while data:
+            take = min(len(data), self.block_size - self.used)
+            self.view[self.used:self.used + take] = data[:take]
+            self.used += take
+            data = data[take:]
+
+            if self.used >= self.block_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered bytes, then resizes the next block from the throughput of this one."""
+        size = self.used
+        if size:
+            self.file.write(self.view[:size])
+            self.written += size
+            self.unreported += size
+            self.used = 0
+
+        self._after_write(size)
+
+    def _after_write(self, size: int) -> None:
+        """Adapts the block size to the throughput of the last block and reports the progress if due."""
+        now = time.perf_counter()
+        elapsed = now - self.last_flush
+        if size and elapsed > 0:
+            target = int(size / elapsed * FLUSH_INTERVAL)
+            self.block_size = max(self.min_size, min(self.max_size, target))
+
+        self.last_flush = now
+
+        if now - self.last_progress >= PROGRESS_INTERVAL:
+            self.report()
+
+    def report(self) -> None:
+        """Sends the bytes written since the last report to the progress callback."""
+        if self.unreported:
+            self.progress_callback(self.unreported)
+            self.unreported = 0
+        self.last_progress = time.perf_counter()
+
+    def close(self) -> None:
+        """Writes what is left in the buffer and reports it."""
+        self.flush()
+        self.report()
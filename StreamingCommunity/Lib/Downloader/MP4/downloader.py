@@ -27,6 +27,8 @@ from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance
 
 # Logic class
 from ...FFmpeg import print_duration_table
+from .ranges import probe_range_support, RangedDownloader
+from .buffer import AdaptiveBufferWriter
 
 
 # Config
@@ -34,6 +36,7 @@ REQUEST_VERIFY = config_manager.get_bool('REQUESTS', 'verify')
 GET_ONLY_LINK = config_manager.get_bool('M3U8_PARSER', 'get_only_link')
 REQUEST_TIMEOUT = config_manager.get_float('REQUESTS', 'timeout')
 TELEGRAM_BOT = config_manager.get_bool('DEFAULT', 'telegram_bot')
+MP4_CONNECTIONS = config_manager.get_int('M3U8_DOWNLOAD', 'mp4_connections')
 
 
 # Variable
@@ -70,11 +73,30 @@ def signal_handler(signum, frame, interrupt_handler, original_handler):
         signal.signal(signum, original_handler)
 
 
+def create_progress_bar(total: int) -> tqdm:
+    """Progress bar of the MP4 download."""
+    return tqdm(
+        total=total,
+        ascii='░▒█',
+        bar_format=f"{Colors.YELLOW}[MP4]{Colors.WHITE}: "
+                   f"{Colors.RED}{{percentage:.2f}}% {Colors.MAGENTA}{{bar}} {Colors.WHITE}[ "
+                   f"{Colors.YELLOW}{{n_fmt}}{Colors.WHITE} / {Colors.RED}{{total_fmt}} {Colors.WHITE}] "
+                   f"{Colors.YELLOW}{{elapsed}} {Colors.WHITE}< {Colors.CYAN}{{remaining}}{Colors.WHITE}, "
+                   f"{Colors.YELLOW}{{rate_fmt}}{{postfix}} ",
+        unit='iB',
+        unit_scale=True,
+        desc='Downloading',
+        mininterval=0.05,
+        file=sys.stdout                         # Using file=sys.stdout to force in-place updates because sys.stderr may not support carriage returns in this environment.  
+    )
+
+
 def MP4_downloader(url: str, path: str, referer: str = None, headers_: dict = None):
     """
     Downloads an MP4 video with enhanced interrupt handling.
+    When the server supports byte ranges the file is fetched over `mp4_connections` parallel requests.
     - Single Ctrl+C: Completes download gracefully
-    - Triple Ctrl+C: Saves partial download and exits
+    - Triple Ctrl+C: Saves partial download and exits, a ranged download is kept to be resumed
     """
     if TELEGRAM_BOT:
         bot = get_bot_instance()
@@ -116,46 +138,54 @@ def MP4_downloader(url: str, path: str, referer: str = None, headers_: dict = No
 
     try:
         with httpx.Client() as client:
-            with client.stream("GET", url, headers=headers) as response:
-                response.raise_for_status()
-                total = int(response.headers.get('content-length', 0))
-                
-                if total == 0:
-                    console.print("[bold red]No video stream found.[/bold red]")
-                    return None, False
-
-                # Create a fancy progress bar
-                progress_bar = tqdm(
-                    total=total,
-                    ascii='░▒█',
-                    bar_format=f"{Colors.YELLOW}[MP4]{Colors.WHITE}: "
-                               f"{Colors.RED}{{percentage:.2f}}% {Colors.MAGENTA}{{bar}} {Colors.WHITE}[ "
-                               f"{Colors.YELLOW}{{n_fmt}}{Colors.WHITE} / {Colors.RED}{{total_fmt}} {Colors.WHITE}] "
-                               f"{Colors.YELLOW}{{elapsed}} {Colors.WHITE}< {Colors.CYAN}{{remaining}}{Colors.WHITE}, "
-                               f"{Colors.YELLOW}{{rate_fmt}}{{postfix}} ",
-                    unit='iB',
-                    unit_scale=True,
-                    desc='Downloading',
-                    mininterval=0.05,
-                    file=sys.stdout                         # Using file=sys.stdout to force in-place updates because sys.stderr may not support carriage returns in this environment.  
-                )
-
-                downloaded = 0
-                with open(temp_path, 'wb') as file, progress_bar as bar:
-                    try:
-                        for chunk in response.iter_bytes(chunk_size=1024):
-                            if interrupt_handler.force_quit:
-                                console.print("\n[bold red]Force quitting... Saving partial download.[/bold red]")
-                                break
-                            
-                            if chunk:
-                                size = file.write(chunk)
-                                downloaded += size
-                                bar.update(size)
-
-                    except KeyboardInterrupt:
-                        if not interrupt_handler.force_quit:
-                            interrupt_handler.kill_download = True
+
+            # Split the file in ranges downloaded in parallel, resumable from `.temp.parts`
+            total = probe_range_support(client, url, headers) if MP4_CONNECTIONS > 1 else None
+
+            if total:
+                ranged = RangedDownloader(client, url, headers, temp_path, total, MP4_CONNECTIONS)
+                resumed = ranged.prepare()
+                if resumed:
+                    console.print(f"[cyan]Resuming download from [bold]{internet_manager.format_file_size(resumed)}[/bold]")
+
+                with create_progress_bar(total) as bar:
+                    bar.update(resumed)
+                    completed = ranged.run(bar.update, lambda: interrupt_handler.force_quit)
+
+                if not completed:
+                    if ranged.failed:
+                        console.print("[bold red]Download failed, run it again to resume.[/bold red]")
+                        return None, interrupt_handler.kill_download
+
+                    console.print(f"[bold yellow]Download paused, run it again to resume from [cyan]{temp_path}[/bold yellow]")
+                    return None, True
+
+            else:
+                with client.stream("GET", url, headers=headers) as response:
+                    response.raise_for_status()
+                    total = int(response.headers.get('content-length', 0))
+                    
+                    if total == 0:
+                        console.print("[bold red]No video stream found.[/bold red]")
+                        return None, False
+
+                    # Chunks are taken as they arrive and written in large blocks, the bar is updated a few times per second
+                    with open(temp_path, 'wb') as file, create_progress_bar(total) as bar:
+                        writer = AdaptiveBufferWriter(file, bar.update)
+                        try:
+                            for chunk in response.iter_bytes():
+                                if interrupt_handler.force_quit:
+                                    console.print("\n[bold red]Force quitting... Saving partial download.[/bold red]")
+                                    break
+                                
+                                writer.write(chunk)
+
+                        except KeyboardInterrupt:
+                            if not interrupt_handler.force_quit:
+                                interrupt_handler.kill_download = True
+
+                        finally:
+                            writer.close()
                     
         if os.path.exists(temp_path):
             os.rename(temp_path, path)
@@ -183,7 +213,7 @@ def MP4_downloader(url: str, path: str, referer: str = None, headers_: dict = No
     except Exception as e:
         logging.error(f"Unexpected error: {e}")
         console.print(f"[bold red]Unexpected Error: {e}[/bold red]")
-        if os.path.exists(temp_path):
+        if os.path.exists(temp_path) and not os.path.exists(f"{temp_path}.parts"):
             os.remove(temp_path)
         return None, interrupt_handler.kill_download
     
@@ -0,0 +1,277 @@
+# 18.10.26
+
+import os
+import re
+import json
+import time
+import queue
+import logging
+import threading
+from typing import Dict, List, Optional
+
+
+# External libraries
+import httpx
+
+
+# Internal utilities
+from StreamingCommunity.Util.config_json import config_manager
+
+
+# Config
+RETRY_LIMIT = config_manager.get_int('REQUESTS', 'max_retry')
+
+
+# Variable
+CHUNK_SIZE = 256 * 1024
+MIN_PIECE_SIZE = 8 * 1024 * 1024
+PIECES_PER_CONNECTION = 4
+MANIFEST_SYNC_INTERVAL = 1.0
+
+
+def probe_range_support(client: httpx.Client, url: str, headers: Dict[str, str]) -> Optional[int]:
+    """
+    Asks for the first byte of the file to check if the server serves byte ranges.
+
+    Parameters:
+        - client (httpx.Client): Client used for the download.
+        - url (str): URL of the file.
+        - headers (dict): Headers of the download.
+
+    Returns:
+        int: Size of the file if ranges are supported, None otherwise.
+    """
+    try:
+        with client.stream("GET", url, headers={**headers, 'Range': 'bytes=0-0'}) as response:
+            if response.status_code != 206:
+                logging.info(f"Ranges not supported (status {response.status_code}, Accept-Ranges: {response.headers.get('accept-ranges')})")
+                return None
+
+            match = re.match(r'bytes\s+0-0/(\d+)', response.headers.get('content-range', ''))
+            if not match:
+                return None
+
+            return int(match.group(1))
+
+    except httpx.HTTPError as e:
+        logging.warning(f"Range probe failed: {e}")
+        return None
+
+
+class RangeManifest:
+    def __init__(self, path: str, size: int, piece_size: int):
+        """
+        Resume state of a ranged download: how many bytes of each piece are in the temporary file.
+
+        Parameters:
+            - path (str): Path of the manifest file.
+            - size (int): Size of the whole file.
+            - piece_size (int): Size of each piece, the last one can be shorter.
+        """
+        self.path = path
+        self.size = size
+        self.piece_size = piece_size
+        self.done: List[int] = [0] * ((size + piece_size - 1) // piece_size)
+
+    def piece_range(self, index: int):
+        """Returns the first and the last byte of a piece, inclusive."""
+        start = index * self.piece_size
+        return start, min(start + self.piece_size, self.size) - 1
+
+    def piece_length(self, index: int) -> int:
+        start, end = self.piece_range(index)
+        return end - start + 1
+
+    def is_complete(self) -> bool:
+        return all(self.done[i] >= self.piece_length(i) for i in range(len(self.done)))
+
+    def downloaded(self) -> int:
+        return sum(self.done)
+
+    def load(self) -> bool:
+        """Loads an existing manifest, only if it describes a file of the same size."""
+        if not os.path.exists(self.path):
+            return False
+
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+
+            if data.get('size') != self.size or data.get('piece_size') != self.piece_size or len(data.get('done', [])) != len(self.done):
+                return False
+
+            self.done = [min(int(done), self.piece_length(i)) for i, done in enumerate(data['done'])]
+            return True
+
+        except (ValueError, OSError) as e:
+            logging.warning(f"Ignoring invalid manifest {self.path}: {e}")
+            return False
+
+    def save(self, data_path: str) -> None:
+        """Makes the temporary file durable first, then writes the manifest that describes it."""
+        done = list(self.done)
+        with open(data_path, 'rb+') as f:
+            os.fsync(f.fileno())
+
+        with open(f"{self.path}.tmp", 'w') as f:
+            json.dump({'size': self.size, 'piece_size': self.piece_size, 'done': done}, f)
+        os.replace(f"{self.path}.tmp", self.path)
+
+    def remove(self) -> None:
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class RangedDownloader:
+    def __init__(self, client: httpx.Client, url: str, headers: Dict[str, str], temp_path: str, size: int, connections: int):
+        """
+        Downloads a file as independent byte ranges, fetched in parallel into a preallocated temporary file.
+        The file is split into more pieces than connections, so a slow connection does not hold back the end.
+        The progress is kept in `<temp_path>.parts`, a later run continues from there.
+
+        Parameters:
+            - client (httpx.Client): Client shared by the connections.
+            - url (str): URL of the file.
+            - headers (dict): Headers of the download.
+            - temp_path (str): Path of the temporary file.
+            - size (int): Size of the file, from `probe_range_support`.
+            - connections (int): Number of parallel requests.
+        """
+        self.client = client
+        self.url = url
+        self.headers = headers
+        self.temp_path = temp_path
+        self.size = size
+        self.connections = max(1, connections)
+
+        piece_size = max(MIN_PIECE_SIZE, -(-size // (self.connections * PIECES_PER_CONNECTION)))
+        self.manifest = RangeManifest(f"{temp_path}.parts", size, piece_size)
+
+        self.stop_event = threading.Event()
+        self.progress_lock = threading.Lock()
+        self.failed = False
+
+    def prepare(self) -> int:
+        """
+        Resumes from the manifest when it matches the temporary file, otherwise preallocates a new one.
+
+        Returns:
+            int: Bytes already downloaded.
+        """
+        if os.path.exists(self.temp_path) and os.path.getsize(self.temp_path) == self.size and self.manifest.load():
+            logging.info(f"Resume ranged download of {self.temp_path} from {self.manifest.downloaded()} bytes")
+            return self.manifest.downloaded()
+
+        with open(self.temp_path, 'wb') as f:
+            f.truncate(self.size)
+
+        self.manifest.save(self.temp_path)
+        return 0
+
+    def _fetch_piece(self, index: int, progress_callback) -> None:
+        """Downloads the missing part of one piece, at its offset of the temporary file."""
+        start, end = self.manifest.piece_range(index)
+        start += self.manifest.done[index]
+        if start > end:
+            return
+
+        headers = {**self.headers, 'Range': f'bytes={start}-{end}'}
+        with self.client.stream("GET", self.url, headers=headers) as response:
+            if response.status_code != 206:
+                raise httpx.HTTPStatusError(f"Expected 206 for range {start}-{end}, got {response.status_code}", request=response.request, response=response)
+
+            with open(self.temp_path, 'r+b', buffering=0) as f:
+                f.seek(start)
+                for chunk in response.iter_bytes(chunk_size=CHUNK_SIZE):
+                    if self.stop_event.is_set():
+                        return
+
+                    # Never write past the piece, a misbehaving server could send more
+                    chunk = chunk[:end - start + 1]
+                    f.write(chunk)
+                    start += len(chunk)
+
+                    # Each piece belongs to one worker at a time, the saver only reads a copy
+                    self.manifest.done[index] += len(chunk)
+                    with self.progress_lock:
+                        progress_callback(len(chunk))
+
+                    if start > end:
+                        return
+
+        if start <= end:
+            raise httpx.ReadError(f"Range {start}-{end} ended early")
+
+    def _worker(self, pieces: queue.Queue, progress_callback) -> None:
+        """Takes pieces from the queue until it is empty, retrying each piece from where it stopped."""
+        while not self.stop_event.is_set():
+            try:
+                index = pieces.get_nowait()
+            except queue.Empty:
+                return
+
+            for attempt in range(RETRY_LIMIT + 1):
+                if self.stop_event.is_set():
+                    return
+
+                try:
+                    self._fetch_piece(index, progress_callback)
+                    break
+
+                except (httpx.HTTPError, OSError) as e:
+                    logging.warning(f"Piece {index} attempt {attempt + 1} failed: {e}")
+                    time.sleep(min(2 ** attempt, 10))
+
+            else:
+                logging.error(f"Piece {index} failed after {RETRY_LIMIT + 1} attempts")
+                self.failed = True
+                self.stop_event.set()
+
+    def run(self, progress_callback, should_stop) -> bool:
+        """
+        Downloads the missing pieces. Waits in the main thread, so Ctrl+C keeps working,
+        and saves the manifest about once a second.
+
+        Parameters:
+            - progress_callback (Callable): Receives the number of bytes of each chunk written.
+            - should_stop (Callable): Returns True to stop the download, the progress is kept.
+
+        Returns:
+            bool: True if the whole file is downloaded.
+        """
+        pieces = queue.Queue()
+        for index in range(len(self.manifest.done)):
+            if self.manifest.done[index] < self.manifest.piece_length(index):
+                pieces.put(index)
+
+        workers = [
+            threading.Thread(target=self._worker, args=(pieces, progress_callback), daemon=True)
+            for _ in range(min(self.connections, pieces.qsize()))
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            while any(worker.is_alive() for worker in workers):
+                if should_stop():
+                    self.stop_event.set()
+
+                for worker in workers:
+                    worker.join(timeout=MANIFEST_SYNC_INTERVAL / len(workers))
+
+                self.manifest.save(self.temp_path)
+
+        except KeyboardInterrupt:
+            self.stop_event.set()
+            for worker in workers:
+                worker.join()
+            raise
+
+        finally:
+            self.manifest.save(self.temp_path)
+
+        if self.manifest.is_complete():
+            self.manifest.remove()
+            return True
+
+        return False
@@ -1,4 +1,6 @@
 # 18.04.24
 
-from .command import join_video, join_audios, join_subtitle
+from .command import join_video, join_all, open_video_pipe, close_video_pipe, is_transcode
+from .capture import FFmpegProgress
+from .scheduler import FFmpegScheduler, FFmpegJob
 from .util import print_duration_table, get_video_duration
\ No newline at end of file
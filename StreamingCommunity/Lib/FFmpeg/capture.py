@@ -1,9 +1,9 @@
 # 16.04.24
 
-import re
 import logging
 import threading
 import subprocess
+from typing import Callable, Dict, List, Optional
 
 
 # External library
@@ -16,60 +16,136 @@ from StreamingCommunity.Util.os import internet_manager
 
 # Variable
 console = Console()
-terminate_flag = threading.Event()
 
 
-def capture_output(process: subprocess.Popen, description: str) -> None:
+class FFmpegProgress:
+    def __init__(self, out_time: float = 0.0, bitrate: Optional[float] = None, speed: Optional[float] = None, total_size: int = 0, frame: int = 0, fps: float = 0.0, is_end: bool = False):
+        """
+        One progress report of FFmpeg, as written by `-progress`.
+
+        Parameters:
+            - out_time (float): Seconds of output written so far.
+            - bitrate (float): Output bitrate in kbit/s, None when FFmpeg reports N/A.
+            - speed (float): Processing speed as a multiple of real time, None when FFmpeg reports N/A.
+            - total_size (int): Bytes written to the output.
+            - frame (int): Number of frames written.
+            - fps (float): Frames processed per second.
+            - is_end (bool): True for the last report of the process.
+        """
+        self.out_time = out_time
+        self.bitrate = bitrate
+        self.speed = speed
+        self.total_size = total_size
+        self.frame = frame
+        self.fps = fps
+        self.is_end = is_end
+
+    def __str__(self):
+        return f"FFmpegProgress(out_time={self.out_time}, bitrate={self.bitrate}, speed={self.speed}, total_size={self.total_size}, is_end={self.is_end})"
+
+
+class FFmpegProgressParser:
     """
-    Function to capture and print output from a subprocess.
+    State machine for the `key=value` blocks written by `ffmpeg -progress`.
+    Each block ends with a `progress=continue` or `progress=end` line.
+    """
+    def __init__(self):
+        self.values: Dict[str, str] = {}
+
+    @staticmethod
+    def _to_float(value: Optional[str], suffix: str = "") -> Optional[float]:
+        """Parse a numeric value like '1.5x' or '1200.3kbits/s', None for 'N/A'."""
+        if value is None:
+            return None
+
+        value = value.strip()
+        if suffix and value.endswith(suffix):
+            value = value[:-len(suffix)]
+
+        try:
+            return float(value)
+        except ValueError:
+            return None
+
+    def feed(self, line: str) -> Optional[FFmpegProgress]:
+        """
+        Consume one line of the progress output.
+
+        Returns:
+            FFmpegProgress: The completed report when `line` closes a block, None otherwise.
+        """
+        key, sep, value = line.strip().partition("=")
+        if not sep:
+            return None
+
+        if key != "progress":
+            self.values[key] = value
+            return None
+
+        values, self.values = self.values, {}
+
+        # out_time_us is the precise one, out_time_ms is also in microseconds on every FFmpeg version
+        out_time_us = self._to_float(values.get("out_time_us")) or self._to_float(values.get("out_time_ms")) or 0.0
+
+        return FFmpegProgress(
+            out_time=out_time_us / 1_000_000,
+            bitrate=self._to_float(values.get("bitrate"), "kbits/s"),
+            speed=self._to_float(values.get("speed"), "x"),
+            total_size=int(self._to_float(values.get("total_size")) or 0),
+            frame=int(self._to_float(values.get("frame")) or 0),
+            fps=self._to_float(values.get("fps")) or 0.0,
+            is_end=(value == "end")
+        )
+
+
+def print_progress(progress: FFmpegProgress, description: str) -> None:
+    """
+    Default progress callback, overwrites one console line per report.
 
     Parameters:
-        - process (subprocess.Popen): The subprocess whose output is captured.
+        - progress (FFmpegProgress): The last report.
         - description (str): Description of the command being executed.
     """
-    try:
-        max_length = 0
-
-        for line in iter(process.stdout.readline, ''):
-            try:
-                line = line.strip()
-                if not line:
-                    continue
+    speed = f"{progress.speed:.2f}x" if progress.speed is not None else "N/A"
+    progress_string = (f" {description}[white]: "
+                       f"([green]'speed': [yellow]{speed}[white], "
+                       f"[green]'size': [yellow]{internet_manager.format_file_size(progress.total_size)}[white])")
 
-                logging.info(f"CAPTURE ffmpeg line: {line}")
-
-                # Check if termination is requested
-                if terminate_flag.is_set():
-                    break
+    # Print the progress string to the console, overwriting the previous line
+    console.print(progress_string.ljust(80), end="\r")
 
-                if "size=" in line:
-                    try:
 
-                        # Parse the output line to extract relevant information
-                        data = parse_output_line(line)
+def capture_output(process: subprocess.Popen, description: str, progress_callback: Optional[Callable[[FFmpegProgress], None]] = None, cancel_event: Optional[threading.Event] = None) -> None:
+    """
+    Function to read the progress blocks of a subprocess and report them.
 
-                        if 'q' in data:
-                            is_end = (float(data.get('q', -1.0)) == -1.0)
-                            size_key = 'Lsize' if is_end else 'size'
-                            byte_size = int(re.findall(r'\d+', data.get(size_key, '0'))[0]) * 1000
-                        else:
-                            byte_size = int(re.findall(r'\d+', data.get('size', '0'))[0]) * 1000
+    Parameters:
+        - process (subprocess.Popen): The subprocess, its stdout carries the `-progress` output.
+        - description (str): Description of the command being executed.
+        - progress_callback (Callable): Called with each FFmpegProgress, defaults to a console line.
+        - cancel_event (threading.Event): Stops reading when set.
+    """
+    parser = FFmpegProgressParser()
 
+    try:
+        for line in iter(process.stdout.readline, ''):
 
-                        # Construct the progress string with formatted output information
-                        progress_string = (f" {description}[white]: "
-                                           f"([green]'speed': [yellow]{data.get('speed', 'N/A')}[white], "
-                                           f"[green]'size': [yellow]{internet_manager.format_file_size(byte_size)}[white])")
-                        max_length = max(max_length, len(progress_string))
+            # Check if termination is requested
+            if cancel_event is not None and cancel_event.is_set():
+                break
 
-                        # Print the progress string to the console, overwriting the previous line
-                        console.print(progress_string.ljust(max_length), end="\r")
+            progress = parser.feed(line)
+            if progress is None:
+                continue
 
-                    except Exception as e:
-                        logging.error(f"Error parsing output line: {line} - {e}")
+            try:
+                if progress_callback is not None:
+                    progress_callback(progress)
+                else:
+                    print_progress(progress, description)
 
             except Exception as e:
-                logging.error(f"Error processing line from subprocess: {e}")
+                logging.error(f"Error in progress callback: {e}")
 
     except Exception as e:
         logging.error(f"Error in capture_output: {e}")
@@ -81,33 +157,19 @@ def capture_output(process: subprocess.Popen, description: str) -> None:
             logging.error(f"Error terminating process: {e}")
 
 
-def parse_output_line(line: str) -> dict:
+def drain_stream(stream, lines: List[str]) -> None:
     """
-    Function to parse the output line and extract relevant information.
+    Collect the lines of a stream, so a full pipe never blocks the subprocess.
 
     Parameters:
-        - line (str): The output line to parse.
-
-    Returns:
-        dict: A dictionary containing parsed information.
+        - stream: Text stream to read.
+        - lines (list): Receives the lines read.
     """
     try:
-        data = {}
-        parts = line.replace("  ", "").replace("= ", "=").split()
-
-        for part in parts:
-            key_value = part.split('=')
-
-            if len(key_value) == 2:
-                key = key_value[0]
-                value = key_value[1]
-                data[key] = value
-
-        return data
-    
+        for line in iter(stream.readline, ''):
+            lines.append(line.rstrip())
     except Exception as e:
-        logging.error(f"Error parsing line: {line} - {e}")
-        return {}
+        logging.error(f"Error reading subprocess stream: {e}")
 
 
 def terminate_process(process):
@@ -124,41 +186,66 @@ def terminate_process(process):
         logging.error(f"Failed to terminate process: {e}")
 
 
-def capture_ffmpeg_real_time(ffmpeg_command: list, description: str) -> None:
+def capture_ffmpeg_real_time(ffmpeg_command: list, description: str, progress_callback: Optional[Callable[[FFmpegProgress], None]] = None, cancel_event: Optional[threading.Event] = None) -> bool:
     """
     Function to capture real-time output from ffmpeg process.
+    FFmpeg writes machine readable progress to stdout (`-progress pipe:1`), the normal statistics are disabled.
 
     Parameters:
         - ffmpeg_command (list): The command to execute ffmpeg.
         - description (str): Description of the command being executed.
+        - progress_callback (Callable): Called with each FFmpegProgress, defaults to a console line.
+        - cancel_event (threading.Event): Kills the process when set, every call gets its own by default.
+
+    Returns:
+        bool: True if ffmpeg exited successfully.
     """
-    global terminate_flag
+    if cancel_event is None:
+        cancel_event = threading.Event()
 
-    # Clear the terminate_flag before starting a new capture
-    terminate_flag.clear()
+    ffmpeg_command = [ffmpeg_command[0], '-progress', 'pipe:1', '-nostats'] + list(ffmpeg_command[1:])
+    stderr_lines: List[str] = []
 
     try:
 
         # Start the ffmpeg process with subprocess.Popen
-        process = subprocess.Popen(ffmpeg_command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+        process = subprocess.Popen(ffmpeg_command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
 
-        # Start a thread to capture and print output
-        output_thread = threading.Thread(target=capture_output, args=(process, description))
+        # Start a thread to capture the progress and one to collect the errors
+        output_thread = threading.Thread(target=capture_output, args=(process, description, progress_callback, cancel_event))
         output_thread.start()
+        stderr_thread = threading.Thread(target=drain_stream, args=(process.stderr, stderr_lines))
+        stderr_thread.daemon = True
+        stderr_thread.start()
 
         try:
-            # Wait for ffmpeg process to complete
-            process.wait()
+            # Wait for ffmpeg process to complete, or for the job to be cancelled
+            while process.poll() is None:
+                if cancel_event.wait(0.2):
+                    logging.info(f"Cancel ffmpeg process: {description}")
+                    terminate_process(process)
+                    break
 
         except KeyboardInterrupt:
             logging.error("Terminating ffmpeg process...")
+            cancel_event.set()
+            terminate_process(process)
 
         except Exception as e:
             logging.error(f"Error in ffmpeg process: {e}")
-            
+            cancel_event.set()
+            terminate_process(process)
+
         finally:
-            terminate_flag.set()
+            # The reader stops at the end of stdout, after the last progress block
             output_thread.join()
+            stderr_thread.join(timeout=5)
+
+        for line in stderr_lines:
+            logging.info(f"CAPTURE ffmpeg line: {line}")
+
+        return process.wait() == 0 and not cancel_event.is_set()
 
     except Exception as e:
-        logging.error(f"Failed to start ffmpeg process: {e}")
\ No newline at end of file
+        logging.error(f"Failed to start ffmpeg process: {e}")
+        return False
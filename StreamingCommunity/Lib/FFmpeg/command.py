@@ -1,9 +1,11 @@
 # 31.01.24
 
+import os
 import sys
 import logging
+import threading
 import subprocess
-from typing import List, Dict, Tuple, Optional
+from typing import Callable, List, Dict, Tuple, Optional
 
 
 # External library
@@ -17,7 +19,7 @@ from StreamingCommunity.Util.os import os_manager, suppress_output, get_ffmpeg_p
 
 # Logic class
 from .util import need_to_force_to_ts, check_duration_v_a
-from .capture import capture_ffmpeg_real_time
+from .capture import capture_ffmpeg_real_time, FFmpegProgress
 from ..M3U8 import M3U8_Codec
 
 
@@ -91,7 +93,51 @@ def select_subtitle_encoder() -> Optional[str]:
     return None
 
 
-def join_video(video_path: str, out_path: str, codec: M3U8_Codec = None):
+def is_transcode(codec: M3U8_Codec = None) -> bool:
+    """
+    Tells whether the join helpers re-encode with the current settings, or only copy the streams.
+    
+    Parameters:
+        - codec (M3U8_Codec): The codec information of the stream.
+    """
+    return USE_GPU or (USE_CODEC and codec is not None)
+
+
+def run_ffmpeg(ffmpeg_cmd: List[str], description: str, progress_callback: Optional[Callable[[FFmpegProgress], None]] = None, cancel_event: Optional[threading.Event] = None) -> bool:
+    """
+    Runs an FFmpeg command built by the join helpers.
+    With a progress_callback the caller owns the display, so nothing is printed and stdout is left alone.
+    
+    Parameters:
+        - ffmpeg_cmd (list[str]): The command to execute.
+        - description (str): Description of the command being executed.
+        - progress_callback (Callable): Receives each FFmpegProgress report, defaults to a console line.
+        - cancel_event (threading.Event): Kills FFmpeg when set.
+
+    Returns:
+        bool: True if FFmpeg exited successfully.
+    """
+    if DEBUG_MODE:
+        subprocess.run(ffmpeg_cmd, check=True)
+        return True
+
+    if progress_callback is not None:
+        return capture_ffmpeg_real_time(ffmpeg_cmd, description, progress_callback, cancel_event)
+
+    if get_use_large_bar():
+        result = capture_ffmpeg_real_time(ffmpeg_cmd, description, cancel_event=cancel_event)
+        print()
+
+    else:
+        console.log(f"[purple]FFmpeg [white][{description}[white]] ...")
+        with suppress_output():
+            result = capture_ffmpeg_real_time(ffmpeg_cmd, description, cancel_event=cancel_event)
+            print()
+
+    return result
+
+
+def join_video(video_path: str, out_path: str, codec: M3U8_Codec = None, progress_callback: Optional[Callable[[FFmpegProgress], None]] = None, cancel_event: Optional[threading.Event] = None):
     """
     Joins single ts video file to mp4
     
@@ -99,6 +145,8 @@ def join_video(video_path: str, out_path: str, codec: M3U8_Codec = None):
         - video_path (str): The path to the video file.
         - out_path (str): The path to save the output file.
         - codec (M3U8_Codec): The video codec to use. Defaults to 'copy'.
+        - progress_callback (Callable): Receives each FFmpegProgress report, defaults to a console line.
+        - cancel_event (threading.Event): Kills FFmpeg when set.
     """
     ffmpeg_cmd = [get_ffmpeg_path()]
 
@@ -153,34 +201,30 @@ def join_video(video_path: str, out_path: str, codec: M3U8_Codec = None):
     ffmpeg_cmd += [out_path, "-y"]
 
     # Run join
-    if DEBUG_MODE:
-        subprocess.run(ffmpeg_cmd, check=True)
-    else:
-
-        if get_use_large_bar():
-            capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join video")
-            print()
-
-        else:
-            console.log(f"[purple]FFmpeg [white][[cyan]Join video[white]] ...")
-            with suppress_output():
-                capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join video")
-                print()
+    run_ffmpeg(ffmpeg_cmd, "[cyan]Join video", progress_callback, cancel_event)
 
     return out_path
 
 
-def join_audios(video_path: str, audio_tracks: List[Dict[str, str]], out_path: str, codec: M3U8_Codec = None):
+def join_all(video_path: str, audio_tracks: List[Dict[str, str]], subtitles_list: List[Dict[str, str]], out_path: str, codec: M3U8_Codec = None, progress_callback: Optional[Callable[[FFmpegProgress], None]] = None, cancel_event: Optional[threading.Event] = None):
     """
-    Joins audio tracks with a video file using FFmpeg.
+    Joins a video file with its audio tracks and subtitles in a single FFmpeg pass.
     
     Parameters:
         - video_path (str): The path to the video file.
-        - audio_tracks (list[dict[str, str]]): A list of dictionaries containing information about audio tracks.
-            Each dictionary should contain the 'path' key with the path to the audio file.
+        - audio_tracks (list[dict[str, str]]): Audio tracks to add, each with the 'path' and 'name' keys.
+        - subtitles_list (list[dict[str, str]]): Subtitles to add, each with the 'path' and 'language' keys.
         - out_path (str): The path to save the output file.
+        - codec (M3U8_Codec): The codec information of the stream.
+        - progress_callback (Callable): Receives each FFmpegProgress report, defaults to a console line.
+        - cancel_event (threading.Event): Kills FFmpeg when set.
     """
-    video_audio_same_duration, duration_diff = check_duration_v_a(video_path, audio_tracks[0].get('path'))
+    for track in audio_tracks + subtitles_list:
+        if not os_manager.check_file(track.get('path')):
+            logging.error(f"Skip join: {track.get('path')} doesn't exist")
+
+    audio_tracks = [track for track in audio_tracks if os_manager.check_file(track.get('path'))]
+    subtitles_list = [subtitle for subtitle in subtitles_list if os_manager.check_file(subtitle.get('path'))]
 
     # Start command with locate ffmpeg
     ffmpeg_cmd = [get_ffmpeg_path()]
@@ -189,26 +233,28 @@ def join_audios(video_path: str, audio_tracks: List[Dict[str, str]], out_path: s
     if USE_GPU:
         ffmpeg_cmd.extend(['-hwaccel', 'cuda'])
 
-    # Insert input video path
+    # Inputs: video, then audio tracks, then subtitles
     ffmpeg_cmd.extend(['-i', video_path])
+    for audio_track in audio_tracks:
+        ffmpeg_cmd.extend(['-i', audio_track['path']])
+    for subtitle in subtitles_list:
+        ffmpeg_cmd.extend(['-i', subtitle['path']])
 
-    # Add audio tracks as input
-    for i, audio_track in enumerate(audio_tracks):
-        if os_manager.check_file(audio_track.get('path')):
-            ffmpeg_cmd.extend(['-i', audio_track.get('path')])
-        else:
-            logging.error(f"Skip audio join: {audio_track.get('path')} dont exist")
+    # Map the video, with its own audio when there are no separate audio tracks
+    ffmpeg_cmd.extend(['-map', '0:v'])
+    if not audio_tracks:
+        ffmpeg_cmd.extend(['-map', '0:a?'])
 
-    # Map the video and audio streams
-    ffmpeg_cmd.append('-map')
-    ffmpeg_cmd.append('0:v')            # Map video stream from the first input (video_path)
-    
-    for i in range(1, len(audio_tracks) + 1):
-        ffmpeg_cmd.append('-map')
-        ffmpeg_cmd.append(f'{i}:a')     # Map audio streams from subsequent inputs
+    for idx, audio_track in enumerate(audio_tracks):
+        ffmpeg_cmd.extend(['-map', f'{idx + 1}:a'])
+        ffmpeg_cmd.extend([f'-metadata:s:a:{idx}', f"language={audio_track['name']}"])
 
-    # Add output Parameters
-    if USE_CODEC:
+    for idx, subtitle in enumerate(subtitles_list):
+        ffmpeg_cmd.extend(['-map', f'{len(audio_tracks) + idx + 1}:s'])
+        ffmpeg_cmd.extend([f'-metadata:s:s:{idx}', f"title={subtitle['language']}"])
+
+    # Add output Parameters, the video is only encoded when separate audio tracks are muxed with it
+    if USE_CODEC and codec is not None and audio_tracks:
         if USE_VCODEC:
             if codec.video_codec_name: 
                 if not USE_GPU: 
@@ -216,7 +262,7 @@ def join_audios(video_path: str, audio_tracks: List[Dict[str, str]], out_path: s
                 else: 
                     ffmpeg_cmd.extend(['-c:v', 'h264_nvenc'])
             else: 
-                console.log("[red]Cant find vcodec for 'join_audios'")
+                console.log("[red]Cant find vcodec for 'join_all'")
         else:
             if USE_GPU:
                 ffmpeg_cmd.extend(['-c:v', 'h264_nvenc'])
@@ -225,15 +271,21 @@ def join_audios(video_path: str, audio_tracks: List[Dict[str, str]], out_path: s
             if codec.audio_codec_name: 
                 ffmpeg_cmd.extend(['-c:a', codec.audio_codec_name])
             else: 
-                console.log("[red]Cant find acodec for 'join_audios'")
+                console.log("[red]Cant find acodec for 'join_all'")
 
         if USE_BITRATE:
             ffmpeg_cmd.extend(['-b:v',  f'{codec.video_bitrate // 1000}k'])
             ffmpeg_cmd.extend(['-b:a',  f'{codec.audio_bitrate // 1000}k'])
 
+    elif USE_CODEC:
+        ffmpeg_cmd.extend(['-c:v', 'copy', '-c:a', 'copy'])
+
     else:
         ffmpeg_cmd.extend(['-c', 'copy'])
 
+    if subtitles_list:
+        ffmpeg_cmd.extend(['-c:s', select_subtitle_encoder()])
+
     # Ultrafast preset always or fast for gpu
     if not USE_GPU:
         ffmpeg_cmd.extend(['-preset', FFMPEG_DEFAULT_PRESET])
@@ -241,81 +293,120 @@ def join_audios(video_path: str, audio_tracks: List[Dict[str, str]], out_path: s
         ffmpeg_cmd.extend(['-preset', 'fast'])
 
     # Use shortest input path for video and audios
-    if not video_audio_same_duration:
-        console.log(f"[red]Use shortest input (Duration difference: {duration_diff:.2f} seconds)...")
-        ffmpeg_cmd.extend(['-shortest', '-strict', 'experimental'])
+    if audio_tracks:
+        video_audio_same_duration, duration_diff = check_duration_v_a(video_path, audio_tracks[0].get('path'))
+        if not video_audio_same_duration:
+            console.log(f"[red]Use shortest input (Duration difference: {duration_diff:.2f} seconds)...")
+            ffmpeg_cmd.extend(['-shortest', '-strict', 'experimental'])
 
     # Overwrite
     ffmpeg_cmd += [out_path, "-y"]
+    logging.info(f"FFmpeg command: {ffmpeg_cmd}")
 
     # Run join
-    if DEBUG_MODE:
-        subprocess.run(ffmpeg_cmd, check=True)
-    else:
-
-        if get_use_large_bar():
-            capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join audio")
-            print()
-
-        else:
-            console.log(f"[purple]FFmpeg [white][[cyan]Join audio[white]] ...")
-            with suppress_output():
-                capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join audio")
-                print()
+    run_ffmpeg(ffmpeg_cmd, "[cyan]Join all", progress_callback, cancel_event)
 
     return out_path
 
 
-def join_subtitle(video_path: str, subtitles_list: List[Dict[str, str]], out_path: str):
+def open_video_pipe(out_path: str, codec: M3U8_Codec = None) -> subprocess.Popen:
     """
-    Joins subtitles with a video file using FFmpeg.
+    Starts an FFmpeg process that remuxes the MPEG-TS data written to its stdin into `out_path`.
+    Segments can be fed while they are downloaded, without an intermediate .ts file.
     
     Parameters:
-        - video (str): The path to the video file.
-        - subtitles_list (list[dict[str, str]]): A list of dictionaries containing information about subtitles.
-            Each dictionary should contain the 'path' key with the path to the subtitle file and the 'name' key with the name of the subtitle.
         - out_path (str): The path to save the output file.
+        - codec (M3U8_Codec): The video codec to use. Defaults to 'copy'.
+
+    Returns:
+        subprocess.Popen: The FFmpeg process, write to its `stdin` and call `close_video_pipe` at the end.
     """
-    ffmpeg_cmd = [get_ffmpeg_path(), "-i", video_path]
+    ffmpeg_cmd = [get_ffmpeg_path(), '-loglevel', 'error', '-nostats']
 
-    # Add subtitle input files first
-    for subtitle in subtitles_list:
-        if os_manager.check_file(subtitle.get('path')):
-            ffmpeg_cmd += ["-i", subtitle['path']]
+    # Enabled the use of gpu
+    if USE_GPU:
+        ffmpeg_cmd.extend(['-hwaccel', 'cuda'])
+
+    # Segments are always MPEG-TS, the input cannot be probed before it arrives
+    ffmpeg_cmd.extend(['-f', 'mpegts', '-i', 'pipe:0'])
+
+    # Add output Parameters
+    if USE_CODEC and codec != None:
+        if USE_VCODEC:
+            if codec.video_codec_name: 
+                if not USE_GPU: 
+                    ffmpeg_cmd.extend(['-c:v', codec.video_codec_name])
+                else: 
+                    ffmpeg_cmd.extend(['-c:v', 'h264_nvenc'])
+            else: 
+                console.log("[red]Cant find vcodec for 'open_video_pipe'")
         else:
-            logging.error(f"Skip subtitle join: {subtitle.get('path')} doesn't exist")
+            if USE_GPU:
+                ffmpeg_cmd.extend(['-c:v', 'h264_nvenc'])
 
-    # Add maps for video and audio streams
-    ffmpeg_cmd += ["-map", "0:v", "-map", "0:a"]
+        if USE_ACODEC:
+            if codec.audio_codec_name: 
+                ffmpeg_cmd.extend(['-c:a', codec.audio_codec_name])
+            else: 
+                console.log("[red]Cant find acodec for 'open_video_pipe'")
 
-    # Add subtitle maps and metadata
-    for idx, subtitle in enumerate(subtitles_list):
-        ffmpeg_cmd += ["-map", f"{idx + 1}:s"]
-        ffmpeg_cmd += ["-metadata:s:s:{}".format(idx), "title={}".format(subtitle['language'])]
+        if USE_BITRATE:
+            ffmpeg_cmd.extend(['-b:v',  f'{codec.video_bitrate // 1000}k'])
+            ffmpeg_cmd.extend(['-b:a',  f'{codec.audio_bitrate // 1000}k'])
 
-    # Add output Parameters
-    if USE_CODEC:
-        ffmpeg_cmd.extend(['-c:v', 'copy', '-c:a', 'copy', '-c:s', select_subtitle_encoder()])
     else:
-        ffmpeg_cmd.extend(['-c', 'copy', '-c:s', select_subtitle_encoder()])
+        ffmpeg_cmd.extend(['-c', 'copy'])
+
+    # Ultrafast preset always or fast for gpu
+    if not USE_GPU:
+        ffmpeg_cmd.extend(['-preset', FFMPEG_DEFAULT_PRESET])
+    else:
+        ffmpeg_cmd.extend(['-preset', 'fast'])
 
     # Overwrite
     ffmpeg_cmd += [out_path, "-y"]
     logging.info(f"FFmpeg command: {ffmpeg_cmd}")
 
-    # Run join
-    if DEBUG_MODE:
-        subprocess.run(ffmpeg_cmd, check=True)
+    # Errors go to a file, a full stderr pipe would block FFmpeg while nobody reads it
+    log_file = open(f"{out_path}.log", "wb")
+    try:
+        process = subprocess.Popen(ffmpeg_cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=log_file)
+    finally:
+        log_file.close()
 
-    else:
-        if get_use_large_bar():
-            capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join subtitle")
-            print()
+    return process
 
-        else:
-            console.log(f"[purple]FFmpeg [white][[cyan]Join subtitle[white]] ...")
-            with suppress_output():
-                capture_ffmpeg_real_time(ffmpeg_cmd, "[cyan]Join subtitle")
-                print()
 
-    return out_path
\ No newline at end of file
+def close_video_pipe(process: subprocess.Popen, out_path: str) -> str:
+    """
+    Closes the stdin of a process started by `open_video_pipe` and waits for FFmpeg to finalize the file.
+    
+    Parameters:
+        - process (subprocess.Popen): The FFmpeg process.
+        - out_path (str): The output path given to `open_video_pipe`.
+
+    Returns:
+        str: The output path.
+    """
+    try:
+        if process.stdin and not process.stdin.closed:
+            process.stdin.close()
+    except BrokenPipeError:
+        pass
+
+    return_code = process.wait()
+
+    log_path = f"{out_path}.log"
+    errors = ""
+    if os.path.exists(log_path):
+        with open(log_path, "r", errors="replace") as f:
+            errors = f.read().strip()
+        os.remove(log_path)
+
+    if return_code != 0:
+        raise RuntimeError(f"FFmpeg pipe exited with code {return_code}: {errors}")
+    
+    if errors:
+        logging.warning(f"FFmpeg pipe: {errors}")
+
+    return out_path
@@ -0,0 +1,158 @@
+# 18.10.26
+
+import os
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from typing import Any, Callable, List, Optional
+
+
+# External library
+from rich.console import Console
+
+
+# Internal utilities
+from StreamingCommunity.Util.config_json import config_manager
+
+
+# Logic class
+from .capture import FFmpegProgress
+
+
+# Config
+MAX_FFMPEG_JOBS = config_manager.get_int('M3U8_CONVERSION', 'max_ffmpeg_jobs')
+
+
+# Variable
+console = Console()
+
+
+class FFmpegJob:
+    def __init__(self, description: str, transcode: bool = False):
+        """
+        One FFmpeg task of the scheduler, with its own progress and cancellation.
+
+        Parameters:
+            - description (str): Name shown in logs, usually the output file.
+            - transcode (bool): True if the job re-encodes, False for a stream copy.
+        """
+        self.description = description
+        self.transcode = transcode
+        self.cancel_event = threading.Event()
+        self.progress: Optional[FFmpegProgress] = None
+        self.future: Optional[Future] = None
+
+    def update_progress(self, progress: FFmpegProgress) -> None:
+        """Progress callback given to the join helpers, keeps the last report."""
+        self.progress = progress
+
+    def cancel(self) -> None:
+        """Drops the job if it is still queued, kills its FFmpeg process if it is running."""
+        self.cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+
+    def is_cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Waits for the job and returns the value of its function, or raises its exception."""
+        return self.future.result(timeout)
+
+
+class FFmpegScheduler:
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_jobs: int = 0):
+        """
+        Runs FFmpeg jobs in the background, so a merge does not block the next download.
+        Stream copies are bound by the disk and can run side by side, a transcode already
+        uses every core, so only a few of them run at the same time.
+
+        Parameters:
+            - max_jobs (int): Jobs running at the same time, 0 to derive it from the core count.
+        """
+        cores = os.cpu_count() or 1
+        self.max_jobs = max_jobs if max_jobs > 0 else max(2, min(4, cores))
+        self.transcode_slots = max(1, min(self.max_jobs, cores // 4))
+
+        self._executor = ThreadPoolExecutor(max_workers=self.max_jobs, thread_name_prefix="ffmpeg-job")
+        self._transcode_semaphore = threading.Semaphore(self.transcode_slots)
+        self._jobs: List[FFmpegJob] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls) -> "FFmpegScheduler":
+        """Returns the scheduler shared by every download."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(MAX_FFMPEG_JOBS)
+            return cls._instance
+
+    def submit(self, func: Callable[..., Any], *args, description: str = "", transcode: bool = False, **kwargs) -> FFmpegJob:
+        """
+        Queues `func(*args, **kwargs, progress_callback=..., cancel_event=...)`.
+        `func` is a join helper, or any function forwarding those two keywords to one.
+
+        Parameters:
+            - func (Callable): The function to run.
+            - description (str): Name shown in logs.
+            - transcode (bool): True if the job re-encodes, see `is_transcode`.
+
+        Returns:
+            FFmpegJob: Handle to follow or cancel the job.
+        """
+        job = FFmpegJob(description, transcode)
+        kwargs['progress_callback'] = job.update_progress
+        kwargs['cancel_event'] = job.cancel_event
+
+        with self._lock:
+            self._jobs = [j for j in self._jobs if not j.done()]
+            self._jobs.append(job)
+
+        job.future = self._executor.submit(self._run, job, func, args, kwargs)
+        logging.info(f"FFmpeg job queued: {description} (transcode: {transcode})")
+        return job
+
+    def _run(self, job: FFmpegJob, func: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        """Runs one job in a worker thread, transcodes wait for a free slot first."""
+        if job.transcode:
+            while not self._transcode_semaphore.acquire(timeout=0.2):
+                if job.is_cancelled():
+                    return None
+
+        try:
+            if job.is_cancelled():
+                return None
+
+            return func(*args, **kwargs)
+
+        except Exception as e:
+            logging.error(f"FFmpeg job {job.description} failed: {e}", exc_info=True)
+            console.print(f"[red]Merge failed: {job.description} ({e})")
+            raise
+
+        finally:
+            if job.transcode:
+                self._transcode_semaphore.release()
+
+    def pending(self) -> List[FFmpegJob]:
+        """Returns the jobs that are queued or running."""
+        with self._lock:
+            return [job for job in self._jobs if not job.done()]
+
+    def wait_all(self, timeout: Optional[float] = None) -> None:
+        """Blocks until every submitted job is finished."""
+        jobs = self.pending()
+        if jobs:
+            console.print(f"[cyan]Waiting for {len(jobs)} FFmpeg job(s) to finish...")
+            wait([job.future for job in jobs], timeout=timeout)
+
+    def cancel_all(self) -> None:
+        """Cancels every queued or running job."""
+        for job in self.pending():
+            job.cancel()
@@ -1,11 +1,12 @@
 # 16.04.24
 
 import os
-import sys
 import json
 import subprocess
 import logging
-from typing import Tuple
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 
 
 # External library
@@ -18,6 +19,60 @@ from StreamingCommunity.Util.os import get_ffprobe_path
 
 # Variable
 console = Console()
+PROBE_CACHE_SIZE = 256
+_probe_cache: "OrderedDict[Tuple[str, int, int], Dict]" = OrderedDict()
+_probe_cache_lock = threading.Lock()
+
+
+def probe_file(file_path: str) -> Optional[Dict]:
+    """
+    Run `ffprobe -show_format -show_streams` once per file and cache the result.
+    The cache key includes size and modification time, so a file rewritten at the same path is probed again.
+
+    Parameters:
+        - file_path (str): Path to the media file.
+
+    Returns:
+        dict: The parsed ffprobe output with the 'format' and 'streams' keys, None if ffprobe fails.
+    """
+    try:
+        file_stat = os.stat(file_path)
+    except OSError as e:
+        logging.error(f"Cannot access file {file_path}: {e}")
+        return None
+
+    key = (os.path.abspath(file_path), file_stat.st_size, file_stat.st_mtime_ns)
+    with _probe_cache_lock:
+        if key in _probe_cache:
+            _probe_cache.move_to_end(key)
+            return _probe_cache[key]
+
+    cmd = [get_ffprobe_path(), '-v', 'error', '-show_format', '-show_streams', '-print_format', 'json', file_path]
+    logging.info(f"Running FFprobe command: {' '.join(cmd)}")
+
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    except Exception as e:
+        logging.error(f"FFprobe execution failed: {e}")
+        return None
+
+    if result.returncode != 0:
+        logging.error(f"FFprobe failed with return code {result.returncode}")
+        logging.error(f"FFprobe stderr: {result.stderr}")
+        return None
+
+    try:
+        info = json.loads(result.stdout)
+    except json.JSONDecodeError as e:
+        logging.error(f"Failed to parse FFprobe output: {e}")
+        return None
+
+    with _probe_cache_lock:
+        _probe_cache[key] = info
+        while len(_probe_cache) > PROBE_CACHE_SIZE:
+            _probe_cache.popitem(last=False)
+
+    return info
 
 
 def has_audio_stream(video_path: str) -> bool:
@@ -30,22 +85,12 @@ def has_audio_stream(video_path: str) -> bool:
     Returns:
         has_audio (bool): True if the input video has an audio stream, False otherwise.
     """
-    try:
-        ffprobe_cmd = [get_ffprobe_path(), '-v', 'error', '-print_format', 'json', '-select_streams', 'a', '-show_streams', video_path]
-        logging.info(f"FFmpeg command: {ffprobe_cmd}")
-
-        with subprocess.Popen(ffprobe_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as proc:
-            stdout, stderr = proc.communicate()
-            if stderr:
-                logging.error(f"Error: {stderr}")
-            else:
-                probe_result = json.loads(stdout)
-                return bool(probe_result.get('streams', []))
-            
-    except Exception as e:
-        logging.error(f"Error: {e}")
+    probe_result = probe_file(video_path)
+    if probe_result is None:
         return False
 
+    return any(stream.get('codec_type') == 'audio' for stream in probe_result.get('streams', []))
+
 
 def get_video_duration(file_path: str) -> float:
     """
@@ -57,31 +102,16 @@ def get_video_duration(file_path: str) -> float:
     Returns:
         (float): The duration of the video in seconds if successful, None if there's an error.
     """
-    try:
-        ffprobe_cmd = [get_ffprobe_path(), '-v', 'error', '-show_format', '-print_format', 'json', file_path]
-        logging.info(f"FFmpeg command: {ffprobe_cmd}")
-
-        # Use a with statement to ensure the subprocess is cleaned up properly
-        with subprocess.Popen(ffprobe_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True) as proc:
-            stdout, stderr = proc.communicate()
-            
-            if proc.returncode != 0:
-                logging.error(f"Error: {stderr}")
-                return None
-            
-            # Parse JSON output
-            probe_result = json.loads(stdout)
-
-            # Extract duration from the video information
-            try:
-                return float(probe_result['format']['duration'])
-            
-            except:
-                return 1
+    probe_result = probe_file(file_path)
+    if probe_result is None:
+        return None
 
-    except Exception as e:
-        logging.error(f"Get video duration error: {e}")
-        sys.exit(0)
+    # Extract duration from the video information
+    try:
+        return float(probe_result['format']['duration'])
+    
+    except:
+        return 1
 
 
 def format_duration(seconds: float) -> Tuple[int, int, int]:
@@ -159,41 +189,15 @@ def get_ffprobe_info(file_path):
         logging.error(f"Cannot access file {file_path}: {e}")
         return None
 
-    try:
-        cmd = [ffprobe_path, '-v', 'error', '-show_format', '-show_streams', '-print_format', 'json', file_path]
-        logging.info(f"Running FFprobe command: {' '.join(cmd)}")
-        
-        # Use subprocess.run instead of Popen for better error handling
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False  # Don't raise exception on non-zero exit
-        )
-
-        if result.returncode != 0:
-            logging.error(f"FFprobe failed with return code {result.returncode}")
-            logging.error(f"FFprobe stderr: {result.stderr}")
-            logging.error(f"FFprobe stdout: {result.stdout}")
-            logging.error(f"Command: {' '.join(cmd)}")
-            logging.error(f"FFprobe path permissions: {oct(os.stat(ffprobe_path).st_mode)}")
-            return None
-
-        # Parse JSON output
-        try:
-            info = json.loads(result.stdout)
-            return {
-                'format_name': info.get('format', {}).get('format_name'),
-                'codec_names': [stream.get('codec_name') for stream in info.get('streams', [])]
-            }
-        except json.JSONDecodeError as e:
-            logging.error(f"Failed to parse FFprobe output: {e}")
-            return None
-
-    except Exception as e:
-        logging.error(f"FFprobe execution failed: {e}")
+    info = probe_file(file_path)
+    if info is None:
         return None
 
+    return {
+        'format_name': info.get('format', {}).get('format_name'),
+        'codec_names': [stream.get('codec_name') for stream in info.get('streams', [])]
+    }
+
 
 def is_png_format_or_codec(file_info):
     """
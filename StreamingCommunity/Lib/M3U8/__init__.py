@@ -1,6 +1,6 @@
 # 02.04.24
 
-from .decryptor import M3U8_Decryption
-from .estimator import M3U8_Ts_Estimator
+from .decryptor import M3U8_Decryption, M3U8_SegmentDecryptor, decrypt_segment
+from .estimator import M3U8_Ts_Estimator, NetworkSpeedSampler
 from .parser import M3U8_Parser, M3U8_Codec
 from .url_fixer import M3U8_UrlFix
\ No newline at end of file
@@ -25,6 +25,77 @@ from Cryptodome.Util.Padding import unpad
 
 
 
+def decrypt_segment(key: bytes, iv: bytes, method: str, sequence: int, ciphertext: bytes) -> bytes:
+    """
+    Decrypt a whole segment. Module level so it can be sent to a process pool.
+
+    Parameters:
+        key (bytes): The encryption key.
+        iv (bytes): The initialization vector (IV), or None to derive it from `sequence`.
+        method (str): The encryption method.
+        sequence (int): Media sequence number of the segment.
+        ciphertext (bytes): The encrypted content.
+
+    Returns:
+        bytes: The decrypted content.
+    """
+    return M3U8_Decryption(key, iv, method).decrypt(ciphertext, sequence)
+
+
+class M3U8_SegmentDecryptor:
+    """
+    Incremental decryption of a single segment, fed with chunks as they arrive from the network.
+    """
+    def __init__(self, cipher, method: str) -> None:
+        """
+        Parameters:
+            cipher: The cipher context of this segment.
+            method (str): The encryption method.
+        """
+        self.cipher = cipher
+        self.padded = method in {"AES", "AES-128"}
+        self.pending = bytearray()
+
+    def update(self, chunk) -> bytes:
+        """
+        Decrypt the whole blocks received so far.
+
+        Parameters:
+            chunk (bytes | memoryview): The next piece of ciphertext.
+
+        Returns:
+            bytes: The plaintext available so far. The last block of padded methods is held back until `finalize`.
+        """
+        if not self.padded:
+            return self.cipher.decrypt(chunk)
+
+        self.pending += chunk
+        size = len(self.pending) - len(self.pending) % AES.block_size
+        if size == len(self.pending):
+            size -= AES.block_size
+        if size <= 0:
+            return b""
+
+        with memoryview(self.pending) as view:
+            decrypted_data = self.cipher.decrypt(view[:size])
+        del self.pending[:size]
+        return decrypted_data
+
+    def finalize(self) -> bytes:
+        """
+        Decrypt the last block and remove the padding.
+
+        Returns:
+            bytes: The remaining plaintext.
+        """
+        if not self.padded or not self.pending:
+            return b""
+
+        decrypted_data = self.cipher.decrypt(bytes(self.pending))
+        self.pending = bytearray()
+        return unpad(decrypted_data, AES.block_size)
+
+
 class M3U8_Decryption:
     """
     Class for decrypting M3U8 playlist content using AES with pycryptodomex.
@@ -35,7 +106,7 @@ class M3U8_Decryption:
 
         Parameters:
             key (bytes): The encryption key.
-            iv (bytes): The initialization vector (IV).
+            iv (bytes): The initialization vector (IV), if None it is derived from the media sequence number of each segment.
             method (str): The encryption method.
         """
         self.key = key
@@ -44,35 +115,63 @@ class M3U8_Decryption:
             self.iv = bytes.fromhex(iv.replace("0x", ""))
         self.method = method
 
-        # Pre-create the cipher based on the encryption method
+        if self.method not in {"AES", "AES-128", "AES-128-CTR"}:
+            raise ValueError("Invalid or unsupported method")
+        
+        # ECB has no state between blocks, one cipher serves every segment
+        self.key_128 = self.key[:16]
+        self.ecb_cipher = AES.new(self.key, AES.MODE_ECB) if self.method == "AES" else None
+
+    def get_iv(self, sequence: int = 0) -> bytes:
+        """
+        Return the IV of a segment: the one declared in EXT-X-KEY, or the media sequence number as a 16 byte big-endian integer.
+        """
+        if self.iv:
+            return self.iv
+        return sequence.to_bytes(16, "big")
+
+    def new_cipher(self, sequence: int = 0):
+        """
+        Create the cipher context of a single segment. CBC and CTR contexts keep state, so each segment needs its own.
+
+        Parameters:
+            sequence (int): Media sequence number of the segment.
+        """
         if self.method == "AES":
-            self.cipher = AES.new(self.key, AES.MODE_ECB)
+            return self.ecb_cipher
         elif self.method == "AES-128":
-            self.cipher = AES.new(self.key[:16], AES.MODE_CBC, iv=self.iv)
-        elif self.method == "AES-128-CTR":
-            self.cipher = AES.new(self.key[:16], AES.MODE_CTR, nonce=self.iv)
+            return AES.new(self.key_128, AES.MODE_CBC, iv=self.get_iv(sequence))
         else:
-            raise ValueError("Invalid or unsupported method")
+            return AES.new(self.key_128, AES.MODE_CTR, nonce=self.get_iv(sequence))
+
+    def segment_decryptor(self, sequence: int = 0) -> M3U8_SegmentDecryptor:
+        """
+        Return a decryptor that works on the chunks of a segment as they are received.
 
-    def decrypt(self, ciphertext: bytes) -> bytes:
+        Parameters:
+            sequence (int): Media sequence number of the segment.
+        """
+        return M3U8_SegmentDecryptor(self.new_cipher(sequence), self.method)
+
+    def decrypt(self, ciphertext: bytes, sequence: int = 0) -> bytes:
         """
         Decrypt the ciphertext using the specified encryption method.
 
         Parameters:
             ciphertext (bytes): The encrypted content to decrypt.
+            sequence (int): Media sequence number of the segment.
 
         Returns:
             bytes: The decrypted content.
         """
         #start = time.perf_counter_ns()
 
+        cipher = self.new_cipher(sequence)
         if self.method in {"AES", "AES-128"}:
-            decrypted_data = self.cipher.decrypt(ciphertext)
+            decrypted_data = cipher.decrypt(ciphertext)
             decrypted_content = unpad(decrypted_data, AES.block_size)
-        elif self.method == "AES-128-CTR":
-            decrypted_content = self.cipher.decrypt(ciphertext)
         else:
-            raise ValueError("Invalid or unsupported method")
+            decrypted_content = cipher.decrypt(ciphertext)
 
         """
         end = time.perf_counter_ns()
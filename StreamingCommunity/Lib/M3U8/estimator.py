@@ -3,7 +3,9 @@
 import time
 import logging
 import threading
+import weakref
 from collections import deque
+from typing import Dict
 
 
 # External libraries
@@ -16,6 +18,121 @@ from StreamingCommunity.Util.color import Colors
 from StreamingCommunity.Util.os import internet_manager
 
 
+# Variable
+EWMA_ALPHA = 0.3            # Weight of the newest throughput sample
+EWMA_SAMPLE_INTERVAL = 0.5  # Minimum seconds between two throughput samples
+SPEED_SAMPLE_INTERVAL = 1.5  # Seconds between two samples of the speed sampler
+
+
+class NetworkSpeedSampler:
+    """
+    Process-wide sampler shared by every estimator.
+
+    A single thread measures the speed of each registered download from its own byte counter,
+    plus the speed of the whole network interface. The thread starts with the first
+    estimator and stops when the last one is released.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, interval: float = SPEED_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.ref_count = 0
+        self.lock = threading.Lock()
+        self.estimators = weakref.WeakSet()
+        self.nic_speed = {"upload": 0.0, "download": 0.0}
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    @classmethod
+    def get_instance(cls) -> "NetworkSpeedSampler":
+        """Return the shared sampler, creating it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def acquire(self, estimator: "M3U8_Ts_Estimator") -> None:
+        """Register an estimator and start the sampling thread if needed."""
+        with self.lock:
+            self.estimators.add(estimator)
+            self.ref_count += 1
+
+            if self._thread is None or not self._thread.is_alive():
+
+                # Each thread gets its own event, a thread stopped but not yet awake must not be revived
+                self._stop_event = threading.Event()
+                self._thread = threading.Thread(target=self._run, args=(self._stop_event,), name="NetworkSpeedSampler")
+                self._thread.daemon = True
+                self._thread.start()
+
+    def release(self, estimator: "M3U8_Ts_Estimator") -> None:
+        """Unregister an estimator, stopping the sampling thread when none is left."""
+        with self.lock:
+            self.estimators.discard(estimator)
+            self.ref_count = max(0, self.ref_count - 1)
+            if self.ref_count > 0:
+                return
+
+            self._stop_event.set()
+            thread, self._thread = self._thread, None
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.interval * 2)
+
+    def stop(self) -> None:
+        """Stop the sampling thread regardless of the registered estimators."""
+        with self.lock:
+            self.estimators = weakref.WeakSet()
+            self.ref_count = 0
+            self._stop_event.set()
+            thread, self._thread = self._thread, None
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.interval * 2)
+
+    def is_running(self) -> bool:
+        """Check if the sampling thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self, stop_event: threading.Event) -> None:
+        """Sample every registered download and the network interface until `stop_event` is set."""
+        last_nic = None
+        last_time = time.monotonic()
+
+        while not stop_event.wait(self.interval):
+            now = time.monotonic()
+            elapsed = max(now - last_time, 1e-6)
+            last_time = now
+
+            try:
+                io_counters = psutil.net_io_counters()
+                if io_counters:
+                    current_nic = (io_counters.bytes_sent, io_counters.bytes_recv)
+                    if last_nic is not None:
+                        self.nic_speed = {
+                            "upload": max(0, current_nic[0] - last_nic[0]) / elapsed,
+                            "download": max(0, current_nic[1] - last_nic[1]) / elapsed
+                        }
+                    last_nic = current_nic
+
+            except Exception as e:
+                logging.error(f"Error in speed capture: {str(e)}")
+
+            self._sample_estimators(elapsed)
+
+    def _sample_estimators(self, elapsed: float) -> None:
+        """Update the speed of every registered download, without keeping them alive between samples."""
+        with self.lock:
+            estimators = list(self.estimators)
+
+        for estimator in estimators:
+            try:
+                estimator.sample_speed(elapsed, self.nic_speed["upload"])
+            except Exception as e:
+                logging.error(f"Error in speed capture: {str(e)}")
+
+
 class M3U8_Ts_Estimator:
     def __init__(self, total_segments: int, segments_instance=None):
         """
@@ -24,87 +141,152 @@ class M3U8_Ts_Estimator:
         Parameters:
             - total_segments (int): Length of total segments to download.
         """
-        self.ts_file_sizes = []
         self.total_segments = total_segments
         self.segments_instance = segments_instance
         self.lock = threading.Lock()
         self.speed = {"upload": "N/A", "download": "N/A"}
-        self._running = True
-        
-        self.speed_thread = threading.Thread(target=self.capture_speed)
-        self.speed_thread.daemon = True
-        self.speed_thread.start()
+
+        # Running totals, updated in O(1) for each segment
+        self.downloaded_bytes = 0
+        self.downloaded_count = 0
+        self.start_time = None
+
+        # Throughput (EWMA)
+        self.bytes_per_second = 0.0
+        self.segments_per_second = 0.0
+        self._sample_time = None
+        self._sample_bytes = 0
+        self._sample_count = 0
+
+        # Postfix formatting is throttled to the tqdm refresh interval
+        self._last_render = 0.0
+
+        # Speed measured by the shared sampler
+        self._speed_buffer = deque(maxlen=3)
+        self._speed_last_bytes = 0
+        self._sampler = NetworkSpeedSampler.get_instance()
+        self._sampler.acquire(self)
+
+    def close(self) -> None:
+        """Release the shared speed sampler."""
+        sampler, self._sampler = self._sampler, None
+        if sampler is not None:
+            sampler.release(self)
 
     def __del__(self):
-        """Ensure thread is properly stopped when the object is destroyed."""
-        self._running = False
+        """Release the sampler if the estimator was not closed explicitly."""
+        try:
+            self.close()
+        except Exception:
+            pass
         
     def add_ts_file(self, size: int):
-        """Add a file size to the list of file sizes."""
+        """Add the size of a downloaded segment to the running totals."""
         if size <= 0:
             logging.error(f"Invalid input values: size={size}")
             return
 
-        self.ts_file_sizes.append(size)
+        now = time.monotonic()
+        with self.lock:
+            if self.start_time is None:
+                self.start_time = now
+                self._sample_time = now
 
-    def capture_speed(self, interval: float = 1.5):
-        """Capture the internet speed periodically with improved efficiency."""
-        last_upload, last_download = 0, 0
-        speed_buffer = deque(maxlen=3)
-        
-        while self._running:
-            try:
-                # Get IO counters only once per loop to reduce function calls
-                io_counters = psutil.net_io_counters()
-                if not io_counters:
-                    raise ValueError("No IO counters available")
-                
-                current_upload, current_download = io_counters.bytes_sent, io_counters.bytes_recv
-                
-                if last_upload and last_download:
-                    upload_speed = (current_upload - last_upload) / interval
-                    download_speed = (current_download - last_download) / interval
-                    
-                    # Only update buffer when we have valid data
-                    if download_speed > 0:
-                        speed_buffer.append(download_speed)
-                    
-                    # Use a more efficient approach for thread synchronization
-                    avg_speed = sum(speed_buffer) / len(speed_buffer) if speed_buffer else 0
-                    formatted_upload = internet_manager.format_transfer_speed(max(0, upload_speed))
-                    formatted_download = internet_manager.format_transfer_speed(avg_speed)
-                    
-                    # Minimize lock time by preparing data outside the lock
-                    with self.lock:
-                        self.speed = {
-                            "upload": formatted_upload,
-                            "download": formatted_download
-                        }
-                
-                last_upload, last_download = current_upload, current_download
-                
-            except Exception as e:
-                if self._running:  # Only log if we're still supposed to be running
-                    logging.error(f"Error in speed capture: {str(e)}")
-                self.speed = {"upload": "N/A", "download": "N/A"}
-            
-            time.sleep(interval)
+            self.downloaded_bytes += size
+            self.downloaded_count += 1
+
+            elapsed = now - self._sample_time
+            if elapsed >= EWMA_SAMPLE_INTERVAL:
+                bytes_rate = (self.downloaded_bytes - self._sample_bytes) / elapsed
+                count_rate = (self.downloaded_count - self._sample_count) / elapsed
+
+                if self.bytes_per_second == 0:
+                    self.bytes_per_second, self.segments_per_second = bytes_rate, count_rate
+                else:
+                    self.bytes_per_second += EWMA_ALPHA * (bytes_rate - self.bytes_per_second)
+                    self.segments_per_second += EWMA_ALPHA * (count_rate - self.segments_per_second)
+
+                self._sample_time = now
+                self._sample_bytes = self.downloaded_bytes
+                self._sample_count = self.downloaded_count
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Return the raw download statistics.
+
+        Returns:
+            dict: Contains
+                - downloaded_bytes (int): Bytes downloaded so far.
+                - downloaded_segments (int): Segments downloaded so far.
+                - total_segments (int): Segments in the playlist.
+                - bytes_per_second (float): Smoothed download throughput.
+                - segments_per_second (float): Smoothed segment rate.
+                - projected_size (float): Expected size of the whole stream, in bytes.
+                - eta (float): Expected seconds to completion, None until a rate is available.
+        """
+        with self.lock:
+            downloaded_bytes = self.downloaded_bytes
+            downloaded_count = self.downloaded_count
+            bytes_per_second = self.bytes_per_second
+            segments_per_second = self.segments_per_second
+
+        projected_size = downloaded_bytes / downloaded_count * self.total_segments if downloaded_count else 0.0
+        remaining_segments = max(0, self.total_segments - downloaded_count)
+
+        eta = None
+        if segments_per_second > 0:
+            eta = remaining_segments / segments_per_second
+        elif remaining_segments == 0:
+            eta = 0.0
+
+        return {
+            'downloaded_bytes': downloaded_bytes,
+            'downloaded_segments': downloaded_count,
+            'total_segments': self.total_segments,
+            'bytes_per_second': bytes_per_second,
+            'segments_per_second': segments_per_second,
+            'projected_size': projected_size,
+            'eta': eta
+        }
+
+    def sample_speed(self, elapsed: float, upload_speed: float = 0.0) -> None:
+        """
+        Update the displayed speed from the bytes downloaded since the previous sample.
+        Called by the shared sampler thread.
+        """
+        with self.lock:
+            downloaded_bytes = self.downloaded_bytes
+
+        download_speed = (downloaded_bytes - self._speed_last_bytes) / elapsed
+        self._speed_last_bytes = downloaded_bytes
+
+        # Only update buffer when we have valid data
+        if download_speed > 0:
+            self._speed_buffer.append(download_speed)
+        avg_speed = sum(self._speed_buffer) / len(self._speed_buffer) if self._speed_buffer else 0
+
+        formatted_upload = internet_manager.format_transfer_speed(max(0, upload_speed))
+        formatted_download = internet_manager.format_transfer_speed(avg_speed)
+
+        with self.lock:
+            self.speed = {
+                "upload": formatted_upload,
+                "download": formatted_download
+            }
 
     def calculate_total_size(self) -> str:
         """
-        Calculate the total size of the files.
+        Calculate the expected size of the stream.
 
         Returns:
-            str: The mean size of the files in a human-readable format.
+            str: The projected total size in a human-readable format.
         """
         try:
-            # Only do calculations if we have data
-            if not self.ts_file_sizes:
+            projected_size = self.get_stats()['projected_size']
+            if projected_size <= 0:
                 return "0 B"
-                
-            total_size = sum(self.ts_file_sizes)
-            mean_size = total_size / len(self.ts_file_sizes)
-            return internet_manager.format_file_size(mean_size)
+
+            return internet_manager.format_file_size(projected_size)
 
         except Exception as e:
             logging.error("An unexpected error occurred: %s", e)
@@ -112,39 +294,33 @@ class M3U8_Ts_Estimator:
     
     def update_progress_bar(self, total_downloaded: int, progress_counter: tqdm) -> None:
         try:
-            self.add_ts_file(total_downloaded * self.total_segments)
-            
+            self.add_ts_file(total_downloaded)
+
+            # Formatting the postfix is only worth doing as often as tqdm redraws
+            now = time.monotonic()
+            with self.lock:
+                if now - self._last_render < getattr(progress_counter, 'mininterval', 0.1):
+                    return
+                self._last_render = now
+
             file_total_size = self.calculate_total_size()
             if file_total_size == "Error":
                 return
                 
-            number_file_total_size = file_total_size.split(' ')[0]
-            units_file_total_size = file_total_size.split(' ')[1]
-            
-            # Reduce lock contention by acquiring data with minimal synchronization
-            retry_count = 0
-            if self.segments_instance:
-                with self.segments_instance.active_retries_lock:
-                    retry_count = self.segments_instance.active_retries
+            number_file_total_size, _, units_file_total_size = file_total_size.partition(' ')
             
             # Get speed data outside of any locks
-            speed_data = ["N/A", ""]
             with self.lock:
                 download_speed = self.speed['download']
             
-            if download_speed != "N/A":
-                speed_data = download_speed.split(" ")
-            
-            average_internet_speed = speed_data[0] if len(speed_data) >= 1 else "N/A"
-            average_internet_unit = speed_data[1] if len(speed_data) >= 2 else ""
+            average_internet_speed, _, average_internet_unit = download_speed.partition(' ')
             
             progress_str = (
                 f"{Colors.GREEN}{number_file_total_size} {Colors.RED}{units_file_total_size}"
                 f"{Colors.WHITE}, {Colors.CYAN}{average_internet_speed} {Colors.RED}{average_internet_unit} "
-                #f"{Colors.WHITE}, {Colors.GREEN}CRR {Colors.RED}{retry_count} "
             )
             
             progress_counter.set_postfix_str(progress_str)
             
         except Exception as e:
-            logging.error(f"Error updating progress bar: {str(e)}")
\ No newline at end of file
+            logging.error(f"Error updating progress bar: {str(e)}")
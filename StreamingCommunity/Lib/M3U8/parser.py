@@ -392,6 +392,7 @@ class M3U8_Parser:
         self._audio: M3U8_Audio = None
         self._subtitle: M3U8_Subtitle = None
         self.duration: float = 0
+        self.media_sequence: int = 0
 
         self.__create_variable__()
 
@@ -403,6 +404,7 @@ class M3U8_Parser:
             - m3u8_content (str): The content of the M3U8 file.
         """
         m3u8_obj = loads(raw_content, uri)
+        self.media_sequence = m3u8_obj.media_sequence or 0
         
         self.__parse_video_info__(m3u8_obj)
         self.__parse_subtitles_and_audio__(m3u8_obj)
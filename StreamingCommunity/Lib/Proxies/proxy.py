@@ -3,6 +3,7 @@
 import sys
 import time
 import signal
+import threading
 import warnings
 warnings.filterwarnings("ignore", category=UserWarning)
 
@@ -26,7 +27,10 @@ class ProxyFinder:
         self.url = url
         self.timeout_threshold = timeout_threshold
         self.shutdown_flag = False
-        signal.signal(signal.SIGINT, self._handle_interrupt)
+
+        # Signal handlers can only be set from the main thread, e.g. not during a global search
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGINT, self._handle_interrupt)
 
     def _test_single_request(self, proxy_info: tuple) -> tuple:
         proxy, source = proxy_info
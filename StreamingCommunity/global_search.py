@@ -6,22 +6,27 @@ import time
 import glob
 import logging
 import importlib
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 
 # External library
-from rich.console import Console
+from rich.console import Console, Group
 from rich.prompt import Prompt
 from rich.table import Table
-from rich.progress import Progress
+from rich.live import Live
+from rich.text import Text
 
 
 # Internal utilities
 from StreamingCommunity.Util.message import start_message
+from StreamingCommunity.Util.config_json import config_manager
 
 
 # Variable
 console = Console()
 msg = Prompt()
+SEARCH_TIMEOUT = config_manager.get_int("REQUESTS", "search_timeout")
 
 
 # !!! DA METTERE IN COMUNE CON QUELLA DI RUN
@@ -92,6 +97,56 @@ def load_search_functions():
 
     return loaded_functions
 
+def search_site(alias: str, func, search_terms: str) -> list:
+    """
+    Search one site on a private list of its MediaManager and copy the results.
+    A search cut off by the deadline keeps running in its thread, it must not change
+    the list used by a later search or download of the same site.
+
+    Parameters:
+        alias (str): Alias of the site, e.g. 'streamingcommunity_search'.
+        func (Callable): The search function of the site.
+        search_terms (str): The terms to search for.
+
+    Returns:
+        list: One dict per media item, with the source of the result.
+    """
+    site_name = alias.split("_")[0].capitalize()
+    media_search_manager = getattr(sys.modules.get(func.__module__), 'media_search_manager', None)
+
+    with media_search_manager.isolated() if media_search_manager is not None else nullcontext():
+        # Call the search function with get_onlyDatabase=True to get database object
+        database = func(search_terms, get_onlyDatabase=True)
+
+        # Check if database has media_list attribute and it's not empty
+        if not database or not hasattr(database, 'media_list'):
+            return []
+
+        items = []
+        for element in database.media_list:
+            # Convert element to dictionary if it's an object
+            if hasattr(element, '__dict__'):
+                item_dict = element.__dict__.copy()
+            else:
+                item_dict = {}  # Fallback for non-object items
+
+            # Add source information
+            item_dict['source'] = site_name
+            item_dict['source_alias'] = alias
+            items.append(item_dict)
+
+        return items
+
+def render_search_status(all_media_items, pending_sites, total_sites):
+    """
+    Build the live view of a running search: the sites still searched and the results received so far.
+    """
+    status = Text(f"Answered {total_sites - len(pending_sites)}/{total_sites} sites", style="cyan")
+    if pending_sites:
+        status.append(f" - waiting for {', '.join(pending_sites)}", style="dim")
+
+    return Group(status, build_results_table(all_media_items))
+
 def global_search(search_terms: str = None, selected_sites: list = None):
     """
     Perform a search across multiple sites based on selection.
@@ -158,50 +213,54 @@ def global_search(search_terms: str = None, selected_sites: list = None):
     # Display progress information
     console.print(f"\n[bold green]Searching for:[/bold green] [yellow]{search_terms}[/yellow]")
     console.print(f"[bold green]Searching across:[/bold green] {len(selected_sites)} sites")
-    
-    with Progress() as progress:
-        search_task = progress.add_task("[cyan]Searching...", total=len(selected_sites))
-        
-        # Search each selected site
-        for alias in selected_sites:
-            site_name = alias.split("_")[0].capitalize()
-            progress.update(search_task, description=f"[cyan]Searching {site_name}...")
-            
-            func, _ = search_functions[alias]
-            try:
-                # Call the search function with get_onlyDatabase=True to get database object
-                database = func(search_terms, get_onlyDatabase=True)
-                
-                # Check if database has media_list attribute and it's not empty
-                if database and hasattr(database, 'media_list') and len(database.media_list) > 0:
-                    # Store media_list items with additional source information
-                    all_results[alias] = []
-                    for element in database.media_list:
-                        # Convert element to dictionary if it's an object
-                        if hasattr(element, '__dict__'):
-                            item_dict = element.__dict__.copy()
-                        else:
-                            item_dict = {}  # Fallback for non-object items
-                        
-                        # Add source information
-                        item_dict['source'] = site_name
-                        item_dict['source_alias'] = alias
-                        all_results[alias].append(item_dict)
-                        
-                    console.print(f"[green]Found {len(database.media_list)} results from {site_name}")
-
-            except Exception as e:
-                console.print(f"[bold red]Error searching {site_name}:[/bold red] {str(e)}")
-            
-            progress.update(search_task, advance=1)
+
+    # Search all selected sites at once, results are shown in the order the sites answer
+    all_media_items = []
+    executor = ThreadPoolExecutor(max_workers=max(1, len(selected_sites)), thread_name_prefix="search")
+    pending = {
+        executor.submit(search_site, alias, search_functions[alias][0], search_terms): alias
+        for alias in selected_sites
+    }
+    deadline = time.time() + SEARCH_TIMEOUT
+
+    def pending_sites():
+        return [alias.split("_")[0].capitalize() for alias in pending.values()]
+
+    try:
+        with Live(render_search_status(all_media_items, pending_sites(), len(selected_sites)), console=console, refresh_per_second=4) as live:
+            while pending:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+
+                done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    alias = pending.pop(future)
+                    site_name = alias.split("_")[0].capitalize()
+
+                    try:
+                        items = future.result()
+                    except Exception as e:
+                        console.print(f"[bold red]Error searching {site_name}:[/bold red] {str(e)}")
+                        continue
+
+                    if items:
+                        all_results[alias] = items
+                        all_media_items.extend(items)
+                        console.print(f"[green]Found {len(items)} results from {site_name}")
+
+                live.update(render_search_status(all_media_items, pending_sites(), len(selected_sites)))
+
+        # Sites that did not answer in time keep running in background, their results are ignored
+        for site_name in pending_sites():
+            console.print(f"[yellow]{site_name} did not answer within {SEARCH_TIMEOUT}s, skipped")
+
+    finally:
+        executor.shutdown(wait=False)
     
     # Display the consolidated results
     if all_results:
-        all_media_items = []
-        for alias, results in all_results.items():
-            for item in results:
-                all_media_items.append(item)
-        
+
         # Display consolidated results
         display_consolidated_results(all_media_items, search_terms)
         
@@ -232,7 +291,18 @@ def display_consolidated_results(all_media_items, search_terms):
     start_message()
 
     console.print(f"\n[bold green]Search results for:[/bold green] [yellow]{search_terms}[/yellow] \n")
-    
+    console.print(build_results_table(all_media_items))
+
+def build_results_table(all_media_items):
+    """
+    Build the table of the media items found, numbered as they are selected.
+
+    Parameters:
+        all_media_items (list): List of media items from all searched sites.
+
+    Returns:
+        Table: The table to print.
+    """
     table = Table(show_header=True, header_style="bold cyan")
     table.add_column("#", style="dim", width=4)
     table.add_column("Title", min_width=20)
@@ -253,7 +323,7 @@ def display_consolidated_results(all_media_items, search_terms):
             str(source),
         )
     
-    console.print(table)
+    return table
 
 def select_from_consolidated_results(all_media_items):
     """
@@ -25,6 +25,7 @@ from StreamingCommunity.Util.os import os_summary, internet_manager
 from StreamingCommunity.Util.logger import Logger
 from StreamingCommunity.Upload.update import update as git_update
 from StreamingCommunity.Lib.TMBD import tmdb
+from StreamingCommunity.Lib.FFmpeg import FFmpegScheduler
 from StreamingCommunity.TelegramHelp.telegram_bot import get_bot_instance, TelegramSession
 
 
@@ -51,8 +52,21 @@ def run_function(func: Callable[..., None], close_console: bool = False, search_
     if close_console:
         while 1:
             func(search_terms)
+            wait_background_merges()
     else:
         func(search_terms)
+        wait_background_merges()
+
+
+def wait_background_merges() -> None:
+    """Waits for the merges queued with 'merge_in_background', cancels them on Ctrl+C."""
+    scheduler = FFmpegScheduler.get_instance()
+    try:
+        scheduler.wait_all()
+    except KeyboardInterrupt:
+        console.print("[red]Cancelling background merges...")
+        scheduler.cancel_all()
+        raise
 
 
 # !!! DA METTERE IN COMUNE CON QUELLA DI GLOBAL
@@ -0,0 +1,195 @@
+# 18.10.26
+
+# Fix import
+import sys
+import os
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(src_path)
+sys.path.append(os.path.dirname(__file__))
+
+
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+
+
+# External library
+import psutil
+
+
+# Import
+from StreamingCommunity.Lib.Downloader.HLS import segments as hls_segments
+from StreamingCommunity.Lib.Downloader.MP4 import downloader as mp4_downloader
+from StreamingCommunity.Lib.Downloader import HLS_Downloader, MP4_downloader
+from origin_server import OriginConfig, OriginServer
+
+
+"""
+Offline download benchmark: starts the local origin of origin_server.py and reports, for each scenario,
+MB/s, segments/s, CPU time, peak RSS and peak thread count of this process.
+
+    python Test/Download/benchmark.py --scenario plain aes --engine thread async --workers 4 16
+"""
+
+
+HLS_SCENARIOS = ("plain", "aes", "slow", "flaky")
+SCENARIOS = HLS_SCENARIOS + ("master", "mp4")
+
+
+class ResourceSampler:
+    def __init__(self, interval: float = 0.05):
+        """Samples RSS and thread count of the current process in the background."""
+        self.process = psutil.Process()
+        self.interval = interval
+        self.peak_rss = 0
+        self.peak_threads = 0
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self.stop_event.is_set():
+            self.peak_rss = max(self.peak_rss, self.process.memory_info().rss)
+            self.peak_threads = max(self.peak_threads, self.process.num_threads())
+            self.stop_event.wait(self.interval)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop_event.set()
+        self.thread.join()
+
+
+def run_segments(url: str, tmp_dir: str) -> dict:
+    """Downloads one media playlist with M3U8_Segments."""
+    downloader = hls_segments.M3U8_Segments(url=url, tmp_folder=tmp_dir)
+    result = downloader.download_streams("Bench", "video")
+
+    return {
+        'bytes': os.path.getsize(os.path.join(tmp_dir, "0.ts")),
+        'segments': len(downloader.segments),
+        'failed': result['nFailed']
+    }
+
+
+def run_hls(url: str, tmp_dir: str) -> dict:
+    """Downloads a master playlist with HLS_Downloader, the merge needs FFmpeg."""
+    result = HLS_Downloader(m3u8_url=url, output_path=os.path.join(tmp_dir, "master.mp4")).start()
+    if result['error'] is not None:
+        raise RuntimeError(result['error'])
+
+    return {'bytes': os.path.getsize(result['path']), 'segments': 0, 'failed': 0}
+
+
+def run_mp4(url: str, tmp_dir: str) -> dict:
+    """Downloads the large file with MP4_downloader."""
+    path = os.path.join(tmp_dir, "file.mp4")
+    MP4_downloader(url=url, path=path)
+
+    # The final panel probes the duration with FFprobe, the file is what matters here
+    if not os.path.exists(path):
+        raise RuntimeError("MP4 download failed")
+
+    return {'bytes': os.path.getsize(path), 'segments': 0, 'failed': 0}
+
+
+def measure(func, url: str) -> dict:
+    """Runs one download in a fresh temporary folder and collects its figures."""
+    tmp_dir = tempfile.mkdtemp(prefix="sc_bench_")
+    process = psutil.Process()
+
+    try:
+        cpu_start = process.cpu_times()
+        start = time.perf_counter()
+
+        with ResourceSampler() as sampler:
+            stats = func(url, tmp_dir)
+
+        elapsed = time.perf_counter() - start
+        cpu_end = process.cpu_times()
+
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    stats.update({
+        'elapsed': elapsed,
+        'cpu': (cpu_end.user - cpu_start.user) + (cpu_end.system - cpu_start.system),
+        'rss': sampler.peak_rss,
+        'threads': sampler.peak_threads
+    })
+    return stats
+
+
+def configure(engine: str, workers: int, adaptive: bool) -> None:
+    """Overrides the settings read from config.json for one run."""
+    hls_segments.DOWNLOAD_ENGINE = engine
+    hls_segments.ADAPTIVE_WORKERS = adaptive
+    hls_segments.DEFAULT_VIDEO_WORKERS = workers
+    hls_segments.DEFAULT_AUDIO_WORKERS = workers
+    hls_segments.RESUME_DOWNLOAD = False
+    mp4_downloader.MP4_CONNECTIONS = workers
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the downloaders against a local origin")
+    parser.add_argument("--scenario", nargs="+", choices=SCENARIOS + ("all",), default=["plain", "aes", "mp4"])
+    parser.add_argument("--engine", nargs="+", choices=("thread", "async"), default=["thread"])
+    parser.add_argument("--workers", nargs="+", type=int, default=[8], help="Segment workers, or connections for mp4")
+    parser.add_argument("--adaptive", nargs="+", choices=("on", "off"), default=["off"], help="Adaptive segment workers")
+    parser.add_argument("--segments", type=int, default=100, help="Segments of each playlist")
+    parser.add_argument("--segment-size", type=int, default=1024 * 1024, help="Size of each segment in bytes")
+    parser.add_argument("--delay", type=float, default=0.2, help="Latency of the slow segments in seconds")
+    parser.add_argument("--mp4-size", type=int, default=256 * 1024 * 1024, help="Size of the MP4 file in bytes")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs of each combination, the best one is reported")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    scenarios = SCENARIOS if "all" in args.scenario else tuple(args.scenario)
+    config = OriginConfig(
+        segments=args.segments,
+        segment_size=args.segment_size,
+        delay=args.delay,
+        mp4_size=args.mp4_size if "mp4" in scenarios else 0
+    )
+
+    rows = []
+    with OriginServer(config, args.port) as origin:
+        for scenario in scenarios:
+            if scenario in HLS_SCENARIOS:
+                func, url, engines = run_segments, f"{origin.base_url}/{scenario}/index.m3u8", args.engine
+            elif scenario == "master":
+                func, url, engines = run_hls, f"{origin.base_url}/master.m3u8", args.engine
+            else:
+                func, url, engines = run_mp4, f"{origin.base_url}/file.mp4", ["-"]
+
+            for engine in engines:
+                for workers in args.workers:
+                    for adaptive in (args.adaptive if engine != "-" else ["-"]):
+                        configure(engine if engine != "-" else "thread", workers, adaptive == "on")
+
+                        runs = []
+                        for _ in range(args.repeat):
+                            try:
+                                runs.append(measure(func, url))
+                            except Exception as e:
+                                print(f"{scenario} {engine} {workers} {adaptive}: {e}")
+
+                        if runs:
+                            rows.append((scenario, engine, workers, adaptive, min(runs, key=lambda r: r['elapsed'])))
+
+    print()
+    print(f"{'scenario':<8} {'engine':<7} {'workers':>7} {'adapt':>5} {'MB/s':>9} {'seg/s':>8} {'CPU s':>7} {'CPU s/GB':>9} {'RSS MB':>8} {'threads':>7} {'failed':>6}")
+    for scenario, engine, workers, adaptive, r in rows:
+        mb = r['bytes'] / (1024 * 1024)
+        print(
+            f"{scenario:<8} {engine:<7} {workers:>7} {adaptive:>5} {mb / r['elapsed']:>9.1f} "
+            f"{(r['segments'] / r['elapsed']) if r['segments'] else 0:>8.1f} {r['cpu']:>7.2f} "
+            f"{r['cpu'] / (mb / 1024) if mb else 0:>9.2f} {r['rss'] / (1024 * 1024):>8.1f} {r['threads']:>7} {r['failed']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# 18.10.26
+
+# Fix import
+import sys
+import os
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(src_path)
+
+
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+
+# External library
+from Cryptodome.Cipher import AES
+from Cryptodome.Util.Padding import pad
+
+
+# Import
+from StreamingCommunity.Lib.M3U8 import M3U8_Decryption, decrypt_segment
+
+
+def build_segments(count: int, size: int, key: bytes):
+    """Encrypt `count` random segments with the IV derived from their sequence number."""
+    segments = []
+    for sequence in range(count):
+        data = os.urandom(size)
+        cipher = AES.new(key, AES.MODE_CBC, iv=sequence.to_bytes(16, "big"))
+        segments.append(cipher.encrypt(pad(data, AES.block_size)))
+    return segments
+
+
+def run(mode: str, segments: list, key: bytes, workers: int) -> float:
+    """
+    Decrypt all segments from `workers` download threads, as M3U8_Segments does.
+    Returns the throughput in MB/s.
+    """
+    decryption = M3U8_Decryption(key, None, "AES-128")
+    pool = None
+    if mode == "thread":
+        pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    elif mode == "process":
+        pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+
+    def worker(sequence: int) -> int:
+        ciphertext = segments[sequence]
+        if pool is None:
+            return len(decryption.decrypt(ciphertext, sequence))
+        return len(pool.submit(decrypt_segment, key, None, "AES-128", sequence, ciphertext).result())
+
+    # Warm up the pool so process start-up is not measured
+    if pool is not None:
+        worker(0)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        total_bytes = sum(executor.map(worker, range(len(segments))))
+    elapsed = time.perf_counter() - start
+
+    if pool is not None:
+        pool.shutdown()
+
+    return total_bytes / elapsed / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the decryption_pool modes of M3U8_DOWNLOAD")
+    parser.add_argument("--segments", type=int, default=200, help="Number of segments")
+    parser.add_argument("--size", type=int, default=2 * 1024 * 1024, help="Size of each segment in bytes")
+    parser.add_argument("--workers", type=int, default=12, help="Download workers decrypting at the same time")
+    args = parser.parse_args()
+
+    key = os.urandom(16)
+    segments = build_segments(args.segments, args.size, key)
+
+    print(f"{args.segments} segments of {args.size / (1024 * 1024):.2f} MB, {args.workers} workers, {os.cpu_count()} cores")
+    for mode in ("none", "thread", "process"):
+        print(f"{mode:>8}: {run(mode, segments, key, args.workers):.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+# 18.10.26
+
+import os
+import re
+import sys
+import time
+import threading
+import multiprocessing
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+
+# External library
+from Cryptodome.Cipher import AES
+from Cryptodome.Util.Padding import pad
+
+
+"""
+Local origin for the download benchmarks, it serves:
+    - /plain/index.m3u8       plain MPEG-TS segments
+    - /aes/index.m3u8         the same segments encrypted with AES-128, IV from the media sequence
+    - /slow/index.m3u8        plain segments answered after `delay` seconds
+    - /flaky/index.m3u8       every `fail_every`-th segment fails with 503 every other request
+    - /master.m3u8            master playlist: /plain video, ita and eng audio, ita subtitles
+    - /file.mp4               `mp4_size` bytes, with byte range support
+"""
+
+
+KEY = bytes(range(16))
+MEDIA_SEQUENCE = 0
+
+
+class OriginConfig:
+    def __init__(self, segments: int = 100, segment_size: int = 1024 * 1024, segment_duration: float = 4.0, delay: float = 0.2, fail_every: int = 5, mp4_size: int = 256 * 1024 * 1024):
+        """
+        Parameters:
+            - segments (int): Segments of each media playlist.
+            - segment_size (int): Size of each segment in bytes.
+            - segment_duration (float): EXTINF of each segment.
+            - delay (float): Latency of the /slow segments, in seconds.
+            - fail_every (int): Period of the failing /flaky segments.
+            - mp4_size (int): Size of /file.mp4 in bytes.
+        """
+        self.segments = segments
+        self.segment_size = segment_size
+        self.segment_duration = segment_duration
+        self.delay = delay
+        self.fail_every = fail_every
+        self.mp4_size = mp4_size
+
+
+def media_playlist(config: OriginConfig, key: bool = False) -> str:
+    lines = ["#EXTM3U", "#EXT-X-VERSION:3", f"#EXT-X-TARGETDURATION:{int(config.segment_duration + 1)}", f"#EXT-X-MEDIA-SEQUENCE:{MEDIA_SEQUENCE}"]
+    if key:
+        lines.append('#EXT-X-KEY:METHOD=AES-128,URI="key.bin"')
+
+    for index in range(config.segments):
+        lines.append(f"#EXTINF:{config.segment_duration:.3f},")
+        lines.append(f"seg{index}.ts")
+
+    lines.append("#EXT-X-ENDLIST")
+    return "\n".join(lines) + "\n"
+
+
+def subtitle_playlist(config: OriginConfig, base_url: str) -> str:
+    duration = config.segments * config.segment_duration
+    return "\n".join([
+        "#EXTM3U", "#EXT-X-VERSION:3", f"#EXT-X-TARGETDURATION:{int(duration) + 1}", "#EXT-X-MEDIA-SEQUENCE:0",
+        f"#EXTINF:{duration:.3f},", f"{base_url}/subs/ita/subs.vtt", "#EXT-X-ENDLIST"
+    ]) + "\n"
+
+
+def master_playlist(base_url: str) -> str:
+    return "\n".join([
+        "#EXTM3U",
+        f'#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="aud",LANGUAGE="ita",NAME="Italian",DEFAULT=YES,AUTOSELECT=YES,URI="{base_url}/audio/ita/index.m3u8"',
+        f'#EXT-X-MEDIA:TYPE=AUDIO,GROUP-ID="aud",LANGUAGE="eng",NAME="English",DEFAULT=NO,AUTOSELECT=YES,URI="{base_url}/audio/eng/index.m3u8"',
+        f'#EXT-X-MEDIA:TYPE=SUBTITLES,GROUP-ID="subs",LANGUAGE="ita",NAME="Italian",DEFAULT=NO,AUTOSELECT=YES,URI="{base_url}/subs/ita/index.m3u8"',
+        '#EXT-X-STREAM-INF:BANDWIDTH=2000000,RESOLUTION=1920x1080,CODECS="avc1.640028,mp4a.40.2",AUDIO="aud",SUBTITLES="subs"',
+        f"{base_url}/plain/index.m3u8",
+    ]) + "\n"
+
+
+VTT = "WEBVTT\n\n00:00:01.000 --> 00:00:03.000\nBenchmark\n"
+
+
+class OriginHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config: OriginConfig = None
+    base_segment: bytes = b""
+    mp4_data: bytes = b""
+    encrypted = {}
+    attempts = {}
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, body, status: int = 200, content_type: str = "application/octet-stream", headers: dict = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _segment(self, index: int) -> bytes:
+        """Every segment is the same random block, stamped with its index."""
+        return index.to_bytes(8, "big") + self.base_segment[8:]
+
+    def _encrypted_segment(self, index: int) -> bytes:
+        with self.lock:
+            if index not in self.encrypted:
+                iv = (MEDIA_SEQUENCE + index).to_bytes(16, "big")
+                self.encrypted[index] = AES.new(KEY, AES.MODE_CBC, iv=iv).encrypt(pad(self._segment(index), AES.block_size))
+            return self.encrypted[index]
+
+    def _serve_mp4(self):
+        size = len(self.mp4_data)
+        match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        if not match:
+            return self._send(memoryview(self.mp4_data), headers={"Accept-Ranges": "bytes"}, content_type="video/mp4")
+
+        start = int(match.group(1))
+        end = min(int(match.group(2)) if match.group(2) else size - 1, size - 1)
+        self._send(memoryview(self.mp4_data)[start:end + 1], status=206, content_type="video/mp4", headers={
+            "Accept-Ranges": "bytes",
+            "Content-Range": f"bytes {start}-{end}/{size}"
+        })
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        config = self.config
+
+        # Playlists point to absolute URLs, as the ones of the sites
+        base_url = f"http://{self.headers.get('Host')}"
+
+        if path == "/master.m3u8":
+            return self._send(master_playlist(base_url).encode(), content_type="application/vnd.apple.mpegurl")
+        if path == "/file.mp4":
+            return self._serve_mp4()
+        if path == "/aes/key.bin":
+            return self._send(KEY)
+        if path == "/subs/ita/index.m3u8":
+            return self._send(subtitle_playlist(config, base_url).encode(), content_type="application/vnd.apple.mpegurl")
+        if path == "/subs/ita/subs.vtt":
+            return self._send(VTT.encode(), content_type="text/vtt")
+
+        match = re.match(r"^/(plain|aes|slow|flaky|audio/\w+)/(index\.m3u8|seg(\d+)\.ts)$", path)
+        if not match:
+            return self._send(b"Not found", status=404)
+
+        kind, name, index = match.group(1), match.group(2), match.group(3)
+        if name == "index.m3u8":
+            return self._send(media_playlist(config, key=(kind == "aes")).encode(), content_type="application/vnd.apple.mpegurl")
+
+        index = int(index)
+        if index >= config.segments:
+            return self._send(b"Not found", status=404)
+
+        if kind == "slow":
+            time.sleep(config.delay)
+
+        if kind == "flaky" and config.fail_every and index % config.fail_every == 0:
+            with self.lock:
+                self.attempts[index] = self.attempts.get(index, 0) + 1
+                failing = self.attempts[index] % 2 == 1
+            if failing:
+                return self._send(b"Unavailable", status=503)
+
+        body = self._encrypted_segment(index) if kind == "aes" else self._segment(index)
+        self._send(body, content_type="video/mp2t")
+
+
+def serve(port: int, config: OriginConfig, ready) -> None:
+    """Entry point of the server process."""
+    OriginHandler.config = config
+    OriginHandler.base_segment = os.urandom(config.segment_size)
+    OriginHandler.mp4_data = os.urandom(config.mp4_size) if config.mp4_size else b""
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), OriginHandler)
+    server.daemon_threads = True
+    ready.set()
+    server.serve_forever()
+
+
+class OriginServer:
+    def __init__(self, config: OriginConfig, port: int = 8765):
+        """
+        Runs the origin in a separate process, so its CPU time and threads are not counted
+        with the ones of the downloader.
+        """
+        self.config = config
+        self.port = port
+        self.process = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self):
+        ready = multiprocessing.Event()
+        self.process = multiprocessing.Process(target=serve, args=(self.port, self.config, ready), daemon=True)
+        self.process.start()
+
+        deadline = time.time() + 60
+        while not ready.wait(0.2):
+            if not self.process.is_alive() or time.time() > deadline:
+                raise RuntimeError(f"Origin server did not start on port {self.port}")
+        return self
+
+    def __exit__(self, *exc):
+        self.process.terminate()
+        self.process.join(5)
+
+
+if __name__ == "__main__":
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8765
+    print(f"Serving on http://127.0.0.1:{port} (Ctrl+C to stop)")
+    serve(port, OriginConfig(), threading.Event())
@@ -0,0 +1,80 @@
+# 18.10.26
+
+# Fix import
+import sys
+import os
+src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.append(src_path)
+
+
+# Import
+import timeit
+import inspect
+from StreamingCommunity.Api.Template.config_loader import SiteConstant, get_site_constant
+
+
+"""
+Microbenchmark of SiteConstant: the site name found with inspect.stack() (the previous lookup),
+with the frame walk kept for the shared `site_constant`, and bound once with get_site_constant.
+SITE_NAME and MOVIE_FOLDER are read from a function compiled as if it was in Api/Site/raiplay/__init__.py,
+under `depth` extra frames as during a search or a download.
+
+    python Test/Util/siteConstant.py
+"""
+
+
+SITE_INIT = os.path.join(src_path, "StreamingCommunity", "Api", "Site", "raiplay", "__init__.py")
+
+
+def inspect_site_name():
+    """The lookup used before, it reads the source context of every frame."""
+    for frame_info in inspect.stack():
+        file_path = frame_info.filename
+
+        if "__init__" in file_path:
+            parts = file_path.split(f"Site{os.sep}")
+
+            if len(parts) > 1:
+                return parts[1].split(os.sep)[0]
+
+    return None
+
+
+class InspectSiteConstant(SiteConstant):
+    @property
+    def SITE_NAME(self):
+        return inspect_site_name()
+
+
+def site_function(constant):
+    """Returns a function that reads two properties of `constant`, with the file name of a site package."""
+    namespace = {'constant': constant}
+    exec(compile("def read():\n    return constant.SITE_NAME, constant.MOVIE_FOLDER\n", SITE_INIT, "exec"), namespace)
+    return namespace['read']
+
+
+def nested(func, depth: int):
+    """Calls `func` under `depth` frames."""
+    if depth == 0:
+        return func()
+    return nested(func, depth - 1)
+
+
+def main():
+    depth = 30
+    number = 2000
+    cases = [
+        ("inspect.stack()", InspectSiteConstant()),
+        ("frame walk", SiteConstant()),
+        ("bound", get_site_constant("StreamingCommunity.Api.Site.raiplay.site"))
+    ]
+
+    print(f"{'lookup':<16} {'us/read':>10}   SITE_NAME, MOVIE_FOLDER")
+    for name, constant in cases:
+        read = site_function(constant)
+        seconds = min(timeit.repeat(lambda: nested(read, depth), number=number, repeat=3))
+        print(f"{name:<16} {seconds / number * 1e6:>10.1f}   {nested(read, depth)}")
+
+
+if __name__ == "__main__":
+    main()